@@ -12,7 +12,10 @@ from route_events_service import (
 )
 from route_events_service.photo.client import SurveyPhotoStorage
 from bm_photo_client import BMPhotoClient
-from route_events import LRSRoute
+from route_events import LRSRouteCache
+from route_events.utils import ddb_session
+from route_events.bridge.inventory import BridgeInventory
+from route_events.schema import schema_registry
 import json
 import os
 from dotenv import load_dotenv
@@ -85,10 +88,42 @@ class DataValidation:
             f"oracle+oracledb://{MISC_USER}:{MISC_PWD}@{HOST}:1521/geodbbm"
         )
         self.lrs_host = LRS_HOST
+        self.lrs_geometry_version = os.getenv("LRS_GEOMETRY_VERSION")
+        self.lrs_cache = LRSRouteCache(
+            max_vertices=int(os.getenv("LRS_CACHE_MAX_VERTICES", 2_000_000)),
+            ttl=int(os.getenv("LRS_CACHE_TTL", 600)),
+        )
+
+        # Load DuckDB extensions once, before the first request.
+        self.ddb_session = ddb_session().warm_up()
+
+        # Compile the bridge inventory schema once, before the first request.
+        BridgeInventory.warm_up()
+        self.schema_registry = schema_registry()
 
         self.bm_photo_base_url = BM_PHOTO_BASE_URL
         self.bm_photo_api_key = BM_PHOTO_API_KEY
 
+    def get_lrs(self, route: str):
+        """
+        Get LRSRoute object from the LRS cache or GRPC service.
+        """
+        return self.lrs_cache.get(
+            self.lrs_host, route, geometry_version=self.lrs_geometry_version
+        )
+
+    @app.get("/lrs/cache")
+    def lrs_cache_stats(self):
+        return self.lrs_cache.stats()
+
+    @app.get("/ddb/session")
+    def ddb_session_stats(self):
+        return self.ddb_session.stats()
+
+    @app.get("/schema/registry")
+    def schema_registry_stats(self):
+        return self.schema_registry.stats()
+
     @app.post("/bridge/master_validation")
     def validate_bridgemaster_data(
         self, payload: BridgeValidationPayload, write: bool = False
@@ -198,7 +233,7 @@ class DataValidation:
         ignore_force: bool = False,
         ignore_review: bool = False,
     ):
-        lrs = LRSRoute.from_feature_service(self.lrs_host, payload.input_json.routes[0])
+        lrs = self.get_lrs(payload.input_json.routes[0])
 
         check = RouteRNIValidation.validate_excel(
             excel_path=payload.input_json.file_name,
@@ -234,7 +269,7 @@ class DataValidation:
         ignore_force: bool = False,
         ignore_review: bool = False,
     ):
-        lrs = LRSRoute.from_feature_service(self.lrs_host, payload.input_json.routes[0])
+        lrs = self.get_lrs(payload.input_json.routes[0])
 
         check = RouteRoughnessValidation.validate_excel(
             excel_path=payload.input_json.file_name,
@@ -269,7 +304,7 @@ class DataValidation:
         ignore_force: bool = False,
         ignore_review: bool = False,
     ):
-        lrs = LRSRoute.from_feature_service(self.lrs_host, payload.input_json.routes[0])
+        lrs = self.get_lrs(payload.input_json.routes[0])
 
         photo_client = BMPhotoClient(
             base_url=self.bm_photo_base_url, api_key=self.bm_photo_api_key
@@ -319,7 +354,7 @@ class DataValidation:
         ignore_force: bool = False,
         ignore_review: bool = False,
     ):
-        lrs = LRSRoute.from_feature_service(self.lrs_host, payload.input_json.routes[0])
+        lrs = self.get_lrs(payload.input_json.routes[0])
 
         check = RoutePCIValidation.validate_excel(
             excel_path=payload.input_json.file_name,
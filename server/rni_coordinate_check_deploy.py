@@ -7,6 +7,7 @@ from fastapi import FastAPI
 from sqlalchemy import create_engine
 import os
 from dotenv import load_dotenv
+from typing import List
 
 
 app = FastAPI()
@@ -27,6 +28,16 @@ class RNICoordinateValidation:
     @app.post('/rni_rerun/')
     def validate_rni_coordinate(self, route: str):
         lrs = LRSRoute.from_feature_service('localhost:50052', route)
+        self._validate(route, lrs)
+
+    @app.post('/rni_rerun_batch')
+    def validate_rni_coordinate_batch(self, routes: List[str]):
+        lrs_routes = LRSRoute.from_feature_service_many('localhost:50052', routes)
+
+        for route in routes:
+            self._validate(route, lrs_routes.get(route))
+
+    def _validate(self, route: str, lrs: LRSRoute):
         events = self.repo.get_by_linkid(route)
         results = ValidationResult(route)
 
@@ -53,6 +64,5 @@ class RNICoordinateValidation:
                 f'C:/Users/hazin/Projects/bm-route-events/scratch/rni_rerun/verified/{route}.csv'
                 )
 
-
 if __name__ == '__main__':
     serve.run(RNICoordinateValidation.bind(), route_prefix='/bm')
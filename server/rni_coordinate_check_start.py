@@ -11,25 +11,27 @@ HOST = os.getenv('DB_HOST')
 SMD_USER = os.getenv('SMD_USER')
 SMD_PWD = os.getenv('SMD_PWD')
 
-async def fetch(session, url, route):
+BATCH_SIZE = 50  # Number of routes validated in a single request, sharing one LRS request
+
+
+async def fetch(session, url, routes):
     try:
-        async with session.post(url, params={'route': route}) as response:
-            return  (response.status, route)
+        async with session.post(url, json=routes) as response:
+            return  (response.status, routes)
     except Exception as e:
-        return f"Error route {route}"
+        return f"Error route {routes}"
     
 async def submit_requests():
     engine = create_engine(f"oracle+oracledb://{SMD_USER}:{SMD_PWD}@{HOST}:1521/geodbbm")
     routes = engine.connect().execute(text('select distinct(linkid) from rni_2_2024'))
 
     tasks = []
-    url = 'http://localhost:8000/bm/rni_rerun'
+    url = 'http://localhost:8000/bm/rni_rerun_batch'
+    routes = [route[0] for route in routes.fetchall()]
     
     async with aiohttp.ClientSession() as session:
-        for route in routes.fetchall():
-            # print(route[0])
-
-            task = asyncio.create_task(fetch(session, url, route=route[0]))
+        for i in range(0, len(routes), BATCH_SIZE):
+            task = asyncio.create_task(fetch(session, url, routes=routes[i:i+BATCH_SIZE]))
             tasks.append(task)
 
             if len(tasks) > 7:
@@ -19,5 +19,6 @@ from .points import(
     RouteFWD,
     RouteFWDRepo,
 )
-from .route import LRSRoute
-from .photo import SurveyPhoto
\ No newline at end of file
+from .route import LRSRoute, LRSRouteCache, LRSSnapshotStore
+from .photo import SurveyPhoto
+from .workbook import SurveyWorkbook
@@ -9,17 +9,52 @@ from ...inventory import (
 )
 from ....geometry import Point, LAMBERT_WKT
 from .schema import InventoryProfileSchema
+from ..structure.models import structure_model, parent_context
 import polars as pl
-from typing import List, Literal, Optional
+from typing import List, Literal
 from pydantic import Field, AliasChoices
 import json
-import duckdb
+from functools import lru_cache
+from ....utils.ddb import ddb_cursor
 
 
 POPUP_STATE = "POPUP"
 DETAILED_STATE = "DETAIL"
 
 
+@lru_cache(maxsize=None)
+def invij_popup_input_model(profile_model, sups_model):
+    """
+    Popup INVIJ input model, created once for every schema model.
+    """
+    class InvModel(profile_model):
+        BANGUNAN_ATAS: List[structure_model(sups_model)] = Field(
+            validation_alias=AliasChoices("BANGUNAN_ATAS", "bangunan_atas")
+        )
+        INVENTORY_STATE: str = POPUP_STATE  # The data state
+
+    return InvModel
+
+
+@lru_cache(maxsize=None)
+def invij_input_model(profile_model, sups_model, subs_model, element_model):
+    """
+    Detailed INVIJ input model, created once for every schema model.
+    """
+    class InvModel(profile_model):
+        BANGUNAN_ATAS: List[structure_model(sups_model, element_model)] = Field(
+            validation_alias=AliasChoices("BANGUNAN_ATAS", "bangunan_atas")
+        )
+        BANGUNAN_BAWAH: List[structure_model(subs_model, element_model)] = Field(
+            validation_alias=AliasChoices("BANGUNAN_BAWAH", "bangunan_bawah")
+        )
+        MODE: Literal["INSERT", "UPDATE", "RETIRE", "insert", "update", "retire"]
+        INVENTORY_STATE: str = DETAILED_STATE  # The data state
+        VAL_HISTORY: List
+
+    return InvModel
+
+
 from ....schema import RouteEventsSchema
 import os
 
@@ -47,19 +82,14 @@ class BridgeInventory(object):
             by_alias=True
         )
 
-        # Pydantic validation models
-        class SupsModel(sups_schema.model):
-            BRIDGE_ID: str = str(profile_data["BRIDGE_ID"]).upper()
-            INV_YEAR: int = profile_data["INV_YEAR"]
-
-        class InvModel(profile_schema.model):
-            BANGUNAN_ATAS: List[SupsModel] = Field(
-                validation_alias=AliasChoices("BANGUNAN_ATAS", "bangunan_atas")
-            )
-            INVENTORY_STATE: str = POPUP_STATE  # The data state
+        # Pydantic validation model
+        InvModel = invij_popup_input_model(profile_schema.model, sups_schema.model)
 
         # Pydantic validation start
-        invij_model = InvModel.model_validate(data)
+        invij_model = InvModel.model_validate(
+            data,
+            context=parent_context(profile_data["BRIDGE_ID"], profile_data["INV_YEAR"])
+        )
 
         profile_data = invij_model.model_dump(
             exclude=[sups_key, "MODE", "VAL_HISTORY"], by_alias=True
@@ -96,34 +126,13 @@ class BridgeInventory(object):
             by_alias=True
         )
 
-        # Pydantic validation models
-        class ElementModel(element_schema.model):
-            L4: Optional[List] = Field(validation_alias=AliasChoices("l4", "L4"))
-
-        class SubsModel(subs_schema.model):
-            BRIDGE_ID: str = str(profile_data["BRIDGE_ID"]).upper()
-            INV_YEAR: int = profile_data["INV_YEAR"]
-            ELEMEN: List[ElementModel] = Field(
-                validation_alias=AliasChoices("elemen", "ELEMEN")
-            )
-
-        class SupsModel(sups_schema.model):
-            BRIDGE_ID: str = str(profile_data["BRIDGE_ID"]).upper()
-            INV_YEAR: int = profile_data["INV_YEAR"]
-            ELEMEN: List[ElementModel] = Field(
-                validation_alias=AliasChoices("elemen", "ELEMEN")
-            )
-
-        class InvModel(profile_schema.model):
-            BANGUNAN_ATAS: List[SupsModel] = Field(
-                validation_alias=AliasChoices("BANGUNAN_ATAS", "bangunan_atas")
-            )
-            BANGUNAN_BAWAH: List[SubsModel] = Field(
-                validation_alias=AliasChoices("BANGUNAN_BAWAH", "bangunan_bawah")
-            )
-            MODE: Literal["INSERT", "UPDATE", "RETIRE", "insert", "update", "retire"]
-            INVENTORY_STATE: str = DETAILED_STATE  # The data state
-            VAL_HISTORY: List
+        # Pydantic validation model
+        InvModel = invij_input_model(
+            profile_schema.model,
+            sups_schema.model,
+            subs_schema.model,
+            element_schema.model
+        )
 
         data = json.loads(
             json.dumps(data)
@@ -134,7 +143,10 @@ class BridgeInventory(object):
         )  # Upper case model
 
         # Pydantic validation start
-        invij_model = InvModel.model_validate(data)  # Load as a model
+        invij_model = InvModel.model_validate(
+            data,
+            context=parent_context(profile_data["BRIDGE_ID"], profile_data["INV_YEAR"])
+        )  # Load as a model
         profile_data = invij_model.model_dump(
             exclude=["BANGUNAN_ATAS", "BANGUNAN_BAWAH", "MODE", "VAL_HISTORY"],
             by_alias=True,
@@ -167,6 +179,27 @@ class BridgeInventory(object):
 
         return inv
 
+    @classmethod
+    def warm_up(cls, ignore_review_err=(False, True)):
+        """
+        Compile the inventory schema and the INVIJ input models before the first request.
+        """
+        for ignore in ignore_review_err:
+            invij_popup_input_model(
+                InventoryProfileSchema(ignore, popup=True).model,
+                SuperstructureSchema(ignore, popup=True).model
+            )
+            invij_input_model(
+                InventoryProfileSchema(ignore).model,
+                SuperstructureSchema(ignore).model,
+                SubstructureSchema(ignore).model,
+                ElementSchema(ignore).model
+            )
+            structure_model(SuperstructureOnlySchema(ignore).model)
+            SupsOnlyProfileSchema(ignore)
+
+        return cls
+
     def __init__(self, inv_data: pa.Table, state: str = None):
         # Columns name
         self._bridge_id_col = "BRIDGE_ID"
@@ -190,7 +223,7 @@ class BridgeInventory(object):
             self._state = state
 
         # DuckDB Session
-        self.ddb = duckdb.connect()
+        self.ddb = ddb_cursor(('spatial',))
 
         # Only proceed if the state is VALIDASI VERIFIKASI or DETAILED_STATE
         if len(self.artable) != 0 and (str(self._state) in ['VALIDASI VERIFIKASI', 'DETAILED_STATE']):
@@ -356,14 +389,11 @@ class BridgeInventory(object):
             )
 
         # 2. Validate partial superstructure
-        sups_schema = SuperstructureOnlySchema(ignore_review_err)
-
-        class SupsModel(sups_schema.model):
-            BRIDGE_ID: str = str(bridge_id).upper()
-            INV_YEAR: int = existing_inv.inv_year
+        sups_model = structure_model(SuperstructureOnlySchema(ignore_review_err).model)
+        context = parent_context(bridge_id, existing_inv.inv_year)
 
         sups_data = [
-            SupsModel.model_validate(_data).model_dump(by_alias=True)
+            sups_model.model_validate(_data, context=context).model_dump(by_alias=True)
             for _data in data.get("BANGUNAN_ATAS", [])
         ]
 
@@ -0,0 +1,58 @@
+from pydantic import BaseModel, Field, AliasChoices, ValidationInfo, model_validator
+from functools import lru_cache
+from typing import List, Optional, Type, Any
+
+
+# Parent keys of the bridge structure, filled from the validation context.
+PARENT_KEYS = ('BRIDGE_ID', 'INV_YEAR')
+
+
+def parent_context(bridge_id: str, inv_year: int) -> dict:
+    """
+    Validation context for the structure model, containing the parent BRIDGE_ID and INV_YEAR.
+    """
+    return {'BRIDGE_ID': str(bridge_id).upper(), 'INV_YEAR': inv_year}
+
+
+@lru_cache(maxsize=None)
+def element_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    Structure element model, with the L4 element list.
+    """
+    class ElementModel(model):
+        L4: Optional[List] = Field(validation_alias=AliasChoices("l4", "L4"))
+
+    return ElementModel
+
+
+@lru_cache(maxsize=None)
+def structure_model(model: Type[BaseModel], element: Type[BaseModel] = None) -> Type[BaseModel]:
+    """
+    Superstructure or substructure model. BRIDGE_ID and INV_YEAR which do not exist in the input are filled
+    from the validation context (see parent_context). If element model is given, then the structure has ELEMEN list.
+    The model is only created once for every schema model.
+    """
+    class StructureModel(model):
+        BRIDGE_ID: str
+        INV_YEAR: int
+
+        @model_validator(mode='before')
+        @classmethod
+        def fill_parent_keys(cls, data: Any, info: ValidationInfo):
+            if isinstance(data, dict) and info.context:
+                return {
+                    **{key: info.context[key] for key in PARENT_KEYS if key in info.context},
+                    **data
+                }
+
+            return data
+
+    if element is None:
+        return StructureModel
+
+    class StructureElementModel(StructureModel):
+        ELEMEN: List[element_model(element)] = Field(
+            validation_alias=AliasChoices("elemen", "ELEMEN")
+        )
+
+    return StructureElementModel
@@ -1,9 +1,23 @@
 import pyarrow as pa
 import polars as pl
-from typing import List, Optional, Annotated
-from pydantic import TypeAdapter, Field, AliasChoices, ConfigDict, StringConstraints
+from typing import List, Annotated
+from pydantic import TypeAdapter, ConfigDict, StringConstraints
 from .subs_schema import SubstructureSchema
 from ..element import StructureElement, ElementSchema
+from ..models import structure_model, parent_context
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _subs_model(model):
+    """
+    Substructure model with uppercase BRIDGE_ID.
+    """
+    class SubsModel(model):
+        BRIDGE_ID: Annotated[str, StringConstraints(to_upper=True)]
+        INV_YEAR: int
+
+    return SubsModel
 
 
 class Substructure(object):
@@ -19,22 +33,10 @@ class Substructure(object):
         Create Substructure object from INVIJ JSON format.
         """
         if validate:
-            subs_schema = SubstructureSchema()
-            element_schema = ElementSchema()
-
-            class ElementModel(element_schema.model):
-                L4: Optional[List] = Field(
-                    validation_alias=AliasChoices('l4', 'L4')
-                )
-
-            class SubsModel(subs_schema.model):
-                BRIDGE_ID: str = str(bridge_id).upper()
-                INV_YEAR: int = inv_year
-                ELEMEN: List[ElementModel] = Field(
-                    validation_alias=AliasChoices('elemen', 'ELEMEN')
-                )
-
-            data = [SubsModel.model_validate(_data).model_dump(by_alias=True) for _data in data]
+            subs_model = structure_model(SubstructureSchema().model, ElementSchema().model)
+            context = parent_context(bridge_id, inv_year)
+
+            data = [subs_model.model_validate(_data, context=context).model_dump(by_alias=True) for _data in data]
             df = pl.DataFrame(data).drop(['ELEMEN'])
         else:
             df = pl.DataFrame(data).rename(str.upper).drop(['ELEMEN'])
@@ -73,13 +75,7 @@ class Substructure(object):
         self._abt_status_col = 'STATUS'
 
         if validate:
-            subs_schema = SubstructureSchema()
-
-            class SubsModel(subs_schema.model):
-                BRIDGE_ID: Annotated[str, StringConstraints(to_upper=True)]
-                INV_YEAR: int
-
-            ta = TypeAdapter(List[SubsModel])
+            ta = TypeAdapter(List[_subs_model(SubstructureSchema().model)])
             ta.validate_python(pl.DataFrame(data).rows(named=True))
 
         # Arrow Table
@@ -3,9 +3,10 @@ from ..substructure import Substructure, SubstructureSchema
 from ..element import StructureElement, ElementSchema
 from .sups_schema import SuperstructureSchema
 from .sups_only_schema import SuperstructureOnlySchema
+from ..models import structure_model, parent_context
 import polars as pl
-from pydantic import AliasChoices, Field, TypeAdapter
-from typing import List, Optional, Literal
+from pydantic import TypeAdapter
+from typing import List, Literal
 import json
 
 
@@ -16,14 +17,11 @@ class Superstructure(object):
         Create Superstructure object from INVIJ JSON format, with only initializing the superstructure.
         """
         if validate:
-            sups_schema = SuperstructureSchema()
-
-            class SupsModel(sups_schema.model):
-                BRIDGE_ID: str = str(bridge_id).upper()
-                INV_YEAR: int = inv_year
+            sups_model = structure_model(SuperstructureSchema().model)
+            context = parent_context(bridge_id, inv_year)
 
             spans_data = [
-                SupsModel.model_validate(_data).model_dump(by_alias=True)
+                sups_model.model_validate(_data, context=context).model_dump(by_alias=True)
                 for _data in data
             ]
         else:
@@ -46,14 +44,11 @@ class Superstructure(object):
         Create Superstructure object from partial INVIJ JSON format.
         """
         if validate:
-            sups_schema = SuperstructureOnlySchema()
-
-            class SupsModel(sups_schema.model):
-                BRIDGE_ID: str = str(bridge_id).upper()
-                INV_YEAR: int = inv_year
+            sups_model = structure_model(SuperstructureOnlySchema().model)
+            context = parent_context(bridge_id, inv_year)
 
             spans_data = [
-                SupsModel.model_validate(_data).model_dump(by_alias=True)
+                sups_model.model_validate(_data, context=context).model_dump(by_alias=True)
                 for _data in data
             ]
         else:
@@ -99,21 +94,11 @@ class Superstructure(object):
         Create Superstructure object from INVIJ JSON format.
         """
         if validate:
-            sups_schema = SuperstructureSchema()
-            element_schema = ElementSchema()
-
-            class ElementModel(element_schema.model):
-                L4: Optional[List] = Field(validation_alias=AliasChoices("l4", "L4"))
-
-            class SupsModel(sups_schema.model):
-                BRIDGE_ID: str = str(bridge_id).upper()
-                INV_YEAR: int = inv_year
-                ELEMEN: List[ElementModel] = Field(
-                    validation_alias=AliasChoices("elemen", "ELEMEN")
-                )
+            sups_model = structure_model(SuperstructureSchema().model, ElementSchema().model)
+            context = parent_context(bridge_id, inv_year)
 
             spans_data = [
-                SupsModel.model_validate(_data).model_dump(by_alias=True)
+                sups_model.model_validate(_data, context=context).model_dump(by_alias=True)
                 for _data in data
             ]
         else:
@@ -150,13 +135,7 @@ class Superstructure(object):
 
     def __init__(self, data: pa.Table, validate=True):
         if validate:
-            sups_schema = SuperstructureSchema()
-
-            class SupsModel(sups_schema.model):
-                BRIDGE_ID: str
-                INV_YEAR: int
-
-            ta = TypeAdapter(List[SupsModel])
+            ta = TypeAdapter(List[structure_model(SuperstructureSchema().model)])
             ta.validate_python(pl.from_arrow(data).rows(named=True))
 
         # Default columns name
@@ -1,7 +1,7 @@
 import pyarrow as pa
 import pyarrow.compute as pc
 import json
-import duckdb
+from ...utils.ddb import ddb_cursor
 import polars as pl
 from datetime import datetime, timedelta
 from .schema import BridgeMasterSchema
@@ -85,7 +85,7 @@ class BridgeMaster(object):
         self._bridge_len_col = 'BRIDGE_LENGTH'
 
         # DuckDB Session
-        self.ddb = duckdb.connect()
+        self.ddb = ddb_cursor(('spatial',))
 
         # Geometry
         self._point_4326 = Point(
@@ -1,5 +1,6 @@
-import duckdb
 from route_events.geometry import LAMBERT_WKT
+from ..utils.ddb import ddb_cursor
+from .projection import transform_coordinates
 import copy
 import pyarrow as pa
 import polars as pl
@@ -16,7 +17,7 @@ class Point(object):
         self.origin_wkt = wkt
 
         if ddb is None:
-            self.dconn = duckdb.connect()
+            self.dconn = ddb_cursor(('spatial',))  # Cursor with spatial extension loaded
         else:
             self.dconn = ddb
 
@@ -24,7 +25,6 @@ class Point(object):
         self._pt_col = 'point'
         self._lon = 'long'
         self._lat = 'lat'
-        self.dconn.sql("install spatial; load spatial;")  # Load spatial extension
 
     @property
     def _pt(self):
@@ -54,9 +54,15 @@ class Point(object):
         """
         Transform coordinate to target WKT.
         """
-        transformed = self._transform(target_wkt, invert).fetchall()
-        X = transformed[0][0]
-        Y = transformed[0][1]
+        native = transform_coordinates(self.Y, self.X, self.origin_wkt, target_wkt)
+
+        if native is None:
+            transformed = self._transform(target_wkt, invert).fetchall()
+            X = transformed[0][0]
+            Y = transformed[0][1]
+        else:
+            X = float(native[0])
+            Y = float(native[1])
 
         if not invert:
             return Point(X, Y, target_wkt, ddb=self.dconn)
@@ -119,14 +125,14 @@ class Points(Point):
         """
         Model of multiple point geometry
         """
+        if ddb is None:
+            ddb = ddb_cursor(('spatial', 'h3'))  # Cursor with spatial and H3 index extension loaded
+
         super().__init__(long=long_col, lat=lat_col, wkt=wkt, ddb=ddb)
         self._rows = data
         self.__pt = 'points_table'
         self._ids = ids_column
 
-        # Load H3 index extension
-        self.dconn.sql("install h3 from community; load h3;")
-
         self.dconn.sql(
             f"""
             create TEMP TABLE {self.__pt} as 
@@ -182,14 +188,29 @@ class Points(Point):
         """
         Transform coordinates to target WKT.
         """
-        df = self._transform(target_wkt, invert).pl().select(
-            self._ids + [self._lon, self._lat]
-        ).rename(
-            {
-                self._lon: self.X, 
-                self._lat: self.Y
-            }
+        rows = self._rows if isinstance(self._rows, pl.DataFrame) else pl.from_arrow(self._rows)
+        native = transform_coordinates(
+            rows[self.Y].cast(pl.Float64).to_numpy(),
+            rows[self.X].cast(pl.Float64).to_numpy(),
+            self.origin_wkt,
+            target_wkt
         )
+
+        if native is None:
+            df = self._transform(target_wkt, invert).pl().select(
+                self._ids + [self._lon, self._lat]
+            ).rename(
+                {
+                    self._lon: self.X, 
+                    self._lat: self.Y
+                }
+            )
+        else:
+            df = rows.select(self._ids + [self.X, self.Y]).with_columns(
+                pl.Series(self.X, native[0], nan_to_null=True),
+                pl.Series(self.Y, native[1], nan_to_null=True)
+            )
+
         if invert:
             return Points(df, long_col=self.Y, lat_col=self.X, wkt=LAMBERT_WKT,
                           ids_column=self._ids)
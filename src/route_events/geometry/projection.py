@@ -0,0 +1,149 @@
+import numpy as np
+import re
+from typing import Tuple
+
+
+class LambertConformalConic(object):
+    """
+    Lambert Conformal Conic (2 standard parallels) projection on ellipsoid, applied on NumPy arrays.
+    """
+    @classmethod
+    def from_wkt(cls, wkt: str):
+        """
+        Create projection from ESRI WKT PROJCS string.
+        """
+        if 'PROJECTION["Lambert_Conformal_Conic"]' not in wkt:
+            raise ValueError("WKT is not a Lambert Conformal Conic projection.")
+
+        spheroid = re.search(r'SPHEROID\["[^"]*",([-\d.]+),([-\d.]+)\]', wkt)
+        params = {
+            name.lower(): float(value) for name, value in
+            re.findall(r'PARAMETER\["([^"]+)",([-\d.]+)\]', wkt)
+        }
+
+        return cls(
+            a=float(spheroid.group(1)),
+            inv_f=float(spheroid.group(2)),
+            central_meridian=params['central_meridian'],
+            standard_parallel_1=params['standard_parallel_1'],
+            standard_parallel_2=params['standard_parallel_2'],
+            latitude_of_origin=params['latitude_of_origin'],
+            false_easting=params['false_easting'],
+            false_northing=params['false_northing']
+        )
+
+    def __init__(
+            self,
+            a: float,
+            inv_f: float,
+            central_meridian: float,
+            standard_parallel_1: float,
+            standard_parallel_2: float,
+            latitude_of_origin: float,
+            false_easting: float = 0,
+            false_northing: float = 0
+    ):
+        # Follows PROJ lcc operation order, so the result is identical to PROJ (DuckDB ST_Transform).
+        f = 1/inv_f
+        self.a = a
+        self.es = 2*f - f**2
+        self.e = np.sqrt(self.es)
+        self.lon_0 = np.radians(central_meridian)
+        self.fe = false_easting
+        self.fn = false_northing
+
+        lat_1 = np.radians(standard_parallel_1)
+        lat_2 = np.radians(standard_parallel_2)
+        lat_0 = np.radians(latitude_of_origin)
+
+        m_1 = self._msfn(np.sin(lat_1), np.cos(lat_1))
+        t_1 = self._tsfn(lat_1, np.sin(lat_1))
+
+        if np.isclose(lat_1, lat_2):
+            self.n = np.sin(lat_1)
+        else:
+            self.n = np.log(m_1/self._msfn(np.sin(lat_2), np.cos(lat_2)))
+            self.n /= np.log(t_1/self._tsfn(lat_2, np.sin(lat_2)))
+
+        self.c = m_1*np.pow(t_1, -self.n)/self.n
+
+        if np.isclose(np.abs(lat_0), np.pi/2):
+            self.rho_0 = 0.0
+        else:
+            self.rho_0 = self.c*np.pow(self._tsfn(lat_0, np.sin(lat_0)), self.n)
+
+    def _msfn(self, sin_lat, cos_lat):
+        return cos_lat/np.sqrt(1. - sin_lat*sin_lat*self.es)
+
+    def _tsfn(self, lat, sin_lat):
+        return np.tan(.5*(np.pi/2 - lat))/np.pow((1. - sin_lat*self.e)/(1. + sin_lat*self.e), .5*self.e)
+
+    def forward(self, lon: np.ndarray, lat: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Project longitude and latitude (in degrees) into easting and northing.
+        """
+        lon = np.radians(np.asarray(lon, dtype=np.float64)) - self.lon_0
+        lat = np.radians(np.asarray(lat, dtype=np.float64))
+
+        rho = self.c*np.pow(self._tsfn(lat, np.sin(lat)), self.n)
+        theta = lon*self.n
+
+        x = rho*np.sin(theta)
+        y = self.rho_0 - rho*np.cos(theta)
+
+        return self.a*x + self.fe, self.a*y + self.fn
+
+    def inverse(self, x: np.ndarray, y: np.ndarray, tolerance: float = 1e-10, max_iter: int = 15) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Unproject easting and northing into longitude and latitude (in degrees).
+        """
+        x = (np.asarray(x, dtype=np.float64) - self.fe)*(1/self.a)
+        y = self.rho_0 - (np.asarray(y, dtype=np.float64) - self.fn)*(1/self.a)
+
+        rho = np.hypot(x, y)
+
+        if self.n < 0:
+            rho, x, y = -rho, -x, -y
+
+        ts = np.pow(rho/self.c, 1/self.n)
+        lon = np.arctan2(x, y)/self.n + self.lon_0
+
+        # Latitude is solved iteratively, every coordinate stops at its own convergence.
+        lat = np.pi/2 - 2*np.arctan(ts)
+        active = np.ones(lat.shape, dtype=bool)
+
+        for _ in range(max_iter):
+            e_sin_lat = self.e*np.sin(lat)
+            dlat = np.pi/2 - 2*np.arctan(ts*np.pow((1. - e_sin_lat)/(1. + e_sin_lat), .5*self.e)) - lat
+            lat = np.where(active, lat + dlat, lat)
+            active = active & (np.abs(dlat) > tolerance)
+
+            if not np.any(active):
+                break
+
+        return np.degrees(lon), np.degrees(lat)
+
+
+# Bina Marga Lambert projection
+from . import LAMBERT_WKT
+
+LAMBERT = LambertConformalConic.from_wkt(LAMBERT_WKT)
+
+
+def transform_coordinates(
+        st_x: np.ndarray,
+        st_y: np.ndarray,
+        source_wkt: str,
+        target_wkt: str
+) -> Tuple[np.ndarray, np.ndarray] | None:
+    """
+    Transform coordinates between EPSG:4326 and LAMBERT WKT, following DuckDB ST_Transform axis order
+    (EPSG:4326 coordinates is in latitude, longitude order). Return None if the transformation is not supported.
+    """
+    if (source_wkt == 'EPSG:4326') and (target_wkt == LAMBERT_WKT):
+        return LAMBERT.forward(lon=st_y, lat=st_x)
+    elif (source_wkt == LAMBERT_WKT) and (target_wkt == 'EPSG:4326'):
+        lon, lat = LAMBERT.inverse(st_x, st_y)
+        return lat, lon
+    else:
+        return None
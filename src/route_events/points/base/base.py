@@ -3,6 +3,8 @@ from typing import Literal, Union
 import polars as pl
 from ...geometry import Points, LAMBERT_WKT
 from ...segments.base.utils import to_meter
+from ...schema.engine import ERROR_SCHEMA
+from ...utils.memo import df_cached_property
 
 
 class RoutePointEvents(object):
@@ -13,7 +15,8 @@ class RoutePointEvents(object):
             data_year: int = None,
             data_semester: Literal[1,2] = None,
             sta_unit: str = 'dm',
-            lane_data: bool = False
+            lane_data: bool = False,
+            review_errors: pl.DataFrame = None
     ):
         # Default columns
         self._linkid_col = 'LINKID'
@@ -35,6 +38,7 @@ class RoutePointEvents(object):
         self._data_year = data_year
         self._data_semester = data_semester
         self._route_id = route
+        self._review_errors = review_errors
 
         # Geometry
         self._points_4326 = None
@@ -56,12 +60,43 @@ class RoutePointEvents(object):
         """
         return self._route_id
 
+    @property
+    def review_errors(self) -> pl.DataFrame:
+        """
+        Review errors (row, column, type and msg) collected while parsing the input data.
+        """
+        if self._review_errors is None:
+            return pl.DataFrame(schema=ERROR_SCHEMA)
+
+        return self._review_errors
+
     @property
     def pl_df(self) -> pl.DataFrame:
         """
         Events data in Polars DataFrame.
         """
         return self._pl_df
+
+    @pl_df.setter
+    def pl_df(self, df: pl.DataFrame):
+        self._pl_df = df
+        self.artable = df.to_arrow()
+        self._points_4326 = None
+        self._points_lambert = None
+
+    @df_cached_property
+    def stats(self) -> dict:
+        """
+        Events statistics (row count, min/max STA), computed in a single select on first access and recomputed
+        when the events data is replaced.
+        """
+        exprs = dict(row_count=pl.len())
+
+        if self._sta_col in self.pl_df.columns:
+            exprs['min_sta'] = pl.col(self._sta_col).min()
+            exprs['max_sta'] = pl.col(self._sta_col).max()
+
+        return self.pl_df.select(**exprs).row(0, named=True)
     
     @property
     def ldf(self) -> pl.LazyFrame:
@@ -159,14 +194,14 @@ class RoutePointEvents(object):
         """
         Maximum STA number
         """
-        return self.pl_df[self._sta_col].max()
+        return self.stats['max_sta']
     
     @property
     def min_sta(self) -> Union[int, float]:
         """
         Minimum STA number
         """
-        return self.pl_df[self._sta_col].min()
+        return self.stats['min_sta']
     
     @property
     def sta_unit(self) -> str:
@@ -3,8 +3,6 @@ import os
 from ...schema import RouteEventsSchema
 from ...segments.rni import surface_types
 import polars as pl
-from pydantic import TypeAdapter
-from typing import List
 
 
 class RouteDefects(RoutePointEvents):
@@ -18,6 +16,7 @@ class RouteDefects(RoutePointEvents):
         linkid: str | list = 'ALL',
         linkid_col: str = 'LINKID',
         ignore_review: bool = False,
+        collect_review: bool = False,
         data_year: int = None,
         photo_url_col: str = 'PHOTO_ID'
     ):
@@ -39,23 +38,19 @@ class RouteDefects(RoutePointEvents):
             ignore_review_err=ignore_review
         )
 
-        df_str = pl.read_excel(
+        def read(excel_path: str) -> pl.DataFrame:
+            return schema.read_excel(excel_path).with_columns(
+                pl.col(pl.String).exclude(photo_url_col).str.to_uppercase()
+            )
+
+        # Validate and cast into typed DataFrame
+        df, review_errors = schema.parse_excel(
             excel_path,
-            engine='calamine',
-            infer_schema_length=None
-        ).rename(
-            str.upper
-        ).cast(
-            pl.String
-        ).with_columns(
-            pl.col(pl.String).exclude(photo_url_col).str.to_uppercase()
+            read,
+            collect_review=collect_review,
+            cache_options=(photo_url_col,)
         )
-
-        ta = TypeAdapter(List[schema.model])
-        df = pl.DataFrame(
-            ta.validate_python(df_str.to_dicts()),
-            infer_schema_length=None
-        ).filter(
+        df = df.filter(
             route_filter
         )
 
@@ -63,7 +58,8 @@ class RouteDefects(RoutePointEvents):
             artable=df.to_arrow(),
             route=linkid,
             data_year=data_year,
-            lane_data=True
+            lane_data=True,
+            review_errors=review_errors
         )
     
     def __init__(self, *args, **kwargs):
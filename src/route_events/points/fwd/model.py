@@ -3,8 +3,8 @@ import os
 from ...schema import RouteEventsSchema
 from ...segments.rni import surface_types
 import polars as pl
-from pydantic import BaseModel, TypeAdapter
-from typing import List, Literal
+from pydantic import BaseModel
+from typing import Literal
 
 
 class SurfaceRange(BaseModel):
@@ -33,6 +33,7 @@ class RouteFWD(RoutePointEvents):
         linkid: str | list = "ALL",
         linkid_col: str = "LINKID",
         ignore_review: bool = False,
+        collect_review: bool = False,
         data_year: int = None,
         data_semester: Literal[1, 2] = None,
     ):
@@ -53,16 +54,14 @@ class RouteFWD(RoutePointEvents):
             file_path=config_path, ignore_review_err=ignore_review
         )
 
-        df_str = (
-            pl.read_excel(excel_path, engine="calamine", infer_schema_length=None)
-            .rename(str.upper)
-            .cast(pl.String)
-        )
+        def read(excel_path: str) -> pl.DataFrame:
+            return schema.read_excel(excel_path)
 
-        ta = TypeAdapter(List[schema.model])
-        df = pl.DataFrame(
-            ta.validate_python(df_str.to_dicts()), infer_schema_length=None
-        ).filter(route_filter)
+        # Validate and cast into typed DataFrame
+        df, review_errors = schema.parse_excel(
+            excel_path, read, collect_review=collect_review
+        )
+        df = df.filter(route_filter)
 
         return cls(
             artable=df.to_arrow(),
@@ -70,6 +69,7 @@ class RouteFWD(RoutePointEvents):
             data_year=data_year,
             data_semester=data_semester,
             lane_data=True,
+            review_errors=review_errors,
         )
 
     def __init__(self, *args, **kwargs):
@@ -1,9 +1,8 @@
 from ..base import RoutePointEvents
 from ...schema import RouteEventsSchema
-from pydantic import TypeAdapter
 import polars as pl
+from ...utils.memo import df_cached_property
 import os
-from typing import List
 
 
 # Default column names
@@ -31,6 +30,7 @@ class RouteRTC(RoutePointEvents):
         linkid: str | list = 'ALL',
         linkid_col: str = 'LINKID',
         ignore_review: bool = False,
+        collect_review: bool = False,
         data_year: int = None,
     ):
         """
@@ -51,21 +51,12 @@ class RouteRTC(RoutePointEvents):
             ignore_review_err=ignore_review
         )
 
-        df_str = pl.read_excel(
-            excel_path,
-            engine='calamine',
-            infer_schema_length=None
-        ).rename(
-            str.upper
-        ).cast(
-            pl.String
-        )
+        def read(excel_path: str) -> pl.DataFrame:
+            return schema.read_excel(excel_path)
 
-        ta = TypeAdapter(List[schema.model])
-        df = pl.DataFrame(
-            ta.validate_python(df_str.to_dicts()),
-            infer_schema_length=None
-        ).filter(
+        # Validate and cast into typed DataFrame
+        df, review_errors = schema.parse_excel(excel_path, read, collect_review=collect_review)
+        df = df.filter(
             route_filter
         )
 
@@ -73,7 +64,8 @@ class RouteRTC(RoutePointEvents):
             artable=df.to_arrow(),
             route=linkid,
             data_year=data_year,
-            lane_data=True
+            lane_data=True,
+            review_errors=review_errors
         )
     
     def __init__(self, *args, **kwargs):
@@ -96,10 +88,11 @@ class RouteRTC(RoutePointEvents):
         """
         return self.pl_df[self._surv_dir_col].unique().to_list()
 
-    @property
+    @df_cached_property
     def df_with_timestamp(self) -> pl.DataFrame:
         """
-        Return the input data as Polars DataFrame with calculated survey timestamp (Polars Datetime)
+        Return the input data as Polars DataFrame with calculated survey timestamp (Polars Datetime).
+        The DataFrame is only created once until the events data is replaced.
         """
         return self.pl_df.with_columns(
             **{
@@ -149,8 +142,12 @@ class RouteRTC(RoutePointEvents):
         """
         Get the duration of the surveys in minutes.
         """
-        start_timestamp = self.df_with_timestamp[self._timestamp_col].min().timestamp()
-        end_timestamp = self.df_with_timestamp[self._timestamp_col].max().timestamp()
+        start, end = self.df_with_timestamp.select(
+            start=pl.col(self._timestamp_col).min(),
+            end=pl.col(self._timestamp_col).max()
+        ).row(0)
+        start_timestamp = start.timestamp()
+        end_timestamp = end.timestamp()
         duration_days = (end_timestamp-start_timestamp)/60/60/24
 
         return round(duration_days)
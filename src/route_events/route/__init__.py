@@ -1 +1,3 @@
-from .lrs import LRSRoute
\ No newline at end of file
+from .lrs import LRSRoute, LRSRouteCollection
+from .cache import LRSRouteCache
+from .snapshot import LRSSnapshotStore
\ No newline at end of file
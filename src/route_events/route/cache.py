@@ -0,0 +1,106 @@
+from cachetools import TTLCache
+from threading import Lock
+from typing import Callable, Hashable, Optional
+import time
+from .lrs import LRSRoute
+
+
+class LRSRouteCache(object):
+    """
+    Process-wide LRSRoute cache. Entries are keyed by route ID and geometry version, expired after TTL
+    and evicted in LRU order when the total vertex count exceeds the maximum.
+    """
+    def __init__(
+            self,
+            max_vertices: int = 2_000_000,
+            ttl: float = 600,
+            loader: Callable[[str, str], Optional[LRSRoute]] = LRSRoute.from_feature_service,
+            timer: Callable[[], float] = time.monotonic
+    ):
+        self._cache = TTLCache(
+            maxsize=max_vertices,
+            ttl=ttl,
+            timer=timer,
+            getsizeof=lambda lrs: max(lrs.vertex_count, 1)
+        )
+        self._loader = loader
+        self._lock = Lock()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def vertex_count(self) -> int:
+        """
+        Total vertex count of all cached routes.
+        """
+        return self._cache.currsize
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(
+            self,
+            grpc_host: str,
+            route: str,
+            geometry_version: Hashable = None
+    ) -> Optional[LRSRoute]:
+        """
+        Get LRSRoute from the cache, or fetch it from the GRPC service if the route is not cached.
+        Route which does not exists in the LRS Network (None) is not cached.
+        """
+        key = (route, geometry_version)
+
+        with self._lock:
+            lrs = self._cache.get(key)
+
+            if lrs is not None:
+                self._hits += 1
+                return lrs
+
+            self._misses += 1
+
+        lrs = self._loader(grpc_host, route)
+
+        if lrs is None:
+            return None
+
+        with self._lock:
+            try:
+                self._cache[key] = lrs
+            except ValueError:
+                pass  # Route is larger than the cache maximum size.
+
+        return lrs
+
+    def invalidate(self, route: str = None):
+        """
+        Remove a route (all geometry versions) from the cache. Clear the cache if route is None.
+        """
+        with self._lock:
+            if route is None:
+                self._cache.clear()
+            else:
+                for key in [key for key in self._cache.keys() if key[0] == route]:
+                    self._cache.pop(key, None)
+
+    def stats(self) -> dict:
+        """
+        Cache statistics.
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'routes': len(self._cache),
+                'vertices': self._cache.currsize
+            }
@@ -0,0 +1,129 @@
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import List
+
+
+def lrs_schema(linkid_col: str = "LINKID") -> pa.Schema:
+    """
+    Arrow schema of the LRS vertex table.
+    """
+    return pa.schema([
+        (linkid_col, pa.string()),
+        ("LAT", pa.float64()),
+        ("LONG", pa.float64()),
+        ("MVAL", pa.float64()),
+        ("VERTEX_SEQ", pa.int64())
+    ])
+
+
+def decode_features(features: List[dict], linkid_col: str = "LINKID") -> pa.Table:
+    """
+    Decode LineString and MultiLineString GeoJSON features into LRS vertex table.
+    All coordinates are converted into a single Arrow nested list array, and the X, Y and M columns
+    are sliced out of its contiguous float64 buffer. The vertex sequence continues for route with multiple features.
+    """
+    routes = dict()
+    parts = list()
+    part_route = list()
+
+    for feature in features:
+        geom_type = feature['geometry']['type']
+        geom_array = feature['geometry']['coordinates']
+        route_idx = routes.setdefault(feature['properties'][linkid_col], len(routes))
+
+        if geom_type == 'MultiLineString':
+            parts.extend(geom_array)
+            part_route.extend([route_idx]*len(geom_array))
+        elif geom_type == 'LineString':
+            parts.append(geom_array)
+            part_route.append(route_idx)
+
+    if len(parts) == 0:
+        return lrs_schema(linkid_col).empty_table()
+
+    parts = pa.array(parts, type=pa.list_(pa.list_(pa.float64())))
+    vertex = parts.flatten()
+
+    # Vertex may contain Z value, M value is always the last one.
+    vertex_len = pc.list_value_length(vertex).to_numpy()
+    vertex_start = np.cumsum(vertex_len) - vertex_len
+    values = vertex.flatten().to_numpy()
+
+    vertex_route = np.repeat(
+        np.array(part_route, dtype=np.int64),
+        pc.list_value_length(parts).to_numpy()
+    )
+
+    # Vertex sequence within each route, following the features order.
+    order = np.argsort(vertex_route, kind='stable')
+    sorted_route = vertex_route[order]
+    route_start = np.searchsorted(sorted_route, sorted_route, side='left')
+    vertex_seq = np.empty(len(order), dtype=np.int64)
+    vertex_seq[order] = np.arange(len(order), dtype=np.int64) - route_start
+
+    linkid = pc.take(
+        pa.array(list(routes.keys()), type=pa.string()),
+        pa.array(vertex_route)
+    )
+
+    return pa.Table.from_arrays(
+        [
+            linkid,
+            pa.array(values[vertex_start + 1]),
+            pa.array(values[vertex_start]),
+            pa.array(values[vertex_start + vertex_len - 1]),
+            pa.array(vertex_seq)
+        ],
+        schema=lrs_schema(linkid_col)
+    )
+
+
+def decode_features_loop(features: List[dict], linkid_col: str = "LINKID") -> pa.Table:
+    """
+    Decode GeoJSON features into LRS vertex table, vertex by vertex. Kept for comparison.
+    """
+    linkid_rows = list()
+    lat_rows = list()
+    long_rows = list()
+    m_rows = list()
+    vertex_seq = list()
+    route_seq = dict()  # Vertex sequence continues for route with multiple features
+
+    # Parse geojson into lists
+    for feature in features:
+        geom_type = feature['geometry']['type']
+        routeid = feature['properties'][linkid_col]
+        geom_array = feature['geometry']['coordinates']
+
+        _seq = route_seq.get(routeid, 0)
+
+        if geom_type == 'MultiLineString':
+            parts = geom_array
+        elif geom_type == 'LineString':
+            parts = [geom_array]
+        else:
+            parts = []
+
+        for part in parts:
+            for vertex in part:
+                linkid_rows.append(routeid)
+                lat_rows.append(vertex[1])
+                long_rows.append(vertex[0])
+                m_rows.append(vertex[-1])  # Get the last one, to prevent fetching the Z value.
+                vertex_seq.append(_seq)  # Append the vertex sequence in linestring
+
+                _seq = _seq + 1
+
+        route_seq[routeid] = _seq
+
+    return pa.Table.from_arrays(
+        [
+            pa.array(linkid_rows, type=pa.string()),
+            pa.array(lat_rows, type=pa.float64()),
+            pa.array(long_rows, type=pa.float64()),
+            pa.array(m_rows, type=pa.float64()),
+            pa.array(vertex_seq, type=pa.int64())
+        ],
+        schema=lrs_schema(linkid_col)
+    )
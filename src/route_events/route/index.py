@@ -0,0 +1,337 @@
+import numpy as np
+from typing import Tuple
+from .snap import SnapResult, MAX_PAIRS_PER_CHUNK, snap_points
+
+
+# Maximum window ring searched around a point (ring 4 is 9x9 cells), points which are not resolved within
+# the ring are searched against all segments with the chunked brute force.
+MAX_WINDOW_RING = 4
+
+# Grid is limited to 2^20 cells per axis, cell id fits in int64.
+MAX_GRID_CELLS = 2**20
+
+
+class SegmentIndex(object):
+    """
+    Uniform grid index over polyline segments bounding box, stored in NumPy arrays.
+    Segment i connects vertex i and vertex i+1, every segment is registered to all cells intersecting its bounding box.
+    Only cells with segments are stored, sorted by cell id (row*nx + column) in CSR layout, the segments of the i-th
+    stored cell is ``cell_segment[cell_start[i]:cell_start[i+1]]``.
+    """
+    def __init__(
+            self,
+            vx: np.ndarray,
+            vy: np.ndarray,
+            valid_segment: np.ndarray = None,
+            cell_size: float = None
+    ):
+        vx = np.asarray(vx, dtype=np.float64)
+        vy = np.asarray(vy, dtype=np.float64)
+
+        if len(vx) < 2:
+            raise ValueError("Polyline requires at least 2 vertices.")
+
+        self.vx = vx
+        self.vy = vy
+        self.valid_segment = valid_segment
+        self.ax = vx[:-1]
+        self.ay = vy[:-1]
+        self.dx = vx[1:] - self.ax
+        self.dy = vy[1:] - self.ay
+        len2 = self.dx*self.dx + self.dy*self.dy
+        self.inv_len2 = np.divide(1, len2, out=np.zeros_like(len2), where=len2 > 0)
+
+        if valid_segment is None:
+            self.segments = np.arange(len(self.ax), dtype=np.int64)
+        else:
+            self.segments = np.flatnonzero(valid_segment)
+
+        if len(self.segments) == 0:
+            raise ValueError("Polyline does not have any valid segment.")
+
+        # Segments bounding box
+        seg = self.segments
+        min_x = np.minimum(self.ax[seg], self.ax[seg] + self.dx[seg])
+        max_x = np.maximum(self.ax[seg], self.ax[seg] + self.dx[seg])
+        min_y = np.minimum(self.ay[seg], self.ay[seg] + self.dy[seg])
+        max_y = np.maximum(self.ay[seg], self.ay[seg] + self.dy[seg])
+
+        self.x0 = min_x.min()
+        self.y0 = min_y.min()
+        extent = max(max_x.max() - self.x0, max_y.max() - self.y0)
+
+        if cell_size is None:
+            # Average segment length (route length / segment count), a segment is registered to around 1-4 cells.
+            route_length = np.sqrt(len2[seg]).sum()
+            cell_size = max(route_length/len(seg), extent/MAX_GRID_CELLS, 1e-6)
+
+        self.cell_size = cell_size
+        self.nx = int((max_x.max() - self.x0)//cell_size) + 1
+        self.ny = int((max_y.max() - self.y0)//cell_size) + 1
+
+        ix0, iy0 = self._cell(min_x, min_y)
+        ix1, iy1 = self._cell(max_x, max_y)
+        width = ix1 - ix0 + 1
+        count = width*(iy1 - iy0 + 1)
+
+        # Expand every segment into the cells covered by its bounding box.
+        owner = np.repeat(np.arange(len(seg)), count)
+        local = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+        cell = (iy0[owner] + local//width[owner])*self.nx + ix0[owner] + local % width[owner]
+
+        order = np.argsort(cell, kind='stable')
+        self.cells, cell_count = np.unique(cell[order], return_counts=True)
+        self.cell_segment = seg[owner[order]]
+        self.cell_start = np.zeros(len(self.cells) + 1, dtype=np.int64)
+        np.cumsum(cell_count, out=self.cell_start[1:])
+
+    def __len__(self) -> int:
+        """
+        Number of indexed segments.
+        """
+        return len(self.segments)
+
+    def _cell(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cell column and row of coordinates, clipped to the grid.
+        """
+        ix = np.clip(np.floor((x - self.x0)/self.cell_size), 0, self.nx - 1).astype(np.int64)
+        iy = np.clip(np.floor((y - self.y0)/self.cell_size), 0, self.ny - 1).astype(np.int64)
+
+        return ix, iy
+
+    def _cell_segments(self, cell: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Position of the first segment in cell_segment and segment count of every cell id.
+        """
+        pos = np.minimum(np.searchsorted(self.cells, cell), len(self.cells) - 1)
+        start = self.cell_start[pos]
+        count = np.where(self.cells[pos] == cell, self.cell_start[pos + 1] - start, 0)
+
+        return start, count
+
+    def _distance(self, px: np.ndarray, py: np.ndarray, segment: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Projection parameter and squared distance of points to segments, computed pairwise.
+        """
+        cx = px - self.ax[segment]
+        cy = py - self.ay[segment]
+        dx = self.dx[segment]
+        dy = self.dy[segment]
+
+        t = np.clip((cx*dx + cy*dy)*self.inv_len2[segment], 0, 1)
+        ex = cx - t*dx
+        ey = cy - t*dy
+
+        return t, ex*ex + ey*ey
+
+    def _k_smallest(self, point: np.ndarray, segment: np.ndarray, dist2: np.ndarray, n_points: int, k: int):
+        """
+        Select k nearest segments of every point from candidate pairs. Ties are resolved by the lowest segment index.
+        """
+        order = np.lexsort((segment, dist2, point))
+        point = point[order]
+        start = np.searchsorted(point, np.arange(n_points), side='left')
+        rank = np.arange(len(point)) - start[point]
+        keep = rank < k
+
+        nearest = np.full((n_points, k), -1, dtype=np.int64)
+        nearest_dist2 = np.full((n_points, k), np.inf)
+        nearest[point[keep], rank[keep]] = segment[order][keep]
+        nearest_dist2[point[keep], rank[keep]] = dist2[order][keep]
+
+        return nearest, nearest_dist2
+
+    def _search_window(
+            self,
+            px: np.ndarray,
+            py: np.ndarray,
+            k: int,
+            ring: int,
+            max_pairs: int = MAX_PAIRS_PER_CHUNK
+    ):
+        """
+        Search k nearest segments registered in the cells within ``ring`` cells of every point.
+        Points are processed in chunks bounded by the window cells and the candidate (point, segment) pairs count.
+        """
+        nearest = np.full((len(px), k), -1, dtype=np.int64)
+        nearest_dist2 = np.full((len(px), k), np.inf)
+
+        offset = np.arange(-ring, ring + 1)
+        ox = np.tile(offset, len(offset))
+        oy = np.repeat(offset, len(offset))
+        chunk = max(1, max_pairs//len(ox))
+
+        for chunk_start in range(0, len(px), chunk):
+            chunk_end = min(chunk_start + chunk, len(px))
+            ix, iy = self._cell(px[chunk_start:chunk_end], py[chunk_start:chunk_end])
+            cx = ix[:, None] + ox
+            cy = iy[:, None] + oy
+            inside = (cx >= 0) & (cx < self.nx) & (cy >= 0) & (cy < self.ny)
+
+            # Window cells with segments, ordered by point.
+            point = np.broadcast_to(np.arange(chunk_end - chunk_start)[:, None], inside.shape)[inside]
+            cell_pos, count = self._cell_segments((cy*self.nx + cx)[inside])
+            has_segment = count > 0
+            point = point[has_segment]
+            cell_pos = cell_pos[has_segment]
+            count = count[has_segment]
+
+            # Split the chunk points by the candidate pairs count.
+            point_end = np.cumsum(np.bincount(point, weights=count, minlength=chunk_end - chunk_start))
+            lo = 0
+
+            while lo < chunk_end - chunk_start:
+                offset_pairs = point_end[lo - 1] if lo > 0 else 0
+                hi = max(lo + 1, int(np.searchsorted(point_end, offset_pairs + max_pairs, side='right')))
+                sel = slice(np.searchsorted(point, lo), np.searchsorted(point, hi))
+
+                # Candidate (point, segment) pairs, a segment may be registered in multiple cells of the window.
+                sel_count = count[sel]
+                pair_point = np.repeat(point[sel] - lo, sel_count)
+                pair_pos = np.arange(sel_count.sum()) - np.repeat(np.cumsum(sel_count) - sel_count, sel_count) + \
+                    np.repeat(cell_pos[sel], sel_count)
+                pair_segment = self.cell_segment[pair_pos]
+
+                pair = np.unique(pair_point*len(self.ax) + pair_segment)
+                pair_point = pair//len(self.ax)
+                pair_segment = pair % len(self.ax)
+
+                _, dist2 = self._distance(
+                    px[chunk_start + lo:chunk_start + hi][pair_point],
+                    py[chunk_start + lo:chunk_start + hi][pair_point],
+                    pair_segment
+                )
+
+                rows = slice(chunk_start + lo, chunk_start + hi)
+                nearest[rows], nearest_dist2[rows] = self._k_smallest(pair_point, pair_segment, dist2, hi - lo, k)
+                lo = hi
+
+        return nearest, nearest_dist2
+
+    def _search_all(self, px: np.ndarray, py: np.ndarray, k: int, max_pairs: int = MAX_PAIRS_PER_CHUNK):
+        """
+        Search k nearest segments of every point against all indexed segments, in chunks of points bounded
+        by the (point, segment) pairs count. Ties are resolved by the lowest segment index.
+        """
+        nearest = np.full((len(px), k), -1, dtype=np.int64)
+        nearest_dist2 = np.full((len(px), k), np.inf)
+        k_found = min(k, len(self.segments))
+
+        seg = self.segments
+        ax = self.ax[seg]
+        ay = self.ay[seg]
+        dx = self.dx[seg]
+        dy = self.dy[seg]
+        inv_len2 = self.inv_len2[seg]
+        chunk = max(1, max_pairs // len(seg))
+
+        for start in range(0, len(px), chunk):
+            end = min(start + chunk, len(px))
+            cx = px[start:end, None] - ax
+            cy = py[start:end, None] - ay
+            t = np.clip((cx*dx + cy*dy)*inv_len2, 0, 1)
+            ex = cx - t*dx
+            ey = cy - t*dy
+            dist2 = ex*ex + ey*ey
+            rows = np.arange(end - start)[:, None]
+
+            if k == 1:
+                nearest_pos = np.argmin(dist2, axis=1)[:, None]
+            else:
+                nearest_pos = np.argsort(dist2, axis=1, kind='stable')[:, :k_found]
+
+            nearest[start:end, :k_found] = seg[nearest_pos]
+            nearest_dist2[start:end, :k_found] = dist2[rows, nearest_pos]
+
+        return nearest, nearest_dist2
+
+    def _nearest(self, px: np.ndarray, py: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Search k nearest segments by expanding the window ring up to MAX_WINDOW_RING until the result is exact.
+        Return the nearest segments, squared distances and the index of points which are not resolved.
+        """
+        nearest = np.full((len(px), k), -1, dtype=np.int64)
+        nearest_dist2 = np.full((len(px), k), np.inf)
+        valid = np.isfinite(px) & np.isfinite(py)  # Null coordinates has no nearest segment
+        k_found = min(k, len(self.segments))
+
+        # Points farther than the largest window radius from the grid can not be resolved by the window search.
+        out_x = np.maximum(self.x0 - px, px - (self.x0 + self.nx*self.cell_size))
+        out_y = np.maximum(self.y0 - py, py - (self.y0 + self.ny*self.cell_size))
+        far = np.maximum(out_x, out_y) > MAX_WINDOW_RING*self.cell_size
+        unresolved = [np.flatnonzero(valid & far)]
+        pending = np.flatnonzero(valid & ~far)
+        ring = 1
+
+        while len(pending) > 0:
+            found, found_dist2 = self._search_window(px[pending], py[pending], k, ring)
+            nearest[pending] = found
+            nearest_dist2[pending] = found_dist2
+
+            if (ring >= self.nx) and (ring >= self.ny):
+                break  # Window covers the whole grid
+
+            # Result is exact if the k-th nearest segment is within the searched ring.
+            radius = ring*self.cell_size
+            done = found_dist2[:, k_found - 1] <= radius*radius
+            pending = pending[~done]
+            ring = ring*2
+
+            if ring > MAX_WINDOW_RING:
+                unresolved.append(pending)
+                break
+
+        return nearest, nearest_dist2, np.sort(np.concatenate(unresolved))
+
+    def nearest_segments(self, xy: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find k nearest segments of every input coordinates (array with shape (n, 2)).
+        Return segment index and distance arrays with shape (n, k), sorted by distance.
+        If there are fewer than k segments, the rest is filled with -1 index and infinite distance.
+        """
+        xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        px = xy[:, 0]
+        py = xy[:, 1]
+
+        nearest, nearest_dist2, unresolved = self._nearest(px, py, k)
+
+        if len(unresolved) > 0:
+            nearest[unresolved], nearest_dist2[unresolved] = self._search_all(px[unresolved], py[unresolved], k)
+
+        return nearest, np.sqrt(nearest_dist2)
+
+    def snap(self, px: np.ndarray, py: np.ndarray) -> SnapResult:
+        """
+        Snap every input point to the nearest segment. Null coordinates are snapped to -1 segment with NaN distance.
+        Points which are not resolved within the window search (e.g. far from the polyline) are snapped with
+        the chunked brute force snap_points.
+        """
+        px = np.asarray(px, dtype=np.float64)
+        py = np.asarray(py, dtype=np.float64)
+
+        nearest, nearest_dist2, unresolved = self._nearest(px, py, 1)
+        segment = nearest[:, 0]
+        t, _ = self._distance(px, py, segment)
+        t[segment == -1] = np.nan
+        dist = np.where(segment == -1, np.nan, np.sqrt(nearest_dist2[:, 0]))
+
+        if len(unresolved) > 0:
+            snapped = snap_points(
+                px[unresolved],
+                py[unresolved],
+                self.vx,
+                self.vy,
+                valid_segment=self.valid_segment
+            )
+            segment[unresolved] = snapped.segment
+            t[unresolved] = snapped.t
+            dist[unresolved] = snapped.dist
+
+        return SnapResult(
+            segment=segment,
+            t=t,
+            dist=dist,
+            x=self.ax[segment] + t*self.dx[segment],
+            y=self.ay[segment] + t*self.dy[segment]
+        )
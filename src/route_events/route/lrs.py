@@ -1,12 +1,30 @@
 import json
+import hashlib
 import route_events.route.repo.lrs_pb2 as lrs_pb2
 import route_events.route.repo.lrs_pb2_grpc as lrs_pb2_grpc
 import grpc
 import pyarrow as pa
-import duckdb
 from route_events.geometry import LAMBERT_WKT
+from ..geometry.projection import LAMBERT, transform_coordinates
 from ..geometry.point import Points
+from .snap import interpolate_m
+from .index import SegmentIndex
+from .decoder import decode_features
+from ..utils.ddb import ddb_cursor
 import polars as pl
+import numpy as np
+from functools import cached_property
+from typing import Literal, Tuple, List, Dict, Iterator
+from collections.abc import Mapping
+from collections import OrderedDict
+from threading import Lock
+
+
+# Default GRPC message size limit
+MAX_MESSAGE_LENGTH = 8188254
+
+# Number of measure results cached in every LRSRoute
+MEASURE_CACHE_SIZE = 8
 
 
 class LRSRoute(object):
@@ -16,8 +34,8 @@ class LRSRoute(object):
         Get LRS features from GRPC service.
         """
         with grpc.insecure_channel(grpc_host, options=[
-        ('grpc.max_send_message_length', 8188254),
-        ('grpc.max_receive_message_length', 8188254),
+        ('grpc.max_send_message_length', MAX_MESSAGE_LENGTH),
+        ('grpc.max_receive_message_length', MAX_MESSAGE_LENGTH),
         ]) as channel:
             stub = lrs_pb2_grpc.RoadNetworkStub(channel)
             request = lrs_pb2.RouteRequests(routes=[route])
@@ -29,7 +47,50 @@ class LRSRoute(object):
         if len(features) == 0:
             return None
         else:
-            return cls.from_geojson(data.geojson)
+            return cls.from_features(features)
+        
+    @classmethod
+    def from_feature_service_many(
+        cls,
+        grpc_host: str,
+        routes: List[str],
+        max_message_length: int = MAX_MESSAGE_LENGTH,
+        chunk_size: int = 50,
+        linkid_col: str = "LINKID"
+    ) -> "LRSRouteCollection":
+        """
+        Get LRS features of multiple routes from GRPC service, every chunk of routes is fetched in a single request.
+        A chunk whose response exceeds ``max_message_length`` is split in half and requested again.
+        """
+        routes = list(dict.fromkeys(routes))  # Drop duplicates and keep the order
+        features = list()
+
+        with grpc.insecure_channel(grpc_host, options=[
+        ('grpc.max_send_message_length', max_message_length),
+        ('grpc.max_receive_message_length', max_message_length),
+        ]) as channel:
+            stub = lrs_pb2_grpc.RoadNetworkStub(channel)
+
+            for i in range(0, len(routes), chunk_size):
+                features.extend(cls._fetch_features(stub, routes[i:i+chunk_size]))
+
+        return LRSRouteCollection(features, linkid_col=linkid_col)
+    
+    @classmethod
+    def _fetch_features(cls, stub: lrs_pb2_grpc.RoadNetworkStub, routes: List[str]) -> List[dict]:
+        """
+        Fetch GeoJSON features of routes. Split the request if the response is too large.
+        """
+        try:
+            data = stub.GetByRouteId(lrs_pb2.RouteRequests(routes=routes))
+        except grpc.RpcError as e:
+            if (e.code() == grpc.StatusCode.RESOURCE_EXHAUSTED) and (len(routes) > 1):
+                half = len(routes)//2
+                return cls._fetch_features(stub, routes[:half]) + cls._fetch_features(stub, routes[half:])
+            else:
+                raise e
+            
+        return json.loads(data.geojson)['features']
         
     @classmethod
     def from_geojson_file(
@@ -57,66 +118,41 @@ class LRSRoute(object):
         """
         gjson = json.loads(json_str)
 
-        schema = pl.Schema({
-            linkid_col: pl.String(),
-            "LAT": pl.Float64(),
-            "LONG": pl.Float64(),
-            "MVAL": pl.Float64(),
-            "VERTEX_SEQ": pl.Int64()
-        })
+        return cls.from_features(
+            gjson['features'],
+            linkid_col=linkid_col
+        )
 
-        # Parse geojson into lists
-        for feature in gjson['features']:
-            geom_type = feature['geometry']['type']
-            routeid = feature['properties'][linkid_col]
-            geom_array = feature['geometry']['coordinates']
-
-            linkid_rows = list()
-            lat_rows = list()
-            long_rows = list()
-            m_rows = list()
-            vertex_seq = list()
-
-            if geom_type == 'MultiLineString':
-                _seq = 0
-                for part in geom_array:
-                    for vertex in part:
-                        linkid_rows.append(routeid)
-                        long_rows.append(vertex[1])  # Get the first
-                        lat_rows.append(vertex[0])  # Get the second
-                        m_rows.append(vertex[-1])  # Get the last one, to prevent fetching the Z value.
-                        vertex_seq.append(_seq)  # Append the vertex sequence in linestring
-
-                        _seq = _seq + 1
-            
-            elif geom_type == 'LineString':
-                _seq = 0
-                for vertex in geom_array:
-                    linkid_rows.append(routeid)
-                    long_rows.append(vertex[1])
-                    lat_rows.append(vertex[0])
-                    m_rows.append(vertex[-1])
-                    vertex_seq.append(_seq)  # Append the vertex sequence in linestring
-
-                    _seq = _seq + 1
-        
+    @classmethod
+    def from_features(
+        cls,
+        features: List[dict],
+        linkid_col: str = "LINKID"
+    ):
+        """
+        Deserialize list of GeoJSON features into LRSRoute object.
+        Vertex from every feature is decoded into columnar buffers.
+        """
         # Polars DataFrame containing all vertex
-        df = pl.DataFrame(
-            [linkid_rows, long_rows, lat_rows, m_rows, vertex_seq],
-            schema=schema
+        df = pl.from_arrow(
+            decode_features(features, linkid_col=linkid_col)
         )
 
         return cls(
             df=df,
-            properties=gjson['features'][0]['properties'] 
+            properties=features[0]['properties'] 
         )
     
     def __init__(
             self,
             df: pl.DataFrame,
-            properties: dict = None
+            properties: dict = None,
+            artable: pa.Table = None
         ):
-        
+        """
+        LRS route from vertex DataFrame. artable is the Arrow table of df if it is already available,
+        e.g. memory mapped snapshot, so df is not converted to Arrow again.
+        """
         # Define class field name
         self.linkid_col = 'LINKID'
         self.lat_col = 'LAT'
@@ -129,17 +165,22 @@ class LRSRoute(object):
         # LRS properties
         self._properties = properties
 
+        # Measure results, keyed by input coordinates hash
+        self._measure_cache = OrderedDict()
+        self._measure_lock = Lock()
+
+        # Cached route is shared by concurrent requests, and a DuckDB cursor is not thread-safe.
+        self._ddb_lock = Lock()
+
         self.df = df
-        self.artable = df.to_arrow()
+        self.artable = df.to_arrow() if artable is None else artable
 
         # Load the data to duckdb table
-        self.dconn = duckdb.connect()  # DuckDB connection
+        self.dconn = ddb_cursor(('spatial',))  # DuckDB cursor with spatial extension loaded
         _lrs_table = self.artable  # pointer
         self.lrs_line_table = 'lrs_line'
         self.lrs_point_table = 'lrs_point_table'
 
-        self.dconn.sql("install spatial; load spatial;")  # Load spatial and H3 extension
-
         # Convert the M-Value from kilometers to meters.
         # Create line and point table in DuckDB
 
@@ -188,46 +229,168 @@ class LRSRoute(object):
     def max_m_value(self) -> float:
         return self.df[self.mval_col].max()
     
+    @property
+    def vertex_count(self) -> int:
+        """
+        Number of vertex in the LRS geometry.
+        """
+        return self.df.height
+    
+    @cached_property
+    def _vertices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        LRS vertices in LAMBERT projection as NumPy arrays (X, Y, M-Value in meters, and valid segment mask).
+        A segment is valid if both of its vertices belong to the same route.
+        """
+        with self._ddb_lock:
+            vertices = self.dconn.sql(
+                f"""
+                select {self.linkid_col}, ST_X(point) as x, ST_Y(point) as y, {self.mval_col}
+                from {self.lrs_point_table}
+                order by {self.linkid_col}, {self.seq_col}
+                """
+            ).pl()
+
+        linkid = vertices[self.linkid_col].to_numpy()
+
+        return (
+            vertices['x'].to_numpy(),
+            vertices['y'].to_numpy(),
+            vertices[self.mval_col].to_numpy(),
+            linkid[:-1] == linkid[1:]
+        )
+    
+    @cached_property
+    def segment_index(self) -> SegmentIndex:
+        """
+        Spatial grid index of the LRS segments in LAMBERT projection, built once per route.
+        """
+        vx, vy, _, valid_segment = self._vertices
+
+        return SegmentIndex(vx, vy, valid_segment=valid_segment)
+
+    def nearest_segments(self, xy: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find k nearest LRS segments of LAMBERT coordinates (array with shape (n, 2)).
+        Return segment index (start vertex index) and distance in meters, both with shape (n, k).
+        """
+        return self.segment_index.nearest_segments(xy, k)
+
     def distance_to_point(self, long: float, lat: float):
         """
         Calculate nearest distance (in meters) from input coordinate to LRS geometry.
-        """        
-        nearest_dist = self.dconn.sql(
-            f"""
-            select 
-            ST_Distance(
-                ST_Transform(ST_Point({lat}, {long}), 'EPSG:4326', '{LAMBERT_WKT}'), linestr
-            )
-            as dist, {self.linkid_col} 
-            from {self.lrs_line_table}
-            """
-        )
+        """
+        x, y = LAMBERT.forward(long, lat)
+        _, dist = self.nearest_segments([[x, y]], k=1)
 
-        return nearest_dist.fetchall()[0][0]  # Return the distance in meters
+        return float(dist[0, 0])  # Return the distance in meters
     
     def distance_to_points(self, points: Points) -> pl.DataFrame:
         """
         Calculate nearest distance of Points to LRS geometry.
         """
-        df = points._rows  # Pointer for duckdb
-
-        distances = self.dconn.sql(
-            f"""
-            select
-            a.*,  
-            ST_Distance(
-                ST_Point({points.Y}, {points.X}), linestr
-            ) as dist
-            from df a
-            cross join {self.lrs_line_table}
-            """
+        measured = pl.from_arrow(self.measure(points))
+
+        return points._rows.with_columns(
+            dist=measured['dist']
         )
+    
+    def _lambert_xy(self, points: Points) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Input points coordinates in LAMBERT projection as NumPy arrays.
+        """
+        # Points geometry is created as ST_Point(Y, X)
+        st_x = points._rows[points.Y].cast(pl.Float64).to_numpy()
+        st_y = points._rows[points.X].cast(pl.Float64).to_numpy()
+
+        if points.origin_wkt == LAMBERT_WKT:
+            return st_x, st_y
+        
+        native = transform_coordinates(st_x, st_y, points.origin_wkt, LAMBERT_WKT)
+
+        if native is not None:
+            return native
+        
+        points = points.transform(LAMBERT_WKT, invert=True)
 
-        return distances.pl()
+        return (
+            points._rows[points.Y].cast(pl.Float64).to_numpy(),
+            points._rows[points.X].cast(pl.Float64).to_numpy()
+        )
+
+    def measure(self, points: Points) -> pa.Table:
+        """
+        Measure input points against the LRS geometry in a single pass. Return Arrow table with point_id, 
+        distance (dist), M-Value in meters (m_val), nearest segment index (segment), offset side (side, 1 for left, 
+        -1 for right and 0 if the point is on the line) and snapped coordinate in LAMBERT (snap_x, snap_y).
+        The result is cached, keyed by hash of the input coordinates. Null coordinates has null measures.
+        """
+        px, py = self._lambert_xy(points)
+        key = hashlib.blake2b(px.tobytes() + py.tobytes(), digest_size=16).hexdigest()
+
+        with self._measure_lock:
+            if key in self._measure_cache:
+                self._measure_cache.move_to_end(key)
+                return self._measure_cache[key]
+
+        snapped = self.segment_index.snap(px, py)
+        index = self.segment_index
+        segment = np.maximum(snapped.segment, 0)
+        missing = snapped.segment == -1
+        cross = index.dx[segment]*(py - index.ay[segment]) - index.dy[segment]*(px - index.ax[segment])
+        cross[missing] = 0
+
+        measured = pa.table({
+            'point_id': pa.array(np.arange(len(px), dtype=np.int64)),
+            'dist': pa.array(snapped.dist, mask=missing),
+            'm_val': pa.array(interpolate_m(snapped, self._vertices[2]), mask=missing),
+            'segment': pa.array(snapped.segment, mask=missing),
+            'side': pa.array(np.sign(cross).astype(np.int8), mask=missing),
+            'snap_x': pa.array(snapped.x, mask=missing),
+            'snap_y': pa.array(snapped.y, mask=missing)
+        })
+
+        with self._measure_lock:
+            self._measure_cache[key] = measured
+
+            if len(self._measure_cache) > MEASURE_CACHE_SIZE:
+                self._measure_cache.popitem(last=False)
+
+        return measured
     
-    def get_points_m_value(self, points: Points, unit='m'):
+    def get_points_m_value(
+            self, 
+            points: Points, 
+            unit='m', 
+            engine: Literal['numpy', 'duckdb'] = 'numpy'
+        ) -> pl.DataFrame:
         """
         Get M value of input points on LRS route geometry.
+        The 'numpy' engine snaps all points in batched array computation, 
+        the 'duckdb' engine uses spatial SQL query and is kept for comparison.
+        """
+        if engine == 'numpy':
+            return self._numpy_points_m_value(points)
+        elif engine == 'duckdb':
+            return self._duckdb_points_m_value(points)
+        else:
+            raise ValueError(f"{engine} is invalid or unsupported engine.")
+        
+    def _numpy_points_m_value(self, points: Points) -> pl.DataFrame:
+        """
+        Get M value of input points using NumPy, read from the measure result.
+        """
+        measured = pl.from_arrow(self.measure(points))
+
+        return points._rows.with_columns(
+            point_id=measured['point_id'],
+            m_val=measured['m_val'],
+            dist=measured['dist']
+        )
+
+    def _duckdb_points_m_value(self, points: Points) -> pl.DataFrame:
+        """
+        Get M value of input points using DuckDB spatial query.
         """
         points_row = pl.concat(
             [
@@ -237,131 +400,189 @@ class LRSRoute(object):
             how='horizontal'
             )
         
-        lrs_segment = self.dconn.sql(
-            f'select * exclude(point), ST_X(point) as x, ST_Y(point) as y from {self.lrs_point_table}'
-        ).pl().with_columns(
-            x1=pl.col('x').shift(-1),
-            y1=pl.col('y').shift(-1),
-            MVAL1=pl.col('MVAL').shift(-1)
-        ).filter(
-            pl.col('x1').is_not_null()
-        ).with_columns(
-            m=(pl.col('y1')-pl.col('y'))/(pl.col('x1')-pl.col('x'))
-        ).with_columns(
-            c=pl.col('y')-(pl.col('m')*pl.col('x'))
-        )
+        with self._ddb_lock:
+            lrs_segment = self.dconn.sql(
+                f'select * exclude(point), ST_X(point) as x, ST_Y(point) as y from {self.lrs_point_table}'
+            ).pl().with_columns(
+                x1=pl.col('x').shift(-1),
+                y1=pl.col('y').shift(-1),
+                MVAL1=pl.col('MVAL').shift(-1)
+            ).filter(
+                pl.col('x1').is_not_null()
+            ).with_columns(
+                m=(pl.col('y1')-pl.col('y'))/(pl.col('x1')-pl.col('x'))
+            ).with_columns(
+                c=pl.col('y')-(pl.col('m')*pl.col('x'))
+            )
 
-        vertex_on_line = self.dconn.sql(
-            f"""
-            -- SHORTEST LINE TO LRS LINE QUERY --
-            with shortest_to_lrs as
-            (
-            select
-            point_id,
-            ST_ShortestLine(
-                ST_Transform(ST_Point({points.Y}, {points.X}), '{points.origin_wkt}', '{LAMBERT_WKT}'), linestr
-            ) as shortestline
-            from points_row
-            cross join
-            {self.lrs_line_table}
-            ),
+            vertex_on_line = self.dconn.sql(
+                f"""
+                -- SHORTEST LINE TO LRS LINE QUERY --
+                with shortest_to_lrs as
+                (
+                select
+                point_id,
+                ST_ShortestLine(
+                    ST_Transform(ST_Point({points.Y}, {points.X}), '{points.origin_wkt}', '{LAMBERT_WKT}'), linestr
+                ) as shortestline
+                from points_row
+                cross join
+                {self.lrs_line_table}
+                ),
             
-            -- END POINT FROM SHORTESTLINE--
-            point_on_line as
-            (
-            select
-            point_id, 
-            ST_EndPoint(shortestline) as lambert_vertex,
-            ST_Length(shortestline) as dist,
-            ST_Transform(ST_EndPoint(shortestline), '{LAMBERT_WKT}', 'EPSG:4326') as point_4326
-            from shortest_to_lrs
-            ),
-
-            --NEAREST VERTEX TO ON-LINE POINT--
-            nearest_vertex as
-            (
-            select point_id, dist as dist_to_line, lambert_vertex as on_line, MVAL, MVAL1, x, y, x1, y1
-            from point_on_line a
-            inner join lrs_segment b
-            on ST_Y(lambert_vertex) <= greatest(y, y1) and ST_Y(lambert_vertex) >= least(y, y1)
-            and ST_X(lambert_vertex) <= greatest(x, x1) and ST_X(lambert_vertex) >= least(x, x1)
+                -- END POINT FROM SHORTESTLINE--
+                point_on_line as
+                (
+                select
+                point_id, 
+                ST_EndPoint(shortestline) as lambert_vertex,
+                ST_Length(shortestline) as dist,
+                ST_Transform(ST_EndPoint(shortestline), '{LAMBERT_WKT}', 'EPSG:4326') as point_4326
+                from shortest_to_lrs
+                ),
+
+                --NEAREST VERTEX TO ON-LINE POINT--
+                nearest_vertex as
+                (
+                select point_id, dist as dist_to_line, lambert_vertex as on_line, MVAL, MVAL1, x, y, x1, y1
+                from point_on_line a
+                inner join lrs_segment b
+                on ST_Y(lambert_vertex) <= greatest(y, y1) and ST_Y(lambert_vertex) >= least(y, y1)
+                and ST_X(lambert_vertex) <= greatest(x, x1) and ST_X(lambert_vertex) >= least(x, x1)
+                )
+
+                select
+                point_id,
+                dist_to_line,
+                (MVAL1 - MVAL) as m_delta,
+                MVAL as first_m,
+                (ST_Distance(ST_Point(x, y), ST_Point(x1, y1))) as dist,
+                (ST_Distance(ST_Point(x, y), on_line)) as inter_dist
+                from nearest_vertex
+                """
             )
 
-            select
-            point_id,
-            dist_to_line,
-            (MVAL1 - MVAL) as m_delta,
-            MVAL as first_m,
-            (ST_Distance(ST_Point(x, y), ST_Point(x1, y1))) as dist,
-            (ST_Distance(ST_Point(x, y), on_line)) as inter_dist
-            from nearest_vertex
-            """
-        )
-
-        df_m_val = vertex_on_line.pl().with_columns(
-            m_val = (pl.col('m_delta')/pl.col('dist')*pl.col('inter_dist'))+pl.col('first_m')
-        ).select(
-            ['point_id', 'm_val', 'dist_to_line']
-        ).rename(
-            {'dist_to_line': 'dist'}
-        ).unique(
-            'point_id'  # Used to drop duplicates
-        )
+            df_m_val = vertex_on_line.pl().with_columns(
+                m_val = (pl.col('m_delta')/pl.col('dist')*pl.col('inter_dist'))+pl.col('first_m')
+            ).select(
+                ['point_id', 'm_val', 'dist_to_line']
+            ).rename(
+                {'dist_to_line': 'dist'}
+            ).unique(
+                'point_id'  # Used to drop duplicates
+            )
 
         return points_row.join(
             df_m_val, on='point_id'
         )
     
+    def locate_m_values(
+            self,
+            m: np.ndarray,
+            unit: Literal['m', 'km'] = 'm',
+            wkt: str = LAMBERT_WKT
+        ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Locate coordinates of M-Values along the LRS geometry, the inverse of get_points_m_value.
+        M-Value is searched in the cumulative vertex M-Value and linearly interpolated within the segment.
+        Return X and Y (longitude and latitude for EPSG:4326), M-Value outside of the route M-Value range is NaN.
+        """
+        if unit == 'm':
+            m = np.asarray(m, dtype=np.float64)
+        elif unit == 'km':
+            m = np.asarray(m, dtype=np.float64)*1000
+        else:
+            raise ValueError(f"{unit} is invalid or unsupported unit conversion.")
+
+        vx, vy, vm, _ = self._vertices
+        m_search = np.maximum.accumulate(vm)  # Non monotonic M-Value is searched in its running maximum
+
+        segment = np.clip(np.searchsorted(m_search, m, side='right') - 1, 0, len(vm) - 2)
+        dm = vm[segment + 1] - vm[segment]
+        t = np.clip(np.divide(m - vm[segment], dm, out=np.zeros_like(m), where=dm != 0), 0, 1)
+
+        x = vx[segment] + t*(vx[segment + 1] - vx[segment])
+        y = vy[segment] + t*(vy[segment + 1] - vy[segment])
+
+        outside = ~((m >= m_search[0]) & (m <= m_search[-1]))
+        x[outside] = np.nan
+        y[outside] = np.nan
+
+        if wkt == LAMBERT_WKT:
+            return x, y
+        elif wkt == 'EPSG:4326':
+            return LAMBERT.inverse(x, y)
+        else:
+            raise ValueError(f"{wkt} is invalid or unsupported WKT.")
+
+    def get_points_sta_drift(
+            self,
+            points: Points,
+            m: np.ndarray,
+            unit: Literal['m', 'km'] = 'm'
+        ) -> pl.DataFrame:
+        """
+        Calculate distance (in meters) from input points to the location of their M-Value (STA) on LRS geometry,
+        without snapping the points. Points with M-Value outside of the route M-Value range has null drift.
+        """
+        px, py = self._lambert_xy(points)
+        x, y = self.locate_m_values(m, unit=unit)
+
+        return points._rows.with_columns(
+            drift=pl.Series(np.hypot(px - x, py - y), nan_to_null=True)
+        )
+
     def get_point_m_value(self, long: float, lat: float, unit='m'):
         """
         Get M value of input point on LRS route geometry.
         """
         # Snapped vertex from the input point on the LRS geometry.
-        vertex_on_line = self.dconn.sql(
-            f"""
-            with point_on_line as
-            (
-            select
-            {self.linkid_col}, 
-            ST_EndPoint
-            (
-            ST_ShortestLine(
-                ST_Transform(ST_Point({lat}, {long}), 'EPSG:4326', '{LAMBERT_WKT}'), linestr
+        with self._ddb_lock:
+            vertex_on_line = self.dconn.sql(
+                f"""
+                with point_on_line as
+                (
+                select
+                {self.linkid_col}, 
+                ST_EndPoint
+                (
+                ST_ShortestLine(
+                    ST_Transform(ST_Point({lat}, {long}), 'EPSG:4326', '{LAMBERT_WKT}'), linestr
+                )
+                ) as shortestline
+                from {self.lrs_line_table}
+                )
+
+                -- select from point_on_line
+                select linkid, ST_X(shortestline) as x, ST_Y(shortestline) as y
+                from point_on_line
+                """
             )
-            ) as shortestline
-            from {self.lrs_line_table}
-            )
-
-            -- select from point_on_line
-            select linkid, ST_X(shortestline) as x, ST_Y(shortestline) as y
-            from point_on_line
-            """
-        )
 
-        # Vertex on the LRS line.
-        # Vertex that will be interpolated.
-        vertex_x = vertex_on_line.fetchall()[0][1]
-        vertex_y = vertex_on_line.fetchall()[0][2]
-
-        # Nearest vertex to the new vertex
-        # Get all data to interpolate the new vertex M-value
-        input_var = self.dconn.sql(f"""
-                       with nearest_seq as
-                       (
-                       select linkid, 
-                       unnest(arg_min({self.seq_col}, ST_Distance(ST_Point({vertex_x}, {vertex_y}), point), 2))
-                       as {self.seq_col}
-                       from {self.lrs_point_table} group by linkid
-                       )
-
-                       select linkid,
-                       ST_Distance(first(point), last(point)) as dist,
-                       first({self.mval_col}) as first_m,
-                       last({self.mval_col})-first({self.mval_col}) as m_delta,
-                       ST_Distance(ST_Point({vertex_x}, {vertex_y}), first(point)) as inter_dist
-                       from {self.lrs_point_table} where {self.seq_col} in (select {self.seq_col} from nearest_seq)
-                       group by linkid
-                       """).df().iloc[0]
+            # Vertex on the LRS line.
+            # Vertex that will be interpolated.
+            vertex_x = vertex_on_line.fetchall()[0][1]
+            vertex_y = vertex_on_line.fetchall()[0][2]
+
+            # Nearest vertex to the new vertex
+            # Get all data to interpolate the new vertex M-value
+            input_var = self.dconn.sql(f"""
+                           with nearest_seq as
+                           (
+                           select linkid, 
+                           unnest(arg_min({self.seq_col}, ST_Distance(ST_Point({vertex_x}, {vertex_y}), point), 2))
+                           as {self.seq_col}
+                           from {self.lrs_point_table} group by linkid
+                           )
+
+                           select linkid,
+                           ST_Distance(first(point), last(point)) as dist,
+                           first({self.mval_col}) as first_m,
+                           last({self.mval_col})-first({self.mval_col}) as m_delta,
+                           ST_Distance(ST_Point({vertex_x}, {vertex_y}), first(point)) as inter_dist
+                           from {self.lrs_point_table} where {self.seq_col} in (select {self.seq_col} from nearest_seq)
+                           group by linkid
+                           """).df().iloc[0]
 
         result = ((input_var['m_delta']/input_var['dist'])*input_var['inter_dist'])+(input_var['first_m'])
 
@@ -371,3 +592,45 @@ class LRSRoute(object):
             return float(result/1000)
         else:
             raise ValueError(f"{unit} is invalid or unsupported unit conversion.")
+
+
+
+class LRSRouteCollection(Mapping):
+    """
+    Collection of LRSRoute from a multi route GeoJSON features, keyed by route ID.
+    LRSRoute object is only built when the route is accessed.
+    """
+    def __init__(
+            self,
+            features: List[dict],
+            linkid_col: str = "LINKID"
+    ):
+        self._linkid_col = linkid_col
+        self._features: Dict[str, List[dict]] = dict()
+        self._routes: Dict[str, LRSRoute] = dict()
+
+        for feature in features:
+            self._features.setdefault(
+                feature['properties'][linkid_col], list()
+            ).append(feature)
+
+    def __getitem__(self, route: str) -> LRSRoute:
+        if route not in self._routes:
+            self._routes[route] = LRSRoute.from_features(
+                self._features[route],
+                linkid_col=self._linkid_col
+            )
+
+        return self._routes[route]
+    
+    def features(self, route: str) -> List[dict]:
+        """
+        GeoJSON features of a route.
+        """
+        return self._features[route]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._features)
+    
+    def __len__(self) -> int:
+        return len(self._features)
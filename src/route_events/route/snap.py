@@ -0,0 +1,101 @@
+import numpy as np
+from typing import NamedTuple
+
+
+# Maximum number of (point, segment) pairs evaluated in a single array operation.
+# Larger inputs are processed in chunks of points to bound peak memory.
+MAX_PAIRS_PER_CHUNK = 2**22
+
+
+class SnapResult(NamedTuple):
+    """
+    Result of snapping points onto a polyline.
+    """
+    segment: np.ndarray  # Index of the nearest segment (start vertex index)
+    t: np.ndarray  # Position of the snapped point along the segment (0 to 1)
+    dist: np.ndarray  # Distance from the input point to the snapped point
+    x: np.ndarray  # Snapped point X
+    y: np.ndarray  # Snapped point Y
+
+
+def snap_points(
+        px: np.ndarray,
+        py: np.ndarray,
+        vx: np.ndarray,
+        vy: np.ndarray,
+        valid_segment: np.ndarray = None,
+        max_pairs: int = MAX_PAIRS_PER_CHUNK
+) -> SnapResult:
+    """
+    Snap every input point to the nearest segment of a polyline defined by vertices (vx, vy).
+    Segment i connects vertex i and vertex i+1. Segments with False ``valid_segment`` value are never selected.
+    """
+    px = np.asarray(px, dtype=np.float64)
+    py = np.asarray(py, dtype=np.float64)
+    vx = np.asarray(vx, dtype=np.float64)
+    vy = np.asarray(vy, dtype=np.float64)
+
+    if len(vx) < 2:
+        raise ValueError("Polyline requires at least 2 vertices.")
+
+    ax = vx[:-1]
+    ay = vy[:-1]
+    dx = vx[1:] - ax
+    dy = vy[1:] - ay
+    len2 = dx*dx + dy*dy
+    inv_len2 = np.divide(1, len2, out=np.zeros_like(len2), where=len2 > 0)  # Zero length segment snaps to its start
+
+    if valid_segment is None:
+        penalty = None
+    else:
+        penalty = np.where(valid_segment, 0, np.inf)
+
+    n_points = len(px)
+    segment = np.empty(n_points, dtype=np.int64)
+    t = np.empty(n_points, dtype=np.float64)
+    dist2 = np.empty(n_points, dtype=np.float64)
+
+    chunk = max(1, max_pairs // len(ax))
+
+    for start in range(0, n_points, chunk):
+        end = min(start + chunk, n_points)
+        cx = px[start:end, None] - ax
+        cy = py[start:end, None] - ay
+
+        # Projection parameter of every point on every segment, clamped to the segment.
+        ct = np.clip((cx*dx + cy*dy)*inv_len2, 0, 1)
+        ex = cx - ct*dx
+        ey = cy - ct*dy
+        cd2 = ex*ex + ey*ey
+
+        if penalty is not None:
+            cd2 += penalty
+
+        nearest = np.argmin(cd2, axis=1)
+        rows = np.arange(end-start)
+
+        segment[start:end] = nearest
+        t[start:end] = ct[rows, nearest]
+        dist2[start:end] = cd2[rows, nearest]
+
+    sx = ax[segment] + t*dx[segment]
+    sy = ay[segment] + t*dy[segment]
+
+    return SnapResult(
+        segment=segment,
+        t=t,
+        dist=np.sqrt(dist2),
+        x=sx,
+        y=sy
+    )
+
+
+def interpolate_m(result: SnapResult, vm: np.ndarray) -> np.ndarray:
+    """
+    Interpolate M-Value of snapped points from the polyline vertices M-Value.
+    """
+    vm = np.asarray(vm, dtype=np.float64)
+    m0 = vm[result.segment]
+    m1 = vm[result.segment + 1]
+
+    return m0 + result.t*(m1 - m0)
@@ -0,0 +1,203 @@
+import json
+import os
+import tempfile
+import pyarrow as pa
+import polars as pl
+from datetime import datetime, timezone
+from filelock import FileLock
+from threading import Lock
+from typing import Hashable, List, Optional
+from urllib.parse import quote
+from .lrs import LRSRoute, MAX_MESSAGE_LENGTH
+from .decoder import decode_features
+
+
+class LRSSnapshotStore(object):
+    """
+    On-disk LRS snapshot store. Every route vertex table is written into an uncompressed Arrow IPC file,
+    and the manifest stores the geometry version and timestamp of every route snapshot.
+    Snapshot is read with memory map, so processes on the same host share the same page cache, then copied once
+    into the LRSRoute DuckDB tables.
+    Snapshot older than max_age (in seconds) is not loaded and refreshed from the LRS service by get.
+    """
+    manifest_file = 'manifest.json'
+    properties_key = b'properties'
+
+    def __init__(self, path: str, linkid_col: str = "LINKID", max_age: float = None):
+        self.path = path
+        self.linkid_col = linkid_col
+        self.max_age = max_age
+        self._lock = Lock()
+
+        os.makedirs(path, exist_ok=True)
+
+        # Manifest lock file, shared with other processes using the same store.
+        self._file_lock = FileLock(os.path.join(path, f"{self.manifest_file}.lock"))
+
+    @property
+    def manifest(self) -> dict:
+        """
+        Snapshot manifest, keyed by route ID.
+        """
+        manifest_path = os.path.join(self.path, self.manifest_file)
+
+        if not os.path.exists(manifest_path):
+            return dict()
+
+        with open(manifest_path) as jf:
+            return json.load(jf)
+
+    def _replace(self, file_name: str, write):
+        """
+        Write file into temporary file and replace the target file, so reader never sees a partial file.
+        """
+        target = os.path.join(self.path, file_name)
+        fd, tmp = tempfile.mkstemp(dir=self.path, prefix=f"{file_name}.", suffix='.tmp')
+        os.close(fd)
+
+        try:
+            write(tmp)
+            os.replace(tmp, target)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    def _route_file(self, route: str) -> str:
+        return f"{quote(route, safe='')}.arrow"
+
+    def __contains__(self, route: str) -> bool:
+        return route in self.manifest
+
+    def routes(self) -> List[str]:
+        """
+        List of routes in the store.
+        """
+        return list(self.manifest.keys())
+
+    def write(
+            self,
+            route: str,
+            features: List[dict],
+            geometry_version: Hashable = None
+    ) -> dict:
+        """
+        Write LRS GeoJSON features of a route into the store. Return the manifest entry.
+        """
+        table = decode_features(features, linkid_col=self.linkid_col)
+        table = table.replace_schema_metadata(
+            {self.properties_key: json.dumps(features[0]['properties'])}
+        )
+
+        def _write(file_path: str):
+            with pa.OSFile(file_path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+
+        self._replace(self._route_file(route), _write)
+
+        return {
+            'file': self._route_file(route),
+            'geometry_version': geometry_version,
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'vertex_count': table.num_rows
+        }
+
+    def _update_manifest(self, entries: dict):
+        """
+        Merge entries into the manifest. The lock file prevents concurrent refresh from other processes
+        overwriting each other entries.
+        """
+        with self._lock, self._file_lock:
+            manifest = self.manifest
+            manifest.update(entries)
+
+            def _write(file_path: str):
+                with open(file_path, 'w') as jf:
+                    json.dump(manifest, jf, indent=2)
+
+            self._replace(self.manifest_file, _write)
+
+    def refresh(
+            self,
+            grpc_host: str,
+            routes: List[str],
+            geometry_version: Hashable = None,
+            chunk_size: int = 50,
+            max_message_length: int = MAX_MESSAGE_LENGTH
+    ) -> List[str]:
+        """
+        Pull routes from LRS GRPC service (RoadNetwork.GetByRouteId) and write the snapshots.
+        Return list of routes written into the store, routes which does not exists in the LRS Network are skipped.
+        """
+        collection = LRSRoute.from_feature_service_many(
+            grpc_host,
+            routes,
+            max_message_length=max_message_length,
+            chunk_size=chunk_size,
+            linkid_col=self.linkid_col
+        )
+
+        entries = {
+            route: self.write(route, collection.features(route), geometry_version)
+            for route in collection
+        }
+
+        self._update_manifest(entries)
+
+        return list(entries.keys())
+
+    def _expired(self, entry: dict) -> bool:
+        """
+        Snapshot is older than max_age.
+        """
+        if self.max_age is None:
+            return False
+
+        age = datetime.now(timezone.utc) - datetime.fromisoformat(entry['timestamp'])
+
+        return age.total_seconds() > self.max_age
+
+    def read_table(self, route: str, geometry_version: Hashable = None) -> Optional[pa.Table]:
+        """
+        Read route vertex table with memory map (zero-copy). Return None if the route is not in the store,
+        the snapshot has different geometry version or the snapshot is older than max_age.
+        """
+        entry = self.manifest.get(route)
+
+        if (entry is None) or ((geometry_version is not None) and (entry['geometry_version'] != geometry_version)):
+            return None
+
+        if self._expired(entry):
+            return None
+
+        source = pa.memory_map(os.path.join(self.path, entry['file']), 'r')
+
+        return pa.ipc.open_file(source).read_all()
+
+    def load(self, route: str, geometry_version: Hashable = None) -> Optional[LRSRoute]:
+        """
+        Load LRSRoute from the route snapshot. Return None if the route is not in the store or the snapshot
+        is outdated. The memory mapped vertex table is used by LRSRoute as is, the only copy is the LRSRoute
+        DuckDB tables.
+        """
+        table = self.read_table(route, geometry_version=geometry_version)
+
+        if table is None:
+            return None
+
+        return LRSRoute(
+            df=pl.from_arrow(table),
+            properties=json.loads(table.schema.metadata[self.properties_key]),
+            artable=table
+        )
+
+    def get(self, grpc_host: str, route: str, geometry_version: Hashable = None) -> Optional[LRSRoute]:
+        """
+        Load LRSRoute from the store, or refresh the route snapshot from the GRPC service if it is not in the store.
+        """
+        lrs = self.load(route, geometry_version=geometry_version)
+
+        if lrs is None and self.refresh(grpc_host, [route], geometry_version=geometry_version):
+            lrs = self.load(route, geometry_version=geometry_version)
+
+        return lrs
@@ -1 +1,2 @@
-from .base import RouteEventsSchema
\ No newline at end of file
+from .base import RouteEventsSchema
+from .registry import SchemaRegistry, schema_registry
@@ -1,5 +1,7 @@
 import pyarrow as pa
 import json
+import hashlib
+import copy
 from pydantic import (
     create_model, 
     Field, 
@@ -9,17 +11,20 @@ from pydantic import (
     ValidationInfo, 
     model_validator, 
     ModelWrapValidatorHandler,
-    StringConstraints
+    StringConstraints,
+    TypeAdapter
     )
 from pydantic_core import (
     PydanticCustomError, 
     ValidationError, 
     InitErrorDetails
     )
-from typing import Optional, Literal, Annotated
+from typing import Optional, Literal, Annotated, List, Tuple, Callable
 from datetime import datetime as dt
-from polars import String, Int64, Float64
+from polars import String, Int64, Float64, Null, DataFrame, Series, read_excel
 from enum import IntEnum
+from ..utils.parse_cache import parse_cache, ParsedInput
+from .registry import schema_registry
 import re
 
 
@@ -37,6 +42,9 @@ CUSTOM_ERROR_MSG = {
     "string_too_long": "{0} memiliki isi dengan jumlah karakter melebihi 255"
 }
 
+# Regex for extracting input value from Pydantic error.
+INPUT_VALUE_RE = r"(?:,|{| )'input(?:_value)?': (\w+|.\w+.|\d*\.*\d*|.\d*\.*\d*.)(?:,|}| )"
+
 def truncate_str(v:str):
     """
     Truncate string to match the 255 limitation.
@@ -138,7 +146,6 @@ def generate_missing_custom_msg(v: any, handler: ModelWrapValidatorHandler):
     Error loc could be like this (BANGUNAN_ATAS, 0, BANGUNAN_BAWAH, 0, LONGITUDE), only use the last position for error message.
     """
     errors = []
-    input_val_re = "(?:,|{| )'input(?:_value)?': (\w+|.\w+.|\d*\.*\d*|.\d*\.*\d*.)(?:,|}| )"
 
     try:
         return handler(v)
@@ -147,7 +154,7 @@ def generate_missing_custom_msg(v: any, handler: ModelWrapValidatorHandler):
             err_type = error['type']
 
             if err_type in CUSTOM_ERROR_MSG:
-                re_val = re.findall(input_val_re, str(error))
+                re_val = re.findall(INPUT_VALUE_RE, str(error))
 
                 if len(re_val) != 0:
                     error_val = re_val[0]
@@ -193,11 +200,37 @@ class RouteEventsSchema(object):
     Generate Pyarrow Schema and Pydantic Model from schema JSON configuration file.
     """
     def __init__(self, file_path, ignore_review_err=False):
+        # Compiled schema is shared by all schema objects with the same config file and ignore review flag.
+        compiled = schema_registry().get(
+            file_path,
+            ignore_review_err,
+            lambda: self._compile(file_path, ignore_review_err)
+        )
+
+        # Containers are copied, so a schema object mutation does not change the registry compiled schema.
+        # Model, Pyarrow schema and the validation engine are immutable and shared.
+        for name, value in compiled.items():
+            if name == 'schema_dict':
+                self.__dict__[name] = copy.deepcopy(value)
+            elif isinstance(value, (dict, list)):
+                self.__dict__[name] = copy.copy(value)
+            else:
+                self.__dict__[name] = value
+
+    def _compile(self, file_path, ignore_review_err=False) -> dict:
+        """
+        Load the config JSON, generate the Pydantic model and Pyarrow schema. Return the schema attributes.
+        """
+        from .engine import PolarsSchemaValidator
+
         # Load the config JSON
-        with open(file_path) as jf:
-            schema_dict = json.load(jf)['column_details']
+        with open(file_path, 'rb') as jf:
+            schema_bytes = jf.read()
+            schema_dict = json.loads(schema_bytes)['column_details']
 
         self.schema_dict = schema_dict
+        self.ignore_review_err = ignore_review_err
+        self.schema_hash = hashlib.blake2b(schema_bytes, digest_size=20).hexdigest()
         self.input_schema = pa.schema([])
         self.metadata_keys = b'details'  # Keys used to access Field metadata
         self.translate_mapping = dict()  # Dictionary for mapping column name from input to database column.
@@ -357,3 +390,116 @@ class RouteEventsSchema(object):
 
         # Create Pydantic model
         self.model = create_model('validation', __validators__=self.validators, **self.model_kwargs)
+
+        # Vectorized validation engine
+        self.engine = PolarsSchemaValidator(self.schema_dict, ignore_review_err=ignore_review_err)
+
+        return dict(self.__dict__)
+
+    def validate(self, df: DataFrame, backend: Literal['polars', 'pydantic'] = 'polars') -> DataFrame:
+        """
+        Validate string input DataFrame and return the typed DataFrame. Raise Pydantic ValidationError
+        if the input contains invalid value.
+        """
+        if backend == 'pydantic':
+            ta = TypeAdapter(List[self.model])
+            return DataFrame(ta.validate_python(df.to_dicts()), infer_schema_length=None)
+
+        return self.engine.validate(df)
+
+    def parse(self, df: DataFrame, collect_review: bool = False) -> Tuple[DataFrame, DataFrame]:
+        """
+        Validate string input DataFrame in a single pass and return the typed DataFrame and review errors
+        (row, column, type and msg). If collect_review is True, review errors are returned instead of raised.
+        """
+        df, review_errors = self.engine.parse(df)
+
+        if (not collect_review) and (not review_errors.is_empty()):
+            raise self.engine.validation_error(review_errors)
+
+        return df, review_errors
+
+    def read_excel(self, excel_path: str) -> DataFrame:
+        """
+        Read the first sheet of the Excel file with column types from pl_schema, see cast_input.
+        """
+        df = read_excel(
+            excel_path,
+            engine='calamine',
+            infer_schema_length=None
+        ).rename(
+            str.upper
+        )
+
+        return self.cast_input(df)
+
+    def cast_input(self, df: DataFrame) -> DataFrame:
+        """
+        Keep only the input columns declared in the schema and cast them into the pl_schema type.
+        Empty column is kept as Null, numeric column of a double or integer field is kept as number, integer field with
+        decimal value is kept as Float64 and rounded in the validation. Other columns (text, mixed, boolean
+        and date cells) are cast into String and validated for every cell.
+        """
+        columns = dict()
+
+        for rule in self.engine.rules:
+            source = self.engine._source(rule, df.columns)
+
+            if (source is None) or (source in columns):
+                continue
+
+            columns[source] = self._cast_column(df[source], self.pl_schema[rule.name])
+
+        return DataFrame(list(columns.values()))
+
+    @staticmethod
+    def _cast_column(s: Series, dtype) -> Series:
+        # Empty column is not materialized.
+        if s.dtype == Null:
+            return s
+
+        if (dtype == String) or not s.dtype.is_numeric():
+            return s.cast(String)
+
+        if (dtype == Int64) and s.dtype.is_integer():
+            return s
+
+        return s.cast(Float64)
+
+    def parse_excel(
+            self,
+            excel_path: str,
+            reader: Callable[[str], DataFrame],
+            collect_review: bool = False,
+            cache_options: tuple = (),
+            metadata: dict = None
+    ) -> Tuple[DataFrame, DataFrame]:
+        """
+        Read the Excel file with the reader function and parse it, see parse.
+        The parsed input is loaded from the process-level parse cache if configured, keyed by the file content,
+        schema, ignore review flag and cache_options (reader options which change the reader output).
+        Metadata dictionary is updated by the reader, and restored from the cache.
+        """
+        cache = parse_cache()
+        parsed = None
+
+        if metadata is None:
+            metadata = dict()
+
+        if cache is not None:
+            key = cache.key(excel_path, self.schema_hash, self.ignore_review_err, *cache_options)
+            parsed = cache.get(key)
+
+        if parsed is None:
+            df, review_errors = self.parse(reader(excel_path), collect_review=True)
+            parsed = ParsedInput(df, review_errors, dict(metadata))
+
+            if cache is not None:
+                cache.put(key, parsed)
+        else:
+            metadata.update(parsed.metadata)
+
+        if (not collect_review) and (not parsed.review_errors.is_empty()):
+            raise self.engine.validation_error(parsed.review_errors)
+
+        return parsed.data, parsed.review_errors
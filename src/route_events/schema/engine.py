@@ -0,0 +1,432 @@
+import polars as pl
+import re
+from dataclasses import dataclass
+from datetime import datetime as dt
+from pydantic_core import PydanticCustomError, ValidationError, InitErrorDetails
+from typing import List, Optional
+from .base import CUSTOM_ERROR_MSG, INPUT_VALUE_RE
+
+
+# Columns used as the segment context in review message.
+SEGMENT_CONTEXT = ('FROM_STA', 'TO_STA', 'LANE_CODE')
+
+# Schema of the errors DataFrame.
+ERROR_SCHEMA = {'row': pl.Int64, 'column': pl.String, 'type': pl.String, 'msg': pl.String}
+
+RANGE_ERRORS = ['less_than', 'less_than_equal', 'greater_than_equal', 'greater_than']
+
+# Leading, trailing or repeated underscore, rejected by the Pydantic float parser. Other underscores are removed.
+INVALID_UNDERSCORE_RE = r'^_|_$|__'
+
+
+@dataclass
+class ColumnRule(object):
+    """
+    Validation rule of a single column, compiled from schema column details.
+    """
+    name: str
+    dtype: str
+    aliases: List[str]
+    allow_null: bool = False
+    upper_case: bool = True
+    lower: Optional[float] = None
+    upper: Optional[float] = None
+    eq_lower: bool = True
+    eq_upper: bool = True
+    review: bool = False
+    domain: Optional[List[str]] = None
+    strptime: Optional[str] = None
+
+
+def error_value(value) -> str:
+    """
+    Format input value in error message, following the Pydantic error message.
+    """
+    found = re.findall(INPUT_VALUE_RE, str({'input': value, 'url': None}))
+
+    if len(found) != 0:
+        return found[0]
+    else:
+        return value
+
+
+class PolarsSchemaValidator(object):
+    """
+    Vectorized validation engine. Every schema column details is compiled into Polars expressions
+    (type cast, range, review range, domain, null and date parsing), producing the same typed DataFrame
+    and error messages as the Pydantic model. Error is raised as Pydantic ValidationError.
+    """
+    def __init__(self, schema_dict: dict, ignore_review_err: bool = False):
+        self.ignore_review_err = ignore_review_err
+        self.rules: List[ColumnRule] = list()
+
+        for col, details in schema_dict.items():
+            if details.get('skip'):
+                continue
+
+            dtype = details['dtype']
+
+            if dtype not in ['string', 'double', 'integer', 'date', 'timestamp']:
+                continue
+
+            db_col = details.get('db_col') or col
+            rule = ColumnRule(
+                name=col,
+                dtype=dtype,
+                aliases=list(dict.fromkeys([col, db_col, col.lower(), col.upper(), col.replace('DETIL', 'DETAIL')])),
+                allow_null=bool(details.get('allow_null')),
+                upper_case=details.get('uppercase') is not False
+            )
+
+            _range = details.get('range')
+
+            if _range is not None:
+                rule.lower = _range['lower']
+                rule.upper = _range['upper']
+                rule.eq_lower = _range['eq_lower']
+                rule.eq_upper = _range['eq_upper']
+                rule.review = bool(_range.get('review'))
+
+            # Integer domain is not validated by the Pydantic model.
+            if (details.get('domain') is not None) and (dtype == 'string'):
+                rule.domain = [str(_).lower() for _ in details['domain']] + [str(_).upper() for _ in details['domain']]
+
+            if dtype == 'date':
+                rule.strptime = '%d/%m/%Y'
+            elif dtype == 'timestamp':
+                rule.strptime = '%d/%m/%Y %H:%M:%S'
+
+            self.rules.append(rule)
+
+    def _source(self, rule: ColumnRule, columns: List[str]) -> Optional[str]:
+        """
+        Input column of the rule, the first alias which exists in the input.
+        """
+        for alias in rule.aliases:
+            if alias in columns:
+                return alias
+
+        return None
+
+    def _range_error(self, rule: ColumnRule, value: pl.Expr) -> pl.Expr:
+        """
+        Range error type expression, upper bound is checked before the lower bound.
+        NaN is always outside of the valid range, Polars treats NaN as the largest value.
+        """
+        error = pl.lit(None, dtype=pl.String)
+        is_nan = value.is_nan() if rule.dtype == 'double' else pl.lit(False)
+
+        if rule.lower is not None:
+            if rule.eq_lower:
+                error = pl.when(~(value >= rule.lower) | is_nan).then(pl.lit('greater_than_equal')).otherwise(error)
+            else:
+                error = pl.when(~(value > rule.lower) | is_nan).then(pl.lit('greater_than')).otherwise(error)
+
+        if rule.upper is not None:
+            if rule.eq_upper:
+                error = pl.when(~(value <= rule.upper) | is_nan).then(pl.lit('less_than_equal')).otherwise(error)
+            else:
+                error = pl.when(~(value < rule.upper) | is_nan).then(pl.lit('less_than')).otherwise(error)
+
+        return error
+
+    def _column_exprs(
+            self,
+            rule: ColumnRule,
+            source: str,
+            dtype: pl.DataType = pl.String,
+            python_number: bool = False
+        ) -> List[pl.Expr]:
+        """
+        Typed value and error type expressions of a column. Numeric input (dtype) of a double or integer
+        column is used as is, other input is parsed from string. If python_number is True, numeric string
+        with underscore or non-ASCII digit is parsed with the same syntax as the Pydantic model.
+        """
+        raw = pl.col(source).cast(pl.String)
+        null_error = pl.lit(None, dtype=pl.String)
+
+        if rule.dtype == 'string':
+            value = raw.str.slice(0, 255)
+
+            if rule.domain is not None:
+                error = pl.when(
+                    raw.is_null()
+                ).then(
+                    pl.lit(None if rule.allow_null else 'literal_error', dtype=pl.String)
+                ).when(
+                    ~value.is_in(rule.domain)
+                ).then(
+                    pl.lit('literal_error')
+                ).otherwise(null_error)
+                value = value.str.to_uppercase()
+            else:
+                error = pl.when(raw.is_null() & pl.lit(not rule.allow_null)).then(pl.lit('string_type')).otherwise(null_error)
+
+                if rule.upper_case:
+                    value = value.str.to_uppercase()
+
+        elif rule.dtype in ['double', 'integer']:
+            if dtype.is_numeric() or (dtype == pl.Null):
+                raw = pl.col(source)
+                parsed = raw.cast(pl.Float64)
+            else:
+                text = raw.str.strip_chars()
+
+                if python_number and (rule.dtype == 'double'):
+                    # Underscore is accepted as digit separator, e.g. 1_000.
+                    text = pl.when(
+                        text.str.contains(INVALID_UNDERSCORE_RE)
+                    ).then(
+                        text
+                    ).otherwise(
+                        text.str.replace_all('_', '', literal=True)
+                    )
+
+                parsed = text.cast(pl.Float64, strict=False)
+
+                # Integer is parsed with Python float by the Pydantic model, which also accepts underscore
+                # between digits and non-ASCII digits.
+                if python_number and (rule.dtype == 'integer'):
+                    parsed = parsed.fill_null(
+                        pl.when(parsed.is_null()).then(raw).map_batches(self._float, return_dtype=pl.Float64)
+                    )
+
+            if rule.dtype == 'integer':
+                value = pl.when(parsed.is_finite()).then(parsed.round(0)).cast(pl.Int64)
+                parse_error = raw.is_not_null() & ~parsed.is_finite().fill_null(False)
+                type_error = 'int_type'
+            else:
+                value = parsed
+                parse_error = raw.is_not_null() & parsed.is_null()
+                type_error = 'float_type'
+
+            error = pl.when(
+                raw.is_null()
+            ).then(
+                pl.lit(None if rule.allow_null else type_error, dtype=pl.String)
+            ).when(
+                parse_error
+            ).then(
+                pl.lit('int_parsing' if rule.dtype == 'integer' else 'float_parsing')
+            ).otherwise(
+                self._range_error(rule, value)
+            )
+
+            # Review error is bypassed, the value is kept.
+            if rule.review and self.ignore_review_err:
+                error = null_error
+
+        else:
+            value = raw.map_batches(
+                lambda s: self._strptime(s, rule.strptime),
+                return_dtype=pl.Datetime('us')
+            )
+            error = pl.when(value.is_null()).then(pl.lit('datetime_parsing')).otherwise(null_error)
+
+        return [value.alias(rule.name), error.alias(f"{rule.name}__error")]
+
+    def _float(self, s: pl.Series) -> pl.Series:
+        """
+        Parse numeric string with Python float, parsed once for every unique value.
+        """
+        parsed = dict()
+
+        for v in s.unique().drop_nulls():
+            try:
+                parsed[v] = float(v)
+            except ValueError:
+                continue
+
+        return s.replace_strict(parsed, default=None, return_dtype=pl.Float64)
+
+    def _strptime(self, s: pl.Series, fmt: str) -> pl.Series:
+        """
+        Parse date string with Python strptime, parsed once for every unique value.
+        """
+        parsed = dict()
+
+        for v in s.unique().drop_nulls():
+            try:
+                parsed[v] = dt.strptime(v, fmt)
+            except ValueError:
+                continue
+
+        return s.replace_strict(parsed, default=None, return_dtype=pl.Datetime('us'))
+
+    def _message(self, rule: ColumnRule, error_type: str, raw, value, context: Optional[tuple]) -> tuple:
+        """
+        Error type and message, same as the Pydantic model.
+        """
+        if error_type == 'missing':
+            return error_type, f"Data input tidak memiliki {rule.name}"
+
+        if error_type == 'datetime_parsing':
+            if rule.dtype == 'date':
+                return error_type, f'Tanggal {raw} tidak sesuai dengan format dd/mm/yyyy.'
+            else:
+                return error_type, f'Timestamp {raw} tidak sesuai dengan format dd/mm/yyyy HH:MM:SS.'
+
+        if (error_type in RANGE_ERRORS) and rule.review:
+            msg = CUSTOM_ERROR_MSG[error_type].format(rule.name, raw)
+
+            if context is not None:
+                msg = msg + f" Pada segmen {context[0]}-{context[1]} {context[2]}"
+
+            return error_type + '_review', msg
+
+        # Input value after the before validator, integer is already rounded.
+        if (rule.dtype == 'integer') and (error_type in RANGE_ERRORS):
+            input_value = value
+        elif rule.dtype == 'string':
+            input_value = raw if raw is None else raw[:255]
+        else:
+            input_value = raw
+
+        return error_type, CUSTOM_ERROR_MSG[error_type].format(rule.name, error_value(input_value))
+
+    def errors(self, df: pl.DataFrame) -> tuple:
+        """
+        Validate the input DataFrame. Return the typed DataFrame and DataFrame of errors (row, column, type and msg),
+        sorted by row and column order.
+        """
+        exprs = []
+        sources = dict()
+
+        for rule in self.rules:
+            source = self._source(rule, df.columns)
+            sources[rule.name] = source
+
+            if source is None:
+                exprs.extend([
+                    pl.lit(None, dtype=pl.String).alias(rule.name),
+                    pl.lit('missing').alias(f"{rule.name}__error")
+                ])
+            else:
+                exprs.extend(self._column_exprs(rule, source, df.schema[source]))
+
+        checked = df.select(exprs)
+
+        # Number with underscore or non-ASCII digit could be accepted by the Pydantic model.
+        # Column with parsing error is validated again with the Pydantic number syntax.
+        reparse = [
+            rule for rule in self.rules
+            if (rule.dtype in ['double', 'integer']) and (sources[rule.name] is not None)
+            and (checked[f"{rule.name}__error"].null_count() != checked.height)
+            and checked[f"{rule.name}__error"].is_in(['int_parsing', 'float_parsing']).any()
+        ]
+
+        if len(reparse) != 0:
+            checked = checked.with_columns(
+                df.select([
+                    expr for rule in reparse
+                    for expr in self._column_exprs(rule, sources[rule.name], df.schema[sources[rule.name]], python_number=True)
+                ])
+            )
+
+        typed = checked.select([rule.name for rule in self.rules])
+
+        error_frames = []
+
+        for idx, rule in enumerate(self.rules):
+            error_col = f"{rule.name}__error"
+
+            if checked[error_col].null_count() == checked.height:
+                continue
+
+            source = sources[rule.name]
+            raw = None if source is None else df[source].cast(pl.String)
+
+            error_frames.append(
+                pl.DataFrame({
+                    'row': pl.int_range(0, df.height, dtype=pl.Int64, eager=True),
+                    'col_idx': pl.repeat(idx, df.height, dtype=pl.Int64, eager=True),
+                    'type': checked[error_col],
+                    'raw': pl.repeat(None, df.height, dtype=pl.String, eager=True) if source is None else raw,
+                    'value': checked[rule.name].cast(pl.String)
+                }).filter(
+                    pl.col('type').is_not_null()
+                )
+            )
+
+        if len(error_frames) == 0:
+            return typed, pl.DataFrame(schema=ERROR_SCHEMA)
+
+        error_rows = pl.concat(error_frames).sort(['row', 'col_idx'])
+        messages = []
+
+        for row, col_idx, error_type, raw, value in error_rows.iter_rows():
+            rule = self.rules[col_idx]
+            messages.append(
+                (row, rule.name) + self._message(rule, error_type, raw, self._typed_value(typed, rule, row, value), self._context(checked, col_idx, row))
+            )
+
+        return typed, pl.DataFrame(
+            messages,
+            schema=ERROR_SCHEMA,
+            orient='row'
+        )
+
+    def _typed_value(self, typed: pl.DataFrame, rule: ColumnRule, row: int, value):
+        if (rule.dtype == 'integer') and (value is not None):
+            return typed[rule.name][row]
+
+        return value
+
+    def _context(self, checked: pl.DataFrame, col_idx: int, row: int) -> Optional[tuple]:
+        """
+        Segment context (FROM_STA, TO_STA and LANE_CODE) of the row, only available if the context columns
+        are validated before the column and have valid non-null value.
+        """
+        names = [rule.name for rule in self.rules[:col_idx]]
+        context = []
+
+        if not self.rules[col_idx].review:
+            return None
+
+        for name in SEGMENT_CONTEXT:
+            if (name not in names) or (checked[f"{name}__error"][row] is not None) or (checked[name][row] is None):
+                return None
+
+            context.append(checked[name][row])
+
+        return tuple(context)
+
+    def validation_error(self, errors: pl.DataFrame) -> ValidationError:
+        """
+        Create Pydantic ValidationError from DataFrame of errors.
+        """
+        return ValidationError.from_exception_data(
+            title='validation_error',
+            line_errors=[
+                InitErrorDetails(
+                    type=PydanticCustomError(error_type, msg),
+                    loc=(row, column),
+                    input=dict(input=None)
+                )
+                for row, column, error_type, msg in errors.iter_rows()
+            ]
+        )
+
+    def validate(self, df: pl.DataFrame) -> pl.DataFrame:
+        """
+        Validate the input DataFrame and return the typed DataFrame. Raise Pydantic ValidationError if any error exists.
+        """
+        typed, errors = self.errors(df)
+
+        if errors.is_empty():
+            return typed
+
+        raise self.validation_error(errors)
+
+    def parse(self, df: pl.DataFrame) -> tuple:
+        """
+        Validate the input DataFrame in a single pass. Return the typed DataFrame and DataFrame of review errors,
+        values with review error are kept in the typed DataFrame.
+        Raise Pydantic ValidationError containing all errors (including review errors) if any non-review error exists.
+        """
+        typed, errors = self.errors(df)
+
+        if errors.filter(pl.col('type').str.ends_with('_review').not_()).is_empty():
+            return typed, errors
+
+        raise self.validation_error(errors)
@@ -0,0 +1,93 @@
+import os
+from threading import Lock
+from typing import Callable, Iterable
+
+
+class SchemaRegistry(object):
+    """
+    Process-level registry of compiled schema. Compiled schema (Pydantic model, Pyarrow schema, validators
+    and the validation engine) is keyed by the config file path, file modification time and ignore review flag,
+    so the config is only parsed and the model is only created once until the config file is modified.
+    Schema variants (popup, superstructure only) have their own config file.
+    """
+    def __init__(self):
+        self._compiled = dict()
+        self._lock = Lock()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+
+    def key(self, file_path: str, ignore_review_err: bool) -> tuple:
+        """
+        Registry key of a schema config file.
+        """
+        return (os.path.abspath(file_path), os.stat(file_path).st_mtime_ns, bool(ignore_review_err))
+
+    def get(self, file_path: str, ignore_review_err: bool, compile: Callable[[], dict]) -> dict:
+        """
+        Return compiled schema attributes, compile the schema if it is not in the registry.
+        """
+        key = self.key(file_path, ignore_review_err)
+
+        with self._lock:
+            compiled = self._compiled.get(key)
+
+            if compiled is not None:
+                self._hits += 1
+                return compiled
+
+            self._misses += 1
+            compiled = compile()
+
+            # Remove the compiled schema of the previous config file version.
+            for old_key in [_ for _ in self._compiled if _[0] == key[0] and _[2] == key[2]]:
+                self._compiled.pop(old_key)
+
+            self._compiled[key] = compiled
+
+            return compiled
+
+    def warm_up(self, schemas: Iterable[Callable], ignore_review_err: Iterable[bool] = (False, True)):
+        """
+        Compile the schema before the first request. Schemas are schema class or function which accepts
+        ignore_review_err argument.
+        """
+        for schema in schemas:
+            for ignore in ignore_review_err:
+                schema(ignore_review_err=ignore)
+
+        return self
+
+    def clear(self):
+        """
+        Remove all compiled schema and reset the statistics.
+        """
+        with self._lock:
+            self._compiled = dict()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def stats(self) -> dict:
+        """
+        Registry statistics.
+        """
+        with self._lock:
+            return {
+                'compiled': len(self._compiled),
+                'hits': self._hits,
+                'misses': self._misses
+            }
+
+
+_registry = SchemaRegistry()
+
+
+def schema_registry() -> SchemaRegistry:
+    """
+    Return process-level schema registry.
+    """
+    return _registry
@@ -0,0 +1,270 @@
+import numpy as np
+import polars as pl
+
+
+class SegmentIntervalIndex(object):
+    """
+    Sorted interval index of segment events. Rows are grouped by route and lane, and sorted by FROM and TO STA
+    inside each group. FROM STA, TO STA and the row number of the events DataFrame are stored as NumPy arrays,
+    so gap, overlap and duplicate query is a linear scan and point-in-segment query is a searchsorted call.
+    Rows are also ordered by route, FROM STA and TO STA for the centerline segment (all lanes) query.
+    """
+    def __init__(
+            self,
+            df: pl.DataFrame,
+            linkid_col: str = 'LINKID',
+            from_sta_col: str = 'FROM_STA',
+            to_sta_col: str = 'TO_STA',
+            lane_code_col: str = 'LANE_CODE'
+        ):
+        self._linkid_col = linkid_col
+        self._from_sta_col = from_sta_col
+        self._to_sta_col = to_sta_col
+        self._lane_code_col = lane_code_col
+
+        keys = df.select(
+            linkid_col,
+            from_sta_col,
+            to_sta_col,
+            lane_code_col
+        ).with_row_index(
+            '_row'
+        )
+
+        # Lane groups
+        lane_sorted = keys.sort([linkid_col, lane_code_col, from_sta_col, to_sta_col], maintain_order=True)
+        lane_start = self._group_start(lane_sorted, [linkid_col, lane_code_col])
+
+        self.rows = lane_sorted['_row'].to_numpy().astype(np.int64)
+        self.from_sta = lane_sorted[from_sta_col].to_numpy()
+        self.to_sta = lane_sorted[to_sta_col].to_numpy()
+        self.offsets = np.append(np.flatnonzero(lane_start), len(self.rows))
+        self.group = np.cumsum(lane_start) - 1
+        self.routes = lane_sorted[linkid_col].filter(lane_start).to_numpy()
+        self.lanes = lane_sorted[lane_code_col].filter(lane_start).to_numpy()
+
+        # TO STA sorted independently inside every lane group.
+        self.sorted_to_sta = self.to_sta[np.lexsort((self.to_sta, self.group))]
+
+        # Centerline segment groups, rows inside a segment are kept in the DataFrame order.
+        segment_sorted = keys.sort([linkid_col, from_sta_col, to_sta_col], maintain_order=True)
+        segment_start = self._group_start(segment_sorted, [linkid_col, from_sta_col, to_sta_col])
+
+        self.segment_rows = segment_sorted['_row'].to_numpy().astype(np.int64)
+        self.segment_offsets = np.append(np.flatnonzero(segment_start), len(self.segment_rows))
+        self.segment = np.cumsum(segment_start) - 1
+        self._segment_keys = segment_sorted.filter(segment_start).select(linkid_col, from_sta_col, to_sta_col)
+        self._segment_lanes = segment_sorted[lane_code_col].to_numpy()
+
+    @staticmethod
+    def _group_start(df: pl.DataFrame, columns: list) -> np.ndarray:
+        """
+        Boolean array, True if the row is the first row of a group in the sorted DataFrame.
+        """
+        return df.select(
+            pl.any_horizontal(
+                [pl.col(_col).ne_missing(pl.col(_col).shift()) for _col in columns]
+            ).fill_null(True)
+        ).to_series().to_numpy()
+
+    @staticmethod
+    def _equal(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Element-wise equality, null (NaN) is equal to null.
+        """
+        if a.dtype.kind == 'f':
+            return (a == b) | (np.isnan(a) & np.isnan(b))
+
+        return a == b
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def n_groups(self) -> int:
+        """
+        Number of route and lane group.
+        """
+        return len(self.offsets) - 1
+
+    @property
+    def n_segments(self) -> int:
+        """
+        Number of centerline segment.
+        """
+        return len(self.segment_offsets) - 1
+
+    def _lane_frame(self, group: np.ndarray, **columns) -> pl.DataFrame:
+        """
+        DataFrame of route and lane of the groups, with additional columns.
+        """
+        return pl.DataFrame(
+            {
+                self._linkid_col: pl.Series(self.routes[group], dtype=pl.String),
+                self._lane_code_col: pl.Series(self.lanes[group], dtype=pl.String),
+                **columns
+            }
+        )
+
+    def gaps(self) -> pl.DataFrame:
+        """
+        Measurement gap in every lane, from the TO STA of a segment to the FROM STA of the next segment.
+        """
+        next_ = np.flatnonzero(
+            (self.group[1:] == self.group[:-1]) &
+            (self.sorted_to_sta[:-1] < self.from_sta[1:])
+        )
+
+        return self._lane_frame(
+            self.group[next_],
+            **{
+                self._from_sta_col: self.sorted_to_sta[next_],
+                self._to_sta_col: self.from_sta[next_ + 1]
+            }
+        )
+
+    def overlaps(self) -> pl.DataFrame:
+        """
+        Segments which overlap the next segment in the same lane, with the overlapped segment
+        OVERLAPPED_FROM and OVERLAPPED_TO STA.
+        """
+        next_ = np.flatnonzero(
+            (self.group[1:] == self.group[:-1]) &
+            (self.to_sta[:-1] > self.from_sta[1:])
+        )
+
+        return self._lane_frame(
+            self.group[next_],
+            **{
+                self._from_sta_col: self.from_sta[next_],
+                self._to_sta_col: self.to_sta[next_],
+                'OVERLAPPED_FROM': self.from_sta[next_ + 1],
+                'OVERLAPPED_TO': self.to_sta[next_ + 1]
+            }
+        )
+
+    def duplicates(self) -> np.ndarray:
+        """
+        Row number of duplicated segments (same route, lane, FROM and TO STA), one row for every duplicated segment.
+        """
+        duplicated = (
+            (self.group[1:] == self.group[:-1]) &
+            self._equal(self.from_sta[1:], self.from_sta[:-1]) &
+            self._equal(self.to_sta[1:], self.to_sta[:-1])
+        )
+
+        # First row of every duplicated run.
+        first = duplicated & np.append(True, ~duplicated[:-1])
+
+        return self.rows[np.flatnonzero(first)]
+
+    def coverage(self) -> pl.DataFrame:
+        """
+        Covered length (union of segments interval, in STA unit) of every lane.
+        """
+        length = np.zeros(self.n_groups)
+
+        for group in range(self.n_groups):
+            start, end = self.offsets[group], self.offsets[group+1]
+            from_sta = self.from_sta[start:end].astype(np.float64)
+            reach = np.maximum.accumulate(self.to_sta[start:end].astype(np.float64))
+            prev_reach = np.append(-np.inf, reach[:-1])
+
+            length[group] = np.clip(
+                self.to_sta[start:end] - np.maximum(from_sta, prev_reach), 0, None
+            ).sum()
+
+        return self._lane_frame(np.arange(self.n_groups), length=length)
+
+    def extents(self) -> pl.DataFrame:
+        """
+        Smallest FROM STA, largest TO STA and segment count of every lane.
+        """
+        if self.n_groups == 0:
+            return self._lane_frame(
+                np.arange(0),
+                **{
+                    self._from_sta_col: self.from_sta,
+                    self._to_sta_col: self.to_sta,
+                    'count': np.arange(0)
+                }
+            )
+
+        starts = self.offsets[:-1]
+
+        return self._lane_frame(
+            np.arange(self.n_groups),
+            **{
+                self._from_sta_col: np.minimum.reduceat(self.from_sta, starts),
+                self._to_sta_col: np.maximum.reduceat(self.to_sta, starts),
+                'count': np.diff(self.offsets)
+            }
+        )
+
+    def locate(self, route: str, lane: str, sta: np.ndarray) -> np.ndarray:
+        """
+        Row number of the segment which contains the STA (FROM STA <= STA <= TO STA) in the route and lane.
+        If there are multiple segments, then the segment with the largest FROM STA is returned. -1 if STA is not
+        located in any segment.
+        """
+        sta = np.atleast_1d(np.asarray(sta))
+        group = np.flatnonzero((self.routes == route) & (self.lanes == lane))
+
+        if len(group) == 0:
+            return np.full(len(sta), -1)
+
+        start, end = self.offsets[group[0]], self.offsets[group[0]+1]
+        pos = np.searchsorted(self.from_sta[start:end], sta, side='right') - 1
+        found = (pos >= 0) & (sta <= self.to_sta[start:end][np.clip(pos, 0, None)])
+
+        return np.where(found, self.rows[start:end][np.clip(pos, 0, None)], -1)
+
+    def segment_n_unique(self, values: pl.Series) -> np.ndarray:
+        """
+        Number of unique non-null values in every centerline segment. Values are aligned with the events rows.
+        """
+        codes = values.rank('dense').fill_null(0).to_numpy()[self.segment_rows]
+        order = np.lexsort((codes, self.segment))
+        codes, segment = codes[order], self.segment[order]
+
+        new = (codes > 0) & np.append(
+            True,
+            (segment[1:] != segment[:-1]) | (codes[1:] != codes[:-1])
+        )
+
+        return np.bincount(segment[new], minlength=self.n_segments)
+
+    def segment_sequence_gap(self, values: pl.Series, max_step: int = 1) -> np.ndarray:
+        """
+        Boolean array, True if the sorted sequence values (e.g. lane number) inside a centerline segment
+        has a step larger than max_step. Values are aligned with the events rows.
+        """
+        valid = values.is_not_null().to_numpy()[self.segment_rows]
+        seq = values.fill_null(0).to_numpy()[self.segment_rows]
+        order = np.lexsort((seq, ~valid, self.segment))
+        seq, segment, valid = seq[order], self.segment[order], valid[order]
+
+        gap = (
+            (segment[1:] == segment[:-1]) &
+            valid[1:] & valid[:-1] &
+            (seq[1:] - seq[:-1] > max_step)
+        )
+
+        return np.bincount(segment[1:][gap], minlength=self.n_segments) > 0
+
+    def segment_frame(self, segment: np.ndarray = None, **columns) -> pl.DataFrame:
+        """
+        DataFrame of centerline segments route, FROM STA, TO STA and the list of lanes, with additional columns.
+        """
+        if segment is None:
+            segment = np.arange(self.n_segments)
+
+        lanes = [
+            self._segment_lanes[self.segment_offsets[_]:self.segment_offsets[_+1]].tolist()
+            for _ in segment
+        ]
+
+        return self._segment_keys[segment].with_columns(
+            pl.Series(self._lane_code_col, lanes, dtype=pl.List(pl.String)),
+            *[pl.Series(name, values[segment]) for name, values in columns.items()]
+        )
@@ -1,5 +1,6 @@
 import pyarrow as pa
 import polars as pl
+import numpy as np
 from .schema import RouteSegmentEventSchema
 from pydantic import TypeAdapter
 from typing import List, Literal, Union, Type, Tuple
@@ -7,7 +8,9 @@ from ...geometry import Points
 from ...geometry import LAMBERT_WKT
 from .dto import Segment, CenterlineSegment, OverlappingSegment
 from .utils import to_meter
-from functools import cached_property
+from .index import SegmentIntervalIndex
+from ...schema.engine import ERROR_SCHEMA
+from ...utils.memo import df_cached_property
 
 
 class RouteSegmentEvents(object):
@@ -22,6 +25,7 @@ class RouteSegmentEvents(object):
         linkid: str | list = 'ALL', 
         linkid_col: str = 'LINKID',
         ignore_review = False,
+        collect_review = False,
         data_year: int = None,
         data_semester: int = None,
         segment_length: float = 0.1
@@ -30,22 +34,9 @@ class RouteSegmentEvents(object):
         Parse data from Excel file to Arrow format.
         """
         schema = RouteSegmentEventSchema(config_path=config_path, ignore_review_err=ignore_review)
-        df_str = pl.read_excel(
-            excel_path, 
-            engine='calamine',
-            infer_schema_length=None
-            ).rename(
-                str.upper
-            ).cast(
-                pl.String  # Cast all values into string for Pydantic validation.
-            )
 
-        # Validate using Pydantic
-        ta = TypeAdapter(List[schema.model])
-        df = pl.DataFrame(
-            ta.validate_python(df_str.to_dicts()),
-            infer_schema_length=None
-        )
+        # Validate and cast into typed DataFrame
+        df, review_errors = schema.parse_excel(excel_path, schema.read_excel, collect_review=collect_review)
 
         if linkid == 'ALL':
             pass
@@ -61,7 +52,8 @@ class RouteSegmentEvents(object):
             route=linkid,
             segment_length=segment_length,
             data_year=data_year,
-            data_semester=data_semester
+            data_semester=data_semester,
+            review_errors=review_errors
         )
     
     def __init__(
@@ -73,7 +65,9 @@ class RouteSegmentEvents(object):
             data_semester: Literal[1,2] = None,
             is_semester_data: bool = None,
             sta_unit: str = 'dm',
-            is_partial: bool = False
+            is_partial: bool = False,
+            review_errors: pl.DataFrame = None,
+            geometry: bool = True
         ):
         # Columns
         self._linkid_col = 'LINKID'
@@ -94,6 +88,7 @@ class RouteSegmentEvents(object):
         self.artable = artable
         self._pl_df = pl.from_arrow(self.artable)
         self._is_partial: bool = is_partial
+        self._review_errors = review_errors
         self._route_id = route  # Route of the events
         self._lane_data = True  # Indicator if the events data is lane based
         self._data_year = data_year
@@ -101,35 +96,10 @@ class RouteSegmentEvents(object):
         self._is_semester_data = is_semester_data if is_semester_data is not None else (data_semester is not None)
         self._segment_length = segment_length
 
-        if (self.pl_df.get_column(self._long_col, default=None) is None) or (self.pl_df.get_column(self._lat_col, default=None) is None):
-            self._points_4326 = None
-            self._points_lambert = None
-        else:
-            # Points geometry
-            self._points_4326 = Points(
-                self._pl_df.select([
-                    self._linkid_col,
-                    self._from_sta_col,
-                    self._to_sta_col,
-                    self._lane_code_col,
-                    self._long_col, 
-                    self._lat_col
-                ]),
-                long_col = self._long_col,
-                lat_col = self._lat_col,
-                wkt='EPSG:4326',
-                ids_column = [
-                    self._linkid_col,
-                    self._from_sta_col,
-                    self._to_sta_col,
-                    self._lane_code_col
-                ]
-            )
-
-            self._points_lambert = self._points_4326.transform(
-                LAMBERT_WKT, 
-                invert = True
-            )
+        # Points geometry, created on first access.
+        self._geometry = geometry
+        self._points_4326 = None
+        self._points_lambert = None
     
     @property
     def is_partial(self) -> bool:
@@ -138,6 +108,16 @@ class RouteSegmentEvents(object):
         """
         return self._is_partial
 
+    @property
+    def review_errors(self) -> pl.DataFrame:
+        """
+        Review errors (row, column, type and msg) collected while parsing the input data.
+        """
+        if self._review_errors is None:
+            return pl.DataFrame(schema=ERROR_SCHEMA)
+
+        return self._review_errors
+
     @property
     def no_data(self) -> bool:
         """
@@ -171,9 +151,112 @@ class RouteSegmentEvents(object):
     @property
     def pl_df(self) -> pl.DataFrame:
         return self._pl_df
+
+    @pl_df.setter
+    def pl_df(self, df: pl.DataFrame):
+        """
+        Replace the events data. Memoized statistics, interval index and geometry are recomputed on next access.
+        """
+        self._pl_df = df
+        self.artable = df.to_arrow()
+        self._points_4326 = None
+        self._points_lambert = None
+
+    @df_cached_property
+    def stats(self) -> dict:
+        """
+        Events statistics (row count, min/max STA, lanes and the last segment), computed in a single select
+        on first access and recomputed when the events data is replaced.
+        """
+        from_sta = pl.col(self._from_sta_col)
+        to_sta = pl.col(self._to_sta_col)
+
+        exprs = dict(
+            row_count=pl.len(),
+            min_from_sta=from_sta.min(),
+            max_from_sta=from_sta.max(),
+            min_to_sta=to_sta.min(),
+            max_to_sta=to_sta.max(),
+            last_segment_row=pl.arg_where(
+                (from_sta == from_sta.max()) & (to_sta == to_sta.max())
+            ).first(),
+            last_segment_to_sta=to_sta.filter(from_sta == from_sta.max()).unique().implode()
+        )
+
+        if self._lane_code_col in self.pl_df.columns:
+            exprs['lanes'] = pl.col(self._lane_code_col).unique().implode()
+
+        return self.pl_df.select(**exprs).row(0, named=True)
+
+    @df_cached_property
+    def lane_extents(self) -> pl.DataFrame:
+        """
+        Smallest FROM STA, largest TO STA and segment count of every lane.
+        """
+        return self.interval_index.extents()
+
+    @df_cached_property
+    def interval_index(self) -> SegmentIntervalIndex:
+        """
+        Sorted interval index of the segments, created once on first access.
+        """
+        return SegmentIntervalIndex(
+            self.pl_df,
+            linkid_col=self._linkid_col,
+            from_sta_col=self._from_sta_col,
+            to_sta_col=self._to_sta_col,
+            lane_code_col=self._lane_code_col
+        )
     
+    def has_geometry(self) -> bool:
+        """
+        Return True if the events has coordinate columns and the geometry is not skipped.
+        """
+        return (
+            self._geometry and
+            (self.pl_df.get_column(self._long_col, default=None) is not None) and
+            (self.pl_df.get_column(self._lat_col, default=None) is not None)
+        )
+
+    @property
+    def points_4326(self) -> Points:
+        """
+        Points object, None if the events does not have geometry.
+        """
+        if (self._points_4326 is None) and self.has_geometry():
+            self._points_4326 = Points(
+                self.pl_df.select([
+                    self._linkid_col,
+                    self._from_sta_col,
+                    self._to_sta_col,
+                    self._lane_code_col,
+                    self._long_col, 
+                    self._lat_col
+                ]),
+                long_col = self._long_col,
+                lat_col = self._lat_col,
+                wkt='EPSG:4326',
+                ids_column = [
+                    self._linkid_col,
+                    self._from_sta_col,
+                    self._to_sta_col,
+                    self._lane_code_col
+                ]
+            )
+
+        return self._points_4326
+
     @property
-    def points_lambert(self):
+    def points_lambert(self) -> Points:
+        """
+        Transformed Points object using LAMBERT WKT, None if the events does not have geometry.
+        """
+        if (self._points_lambert is None) and (self.points_4326 is not None):
+            self._points_lambert = self.points_4326.transform(
+                LAMBERT_WKT, 
+                invert = True
+            )
+
         return self._points_lambert
     
     @property
@@ -181,7 +264,7 @@ class RouteSegmentEvents(object):
         """
         Return all available lanes.
         """
-        return self.pl_df[self._lane_code_col].unique().to_list()
+        return list(self.stats['lanes'])
     
     @property
     def seg_len_conversion(self) -> int:
@@ -216,15 +299,17 @@ class RouteSegmentEvents(object):
         
         self._segment_length = seg_len
     
-    @property
+    @df_cached_property
     def last_segment(self) -> Segment:
         """
         Return segment with the largest FROM_STA number.
         """
-        last_segment = self.pl_df.filter(
-            (pl.col(self._from_sta_col) == self.pl_df[self._from_sta_col].max()) &
-            (pl.col(self._to_sta_col) == self.pl_df[self._to_sta_col].max())
-        )
+        row = self.stats['last_segment_row']
+
+        if row is None:
+            last_segment = self.pl_df.clear()
+        else:
+            last_segment = self.pl_df.slice(row, 1)
         
         return self._segment_dto_mapper(last_segment)[0]
     
@@ -233,32 +318,35 @@ class RouteSegmentEvents(object):
         """
         Return the list of all TO STA value from the last segment.
         """
-        to_sta = self.pl_df.filter(
-            pl.col(self._from_sta_col).eq(self.max_from_sta)
-        )[self._to_sta_col].unique().to_list()
-
-        return to_sta
+        return list(self.stats['last_segment_to_sta'])
     
     @property
     def max_to_sta(self) -> int:
         """
         Return largest TO STA number.
         """
-        return self.pl_df[self._to_sta_col].max()
+        return self.stats['max_to_sta']
     
     @property
     def max_from_sta(self) -> int:
         """
         Return largets FROM STA number.
         """
-        return self.pl_df[self._from_sta_col].max()
+        return self.stats['max_from_sta']
     
     @property
     def min_from_sta(self) -> int:
         """
         Return smallest FROM STA number.
         """
-        return self.pl_df[self._from_sta_col].min()
+        return self.stats['min_from_sta']
+
+    @property
+    def row_count(self) -> int:
+        """
+        Return the number of rows.
+        """
+        return self.stats['row_count']
 
     @property
     def sta_unit(self) -> str:
@@ -328,61 +416,41 @@ class RouteSegmentEvents(object):
                 [self._from_sta_col, self._lane_code_col], descending=False
             )
     
-    def is_duplicate_segment(self) -> List[Segment]:
+    def is_duplicate_segment(self, as_df: bool = False) -> List[Segment] | pl.DataFrame:
         """
-        Return duplicate segment.
+        Return duplicate segment. If as_df is True, then return the segments as DataFrame.
         """
-        df = self.pl_df.filter(
-            self.pl_df.select(
-                [
-                    self._linkid_col,
-                    self._from_sta_col,
-                    self._to_sta_col,
-                    self._lane_code_col
-                ]
-            ).is_duplicated()
-        ).unique(
-            subset=[
-                self._linkid_col,
-                self._from_sta_col,
-                self._to_sta_col,
-                self._lane_code_col
-            ]
-        )
+        df = self.pl_df[self.interval_index.duplicates()]
 
-        return self._segment_dto_mapper(df, dump=True)
+        return self._segment_dto_mapper(df, dump=True, as_df=as_df)
     
-    def incorrect_lane_sequence(self) -> List[CenterlineSegment]:
+
+    def incorrect_lane_sequence(self, as_df: bool = False) -> List[CenterlineSegment] | pl.DataFrame:
         """
         Return segment with incorrect lane sequence. Segment lane should start from L1 or R1.
+        If as_df is True, then return the segments as DataFrame.
         """
-        df = self.pl_df.with_columns(
-            lane_seq=pl.col(self._lane_code_col).str.tail(1).cast(pl.Int16)
-        ).group_by(
-            [
-                self._linkid_col,
-                self._from_sta_col,
-                self._to_sta_col
-            ]
-        ).agg(
-            pl.col('lane_seq').
-            sort().
-            diff().
-            fill_null(1).
-            gt(1).
-            any(),
-            pl.col(self._lane_code_col)
-        ).filter(
-            pl.col('lane_seq')
+        index = self.interval_index
+        lane_seq = self.pl_df[self._lane_code_col].str.tail(1).cast(pl.Int16)
+
+        df = index.segment_frame(
+            np.flatnonzero(index.segment_sequence_gap(lane_seq))
         )
 
-        return self._csegment_dto_mapper(df, lanes_col=self._lane_code_col, dump=True)
+        return self._csegment_dto_mapper(df, lanes_col=self._lane_code_col, dump=True, as_df=as_df)
 
-    def incorrect_segment_length(self, tolerance=0) -> List[Segment]:
+
+    def incorrect_segment_length(
+            self,
+            tolerance=0,
+            as_df: bool = False,
+            lazy: bool = False
+        ) -> List[Segment] | pl.DataFrame | pl.LazyFrame:
         """
         Return segment with incorrect segment length. Exclude the last segment, because last segment could have short segment length.
+        If as_df is True, then return the segments as DataFrame, or LazyFrame if lazy is also True.
         """
-        df = self.pl_df.filter(
+        df = self.pl_df.lazy().filter(
             (pl.col(self._seg_len_col).gt(self._segment_length + tolerance)) |
             (
                 (pl.col(self._seg_len_col).lt(self._segment_length - tolerance)) &
@@ -391,15 +459,21 @@ class RouteSegmentEvents(object):
             )
         )
 
-        return self._segment_dto_mapper(df, additional_cols=[self._seg_len_col], dump=True)
+        return self._segment_dto_mapper(df, additional_cols=[self._seg_len_col], dump=True, as_df=as_df, lazy=lazy)
     
-    def incorrect_sta_diff(self, tolerance=0) -> List[Segment]:
+    def incorrect_sta_diff(
+            self,
+            tolerance=0,
+            as_df: bool = False,
+            lazy: bool = False
+        ) -> List[Segment] | pl.DataFrame | pl.LazyFrame:
         """
         Return segment with incorrect STA difference, compared to the stated segment length (segment length column).
+        If as_df is True, then return the segments as DataFrame, or LazyFrame if lazy is also True.
         """
         tolerance = tolerance*self.seg_len_conversion
 
-        df = self.pl_df.with_columns(
+        df = self.pl_df.lazy().with_columns(
             sta_diff=(pl.col(self._to_sta_col)-pl.col(self._from_sta_col))*self.sta_conversion
         ).filter(
             # Negative, means FROM_STA is larger than TO_STA
@@ -441,70 +515,35 @@ class RouteSegmentEvents(object):
             )
         )
         
-        return self._segment_dto_mapper(df, additional_cols=[self._seg_len_col], dump=True)
+        return self._segment_dto_mapper(df, additional_cols=[self._seg_len_col], dump=True, as_df=as_df, lazy=lazy)
     
-    def sta_gap(self) -> List[Segment]:
-        """
-        Return measurement gap in each lane.
-        """
-        df = self.pl_df.group_by(
-            [self._linkid_col, self._lane_code_col]
-        ).agg(
-            pl.col(self._from_sta_col),
-            pl.col(self._to_sta_col)
-        ).with_columns(
-            pl.col(self._from_sta_col).list.sort(descending=False),
-            pl.col(self._to_sta_col).list.sort(descending=False),
-            shifted_from = pl.col(self._from_sta_col).list.sort(descending=False).list.shift(-1)
-        ).explode(
-            pl.col(self._to_sta_col),
-            pl.col('shifted_from')
-        ).filter(
-            pl.col(self._to_sta_col) < pl.col('shifted_from')
-        ).select(
-            pl.col(self._linkid_col),
-            pl.col(self._lane_code_col),
-            pl.col(self._to_sta_col).alias(self._from_sta_col),
-            pl.col('shifted_from').alias(self._to_sta_col)
-        )
+    def sta_gap(self, as_df: bool = False) -> List[Segment] | pl.DataFrame:
+        """
+        Return measurement gap in each lane. If as_df is True, then return the gaps as DataFrame.
+        """
+        df = self.interval_index.gaps()
 
-        return self._segment_dto_mapper(df, dump=True)
+        return self._segment_dto_mapper(df, dump=True, as_df=as_df)
     
-    def overlapping_segments(self) -> List[OverlappingSegment]:
+
+    def overlapping_segments(self, as_df: bool = False) -> List[OverlappingSegment] | pl.DataFrame:
         """
-        Return segments which overlap other segment
+        Return segments which overlap other segment. If as_df is True, then return the segments as DataFrame
+        with the overlapped segment as struct column.
         """
-        df = self.pl_df.sort(
-            [
-                self._linkid_col,
-                self._from_sta_col,
-                self._to_sta_col
-            ]
-        ).group_by(
-            [self._linkid_col, self._lane_code_col]
-        ).agg(
-            pl.col(self._from_sta_col),
-            pl.col(self._to_sta_col)
-        ).with_columns(
-            pl.col(self._from_sta_col),
-            pl.col(self._to_sta_col),
-            shifted_from = pl.col(self._from_sta_col).list.shift(-1),
-            shifted_to = pl.col(self._to_sta_col).list.shift(-1)
-        ).explode(
-            pl.col(self._from_sta_col),
-            pl.col(self._to_sta_col),
-            pl.col('shifted_from'),
-            pl.col('shifted_to')
-        ).filter(
-            pl.col(self._to_sta_col) > pl.col('shifted_from')
-        ).select(
-            pl.col(self._linkid_col),
-            pl.col(self._lane_code_col),
-            pl.col(self._from_sta_col),
-            pl.col(self._to_sta_col),
-            pl.col('shifted_from'),
-            pl.col('shifted_to')
-        )
+        df = self.interval_index.overlaps()
+
+        if as_df:
+            return self._segment_dto_mapper(df, as_df=True).with_columns(
+                overlapped=pl.struct(
+                    self._segment_dto_mapper(
+                        df,
+                        from_sta_col='OVERLAPPED_FROM',
+                        to_sta_col='OVERLAPPED_TO',
+                        as_df=True
+                    )
+                )
+            )
 
         segment = self._segment_dto_mapper(
             df, 
@@ -513,8 +552,8 @@ class RouteSegmentEvents(object):
         
         overlapped = self._segment_dto_mapper(
             df,
-            from_sta_col='shifted_from',
-            to_sta_col='shifted_to'
+            from_sta_col='OVERLAPPED_FROM',
+            to_sta_col='OVERLAPPED_TO'
         )
 
         for i in range(len(segment)):
@@ -522,23 +561,26 @@ class RouteSegmentEvents(object):
 
         return segment
     
+
     def _segment_with_incorrect_value(
             self,
             column: str,
             true_filter: Union[Tuple[Literal['ge', 'gt', 'le', 'lt'], int]] = None,
-            dump: bool = True
-        ) -> Union[Type[Segment] | dict]:
+            dump: bool = True,
+            as_df: bool = False,
+            lazy: bool = False
+        ) -> Union[Type[Segment] | dict | pl.DataFrame | pl.LazyFrame]:
         """
         Return segments with incorrect value (true filter.not_()) from a column.
         """
-        error_ = self.pl_df.filter(
+        error_ = self.pl_df.lazy().filter(
             getattr(pl.col(column), true_filter[0])(true_filter[1]).not_()
         )
 
         if not dump:
-            return self._segment_dto_mapper(error_, additional_cols=[column])
+            return self._segment_dto_mapper(error_, additional_cols=[column], as_df=as_df, lazy=lazy)
         else:
-            return self._segment_dto_mapper(error_, additional_cols=[column], dump=True)
+            return self._segment_dto_mapper(error_, additional_cols=[column], dump=True, as_df=as_df, lazy=lazy)
     
     def segment_attribute_n_unique(
             self, 
@@ -549,17 +591,12 @@ class RouteSegmentEvents(object):
         """
         Return the unique value count of segment attributes.
         """
-        df = self.pl_df.group_by(
-            [
-                self._linkid_col,
-                self._from_sta_col,
-                self._to_sta_col
-            ]
-        ).agg(
-            pl.col(self._lane_code_col),
-            *[
-                pl.col(_col).drop_nulls().n_unique() for _col in columns
-            ]
+        index = self.interval_index
+
+        df = index.segment_frame(
+            **{
+                _col: index.segment_n_unique(self.pl_df[_col]) for _col in columns
+            }
         )
 
         if filter is not None:
@@ -586,17 +623,20 @@ class RouteSegmentEvents(object):
 
     def _segment_dto_mapper(
             self, 
-            df: pl.DataFrame, 
+            df: pl.DataFrame | pl.LazyFrame, 
             additional_cols: List[str] = [],
             linkid_col = None,
             from_sta_col = None,
             to_sta_col = None,
             lane_code_col = None,
             out_dto: Type[Segment] = Segment,
-            dump: bool = False
-        ) -> List[Type[Segment]] | dict:
+            dump: bool = False,
+            as_df: bool = False,
+            lazy: bool = False
+        ) -> List[Type[Segment]] | dict | pl.DataFrame | pl.LazyFrame:
         """
-        Map DataFrame rows into Segment DTO.
+        Map DataFrame rows into Segment DTO. If as_df is True, then return the renamed DataFrame without
+        creating the DTO, or the renamed LazyFrame if lazy is also True.
         """
         if linkid_col is None:
             linkid_col = self._linkid_col
@@ -610,7 +650,7 @@ class RouteSegmentEvents(object):
         if lane_code_col is None:
             lane_code_col = self._lane_code_col
 
-        df = df.select(
+        df = df.lazy().select(
             [
                 linkid_col,
                 from_sta_col,
@@ -630,7 +670,15 @@ class RouteSegmentEvents(object):
                 }
             )
         )
-        
+
+        if as_df and lazy:
+            return df
+
+        df = df.collect()
+
+        if as_df:
+            return df
+
         ta = TypeAdapter(List[out_dto])
 
         if not dump:
@@ -646,16 +694,19 @@ class RouteSegmentEvents(object):
     
     def _csegment_dto_mapper(
             self, 
-            df: pl.DataFrame, 
+            df: pl.DataFrame | pl.LazyFrame, 
             lanes_col: str = "LANE_CODE",
             additional_cols: List[str] = [],
             out_dto: Type[CenterlineSegment] = CenterlineSegment,
-            dump: bool = False
-        ) -> List[Type[CenterlineSegment]]:
+            dump: bool = False,
+            as_df: bool = False,
+            lazy: bool = False
+        ) -> List[Type[CenterlineSegment]] | pl.DataFrame | pl.LazyFrame:
         """
-        Map DataFrame rows into CenterlineSegment DTO.
+        Map DataFrame rows into CenterlineSegment DTO. If as_df is True, then return the renamed DataFrame without
+        creating the DTO, or the renamed LazyFrame if lazy is also True.
         """
-        df = df.select(
+        df = df.lazy().select(
             [
                 self._linkid_col,
                 self._from_sta_col,
@@ -676,6 +727,14 @@ class RouteSegmentEvents(object):
             )
         )
 
+        if as_df and lazy:
+            return df
+
+        df = df.collect()
+
+        if as_df:
+            return df
+
         ta = TypeAdapter(List[out_dto])
 
         if not dump:
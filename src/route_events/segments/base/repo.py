@@ -12,9 +12,10 @@ class RouteSegmentEventsRepo(object):
     def table(self):
         return self._table
 
-    def get_by_linkid(self, linkid: str) -> RouteSegmentEvents:
+    def get_by_linkid(self, linkid: str, geometry: bool = True) -> RouteSegmentEvents:
         """
-        Get route segment events based on linkid query.
+        Get route segment events based on linkid query. If geometry is False, then the events points geometry
+        is not created.
         """
         query = f"select * from {self.table} where linkid = '{linkid}'"
         df = pl.read_database(
@@ -25,5 +26,6 @@ class RouteSegmentEventsRepo(object):
 
         return RouteSegmentEvents(
             df.to_arrow(),
-            route=linkid
+            route=linkid,
+            geometry=geometry
         )
@@ -1,7 +1,5 @@
 from ..base import RouteSegmentEvents
 from ..base.schema import RouteSegmentEventSchema
-from pydantic import TypeAdapter
-from typing import List
 import os
 import polars as pl
 
@@ -18,6 +16,7 @@ class RoutePCI(RouteSegmentEvents):
         linkid: str,
         linkid_col: str = "LINKID",
         ignore_review: bool = False,
+        collect_review: bool = False,
         data_year: int = None,
         segment_length: float = 0.05,
     ):
@@ -31,18 +30,15 @@ class RoutePCI(RouteSegmentEvents):
             config_path=config_path, ignore_review_err=ignore_review
         )
 
-        df_str = pl.read_excel(
-            excel_path,
-            engine="calamine",
-            infer_schema_length=None,
-            read_options={"dtypes": "string"},
-        ).rename(str.upper)
+        def read(excel_path: str) -> pl.DataFrame:
+            return schema.read_excel(excel_path)
 
-        # Pydantic validation
-        ta = TypeAdapter(List[schema.model])
-        df = pl.DataFrame(
-            ta.validate_python(df_str.to_dicts()), infer_schema_length=None
-        ).filter(pl.col(linkid_col) == linkid)
+        # Validate and cast into typed DataFrame
+        df, review_errors = schema.parse_excel(
+            excel_path, read, collect_review=collect_review
+        )
+        if linkid != "ALL":
+            df = df.filter(pl.col(linkid_col) == linkid)
 
         return cls(
             artable=df.to_arrow(),
@@ -50,6 +46,7 @@ class RoutePCI(RouteSegmentEvents):
             segment_length=segment_length,
             data_year=data_year,
             is_semester_data=False,
+            review_errors=review_errors,
         )
 
     def __init__(self, *args, **kwargs):
@@ -150,12 +147,12 @@ class RoutePCI(RouteSegmentEvents):
         damages = self._as_damages + self._rg_damages
         return [self._dvol + damage for damage in damages]
 
-    def invalid_pci_value(self) -> pl.DataFrame:
+    def invalid_pci_value(self, lazy: bool = False) -> pl.DataFrame | pl.LazyFrame:
         """
-        Segment with invalid PCI value if compared to its damage columns.
+        Segment with invalid PCI value if compared to its damage columns. If lazy is True, then return LazyFrame.
         """
         segments = (
-            self.pl_df.select(
+            self.pl_df.lazy().select(
                 self._linkid_col,
                 self._from_sta_col,
                 self._to_sta_col,
@@ -215,12 +212,16 @@ class RoutePCI(RouteSegmentEvents):
             )
         )
 
-        return segments
+        if lazy:
+            return segments
+
+        return segments.collect()
 
-    def invalid_volume_with_severity(self) -> dict:
+    def invalid_volume_with_severity(self, as_df: bool = False, lazy: bool = False) -> dict | pl.DataFrame | pl.LazyFrame:
         """
         Segment with inconsistent volume and severity, segment should have 0/None volume
         and also NA/None severity. Segment with greater than 0 damage volume should have not None and not NA severity.
+        If as_df is True, then return the segments as DataFrame, or LazyFrame if lazy is also True.
         """
         ldf = []  # For storing lazyframes.
 
@@ -247,10 +248,12 @@ class RoutePCI(RouteSegmentEvents):
 
             ldf.append(col_error)
 
-        errors = pl.concat(ldf).collect()
+        errors = pl.concat(ldf)
 
         return self._segment_dto_mapper(
             errors,
             dump=True,
             additional_cols=["DAMAGE_COLUMN", "HAS_DAMAGE", "HAS_SEVERITY"],
+            as_df=as_df,
+            lazy=lazy
         )
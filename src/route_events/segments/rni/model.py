@@ -3,7 +3,6 @@ from ..base.schema import RouteSegmentEventSchema
 from .dto import TypeSidedColumnError, ValueSidedColumnError, CenterlineSegment
 from .road_type import _road_types as road_types
 from .surf_type import _surface_types as surface_types
-from pydantic import TypeAdapter
 from dataclasses import dataclass
 from typing import Literal, List, Union, Type
 import os
@@ -34,6 +33,7 @@ class RouteRNI(RouteSegmentEvents):
         linkid: str | list = 'ALL', 
         linkid_col: str = 'LINKID',
         ignore_review = False,
+        collect_review = False,
         data_year: int = None,
         filter: pl.Expr = None
     ):
@@ -48,33 +48,29 @@ class RouteRNI(RouteSegmentEvents):
             ignore_review_err=ignore_review
         )
 
-        df_str = pl.read_excel(
-            excel_path, 
-            engine='calamine',
-            infer_schema_length=None
-            ).rename(
-                str.upper
-            ).cast(
-                pl.String  # Cast all values into string for Pydantic validation.
-            )
+        metadata = {'is_partial': False}
 
-        if filter is not None:
-            filtered = df_str.filter(filter)
+        def read(excel_path: str) -> pl.DataFrame:
+            df_input = schema.read_excel(excel_path)
 
-            if not filtered.is_empty():
-                df_str = filtered
-                is_partial = True
-            else:
-                is_partial = False
-        else:
-            is_partial = False
+            if filter is not None:
+                filtered = df_input.filter(filter)
+
+                if not filtered.is_empty():
+                    df_input = filtered
+                    metadata['is_partial'] = True
 
-        # Validate using Pydantic
-        ta = TypeAdapter(List[schema.model])
-        df = pl.DataFrame(
-            ta.validate_python(df_str.to_dicts()),
-            infer_schema_length=None
+            return df_input
+
+        # Validate and cast into typed DataFrame
+        df, review_errors = schema.parse_excel(
+            excel_path,
+            read,
+            collect_review=collect_review,
+            cache_options=(filter,),
+            metadata=metadata
         )
+        is_partial = metadata['is_partial']
 
         if linkid == 'ALL':
             pass
@@ -91,7 +87,8 @@ class RouteRNI(RouteSegmentEvents):
             segment_length=segment_length,
             data_year=data_year,
             is_semester_data=False,
-            is_partial=is_partial
+            is_partial=is_partial,
+            review_errors=review_errors
         )
     
     def __init__(self, *args, **kwargs):
@@ -170,7 +167,7 @@ class RouteRNI(RouteSegmentEvents):
         else:
             return self._surf_types_map
     
-    def incorrect_side_columns(self, dump=True, survey_year: int | str = 'ALL') -> List[Type[CenterlineSegment]]:
+    def incorrect_side_columns(self, dump=True, survey_year: int | str = 'ALL', as_df: bool = False) -> List[Type[CenterlineSegment]] | pl.DataFrame:
         # Filter for survey year
         if survey_year == 'ALL':
             filter_ = True  # Select all
@@ -358,6 +355,23 @@ class RouteRNI(RouteSegmentEvents):
             {'col': 'column'}
         )
 
+        if as_df:
+            return self._csegment_dto_mapper(
+                error_rows,
+                lanes_col = 'lanes',
+                additional_cols = [
+                    'dir',
+                    'side',
+                    'column',
+                    'na',
+                    'wrong_side',
+                    'single_value',
+                    'type_column',
+                    'wrong_value_type'
+                ],
+                as_df=True
+            )
+
         value_sided_error_dto = self._csegment_dto_mapper(
             error_rows.filter(pl.col('type_column').is_not_null()),
             out_dto = ValueSidedColumnError,
@@ -392,10 +406,15 @@ class RouteRNI(RouteSegmentEvents):
 
         return value_sided_error_dto + type_sided_error_dto
     
-    def incorrect_road_type_spec(self, dump=True) -> List[Type[CenterlineSegment]]:
-        spec_df = pl.DataFrame(road_types)
-
-        error_rows = self.pl_df.group_by(
+    def incorrect_road_type_spec(
+            self,
+            dump=True,
+            as_df: bool = False,
+            lazy: bool = False
+        ) -> List[Type[CenterlineSegment]] | pl.DataFrame | pl.LazyFrame:
+        spec_df = pl.LazyFrame(road_types)
+
+        error_rows = self.pl_df.lazy().group_by(
             [
                 self._linkid_col,
                 self._from_sta_col,
@@ -436,12 +455,20 @@ class RouteRNI(RouteSegmentEvents):
                 'dir',
                 'median'
             ],
-            dump=dump
+            dump=dump,
+            as_df=as_df,
+            lazy=lazy
         )
 
         return dtos
     
-    def incorrect_inner_shoulder(self, dump=True, survey_year: int | str = 'ALL') -> List[Type[CenterlineSegment]]:
+    def incorrect_inner_shoulder(
+            self,
+            dump=True,
+            survey_year: int | str = 'ALL',
+            as_df: bool = False,
+            lazy: bool = False
+        ) -> List[Type[CenterlineSegment]] | pl.DataFrame | pl.LazyFrame:
         # Filter for survey year
         if survey_year == 'ALL':
             filter_ = True  # Select all
@@ -450,7 +477,7 @@ class RouteRNI(RouteSegmentEvents):
         else:
             raise ValueError("survey_year is neither an integer or 'ALL'")
         
-        error_rows = self.pl_df.filter(
+        error_rows = self.pl_df.lazy().filter(
             filter_
         ).group_by(
             [
@@ -485,13 +512,21 @@ class RouteRNI(RouteSegmentEvents):
                 'has_median',
                 'has_inner_sh'
             ],
-            dump=dump
+            dump=dump,
+            as_df=as_df,
+            lazy=lazy
         )
 
         return dtos
     
-    def incorrect_surface_width(self, width_delta: int = 2, dump=True) -> List[Type[CenterlineSegment]]:
-        error_rows = self.pl_df.group_by(
+    def incorrect_surface_width(
+            self,
+            width_delta: int = 2,
+            dump=True,
+            as_df: bool = False,
+            lazy: bool = False
+        ) -> List[Type[CenterlineSegment]] | pl.DataFrame | pl.LazyFrame:
+        error_rows = self.pl_df.lazy().group_by(
             [
                 self._linkid_col,
                 self._from_sta_col,
@@ -566,16 +601,21 @@ class RouteRNI(RouteSegmentEvents):
                 'lane_width_sum',
                 'surface_width'
             ],
-            dump=dump
+            dump=dump,
+            as_df=as_df,
+            lazy=lazy
         )
 
         return dtos
     
-    def incorrect_surf_year(self, dump=True) -> List[dict]:
+    def incorrect_surf_year(self, dump=True, as_df: bool = False, lazy: bool = False) -> List[dict] | pl.DataFrame | pl.LazyFrame:
         """
         Return segment with incorrect surface year (surface year which is greater than the data year).
+        If as_df is True, then return the segments as DataFrame, or LazyFrame if lazy is also True.
         """
         return self._segment_with_incorrect_value(
             self._surf_year_col, 
-            ('le', self._data_year)
+            ('le', self._data_year),
+            as_df=as_df,
+            lazy=lazy
         )
\ No newline at end of file
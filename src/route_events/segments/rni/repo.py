@@ -23,10 +23,12 @@ class RouteRNIRepo(object):
             year: int,
             columns: Union[str | List[str]] = '*',
             raise_if_table_does_not_exists: bool = False,
-            semester: Literal[1, 2] | Literal["latest"] = "latest"
+            semester: Literal[1, 2] | Literal["latest"] = "latest",
+            geometry: bool = True
     ) -> RouteRNI:
         """
-        Get RNI data from database and load it into RouteRNI object.
+        Get RNI data from database and load it into RouteRNI object. If geometry is False, then the events
+        points geometry is not created.
         """
         if type(year) is not int:
             raise TypeError("'year' is not integer.")
@@ -69,7 +71,8 @@ class RouteRNIRepo(object):
         return RouteRNI(
             artable=df.to_arrow(),
             route=linkid,
-            data_year=year
+            data_year=year,
+            geometry=geometry
         )
 
     def put(self, events: RouteRNI, year: int, semester: int):
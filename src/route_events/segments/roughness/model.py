@@ -1,7 +1,7 @@
 from ..base import RouteSegmentEvents
 from ..base.schema import RouteSegmentEventSchema
-from pydantic import TypeAdapter, BaseModel
-from typing import Literal, List
+from pydantic import BaseModel
+from typing import Literal
 import os
 import polars as pl
 
@@ -17,6 +17,7 @@ class RouteRoughness(RouteSegmentEvents):
         linkid: str | list = 'ALL', 
         linkid_col: str = 'LINKID',
         ignore_review = False,
+        collect_review = False,
         data_year: int = None,
         data_semester: Literal[1,2] = None
     ):
@@ -31,30 +32,27 @@ class RouteRoughness(RouteSegmentEvents):
             ignore_review_err=ignore_review
         )
 
-        df_str = pl.read_excel(
-            excel_path, 
-            engine='calamine',
-            infer_schema_length=None
-            ).rename(
-                str.upper
-            ).cast(
-                pl.String  # Cast all values into string for Pydantic validation.
-            )
-        
-        if linkid == 'ALL':
-            pass
-        elif (type(linkid) == str) and (linkid != 'ALL'):
-            df_str = df_str.filter(pl.col(linkid_col) == linkid)
-        elif type(linkid) == list:
-            df_str = df_str.filter(pl.col(linkid_col).str.is_in(linkid))
-        else:
+        if (type(linkid) != list) and (type(linkid) != str):
             raise TypeError(f"LINKID argument with type {type(linkid)} is invalid type.")
 
-        # Validate using Pydantic
-        ta = TypeAdapter(List[schema.model])
-        df = pl.DataFrame(
-            ta.validate_python(df_str.to_dicts()),
-            infer_schema_length=None
+        def read(excel_path: str) -> pl.DataFrame:
+            df_input = schema.read_excel(excel_path)
+            
+            if linkid == 'ALL':
+                pass
+            elif type(linkid) == str:
+                df_input = df_input.filter(pl.col(linkid_col) == linkid)
+            else:
+                df_input = df_input.filter(pl.col(linkid_col).str.is_in(linkid))
+
+            return df_input
+
+        # Validate and cast into typed DataFrame
+        df, review_errors = schema.parse_excel(
+            excel_path,
+            read,
+            collect_review=collect_review,
+            cache_options=(linkid, linkid_col)
         )
         
         return cls(
@@ -62,7 +60,8 @@ class RouteRoughness(RouteSegmentEvents):
             route=linkid,
             segment_length=segment_length,
             data_year=data_year,
-            data_semester=data_semester
+            data_semester=data_semester,
+            review_errors=review_errors
         )
 
     def __init__(self, *args, **kwargs):
@@ -1 +1,3 @@
 from .ora_dtype_adapter import ora_pl_dtype
+from .ddb import ddb_cursor, ddb_session, DuckDBSession
+from .parse_cache import ParseCache, ParsedInput, parse_cache, set_parse_cache
@@ -0,0 +1,119 @@
+import duckdb
+import os
+import time
+from threading import Lock
+from typing import Iterable
+
+
+# Extension repository, default to DuckDB core repository.
+EXTENSION_REPOSITORY = {
+    'h3': 'community'
+}
+
+
+class DuckDBSession(object):
+    """
+    Process-level DuckDB session. Every consumer gets its own cursor from a single in-memory database,
+    so the extensions are only installed and loaded once. Temporary tables are scoped to the cursor,
+    so concurrent consumers could use the same table name.
+    """
+    def __init__(self):
+        self._conn = None
+        self._pid = None
+        self._lock = Lock()
+
+        # Extension load time in seconds
+        self._load_time = dict()
+
+        # Statistics
+        self._cursors = 0
+        self._saved_load_time = 0.0
+
+    def _connection(self) -> duckdb.DuckDBPyConnection:
+        """
+        Database connection, recreated in forked process.
+        """
+        if (self._conn is None) or (self._pid != os.getpid()):
+            self._conn = duckdb.connect()
+            self._pid = os.getpid()
+            self._load_time = dict()
+
+        return self._conn
+
+    def _load(self, extension: str):
+        """
+        Install and load extension to the database.
+        """
+        start = time.perf_counter()
+        repository = EXTENSION_REPOSITORY.get(extension)
+
+        if repository is None:
+            self._conn.sql(f"install {extension}; load {extension};")
+        else:
+            self._conn.sql(f"install {extension} from {repository}; load {extension};")
+
+        self._load_time[extension] = time.perf_counter() - start
+
+    def cursor(self, extensions: Iterable[str] = ('spatial',)) -> duckdb.DuckDBPyConnection:
+        """
+        Return a new cursor with the extensions loaded.
+        """
+        with self._lock:
+            conn = self._connection()
+
+            for extension in extensions:
+                if extension in self._load_time:
+                    self._saved_load_time += self._load_time[extension]
+                else:
+                    self._load(extension)
+
+            self._cursors += 1
+
+            return conn.cursor()
+
+    def warm_up(self, extensions: Iterable[str] = ('spatial', 'h3')):
+        """
+        Load the extensions before any cursor is requested.
+        Extension which fails to load will be loaded again when a cursor requests it.
+        """
+        with self._lock:
+            self._connection()
+
+            for extension in extensions:
+                if extension in self._load_time:
+                    continue
+
+                try:
+                    self._load(extension)
+                except duckdb.Error:
+                    pass
+
+        return self
+
+    def stats(self) -> dict:
+        """
+        Session statistics.
+        """
+        with self._lock:
+            return {
+                'cursors': self._cursors,
+                'extension_load_time': dict(self._load_time),
+                'saved_load_time': self._saved_load_time
+            }
+
+
+_session = DuckDBSession()
+
+
+def ddb_session() -> DuckDBSession:
+    """
+    Return process-level DuckDB session.
+    """
+    return _session
+
+
+def ddb_cursor(extensions: Iterable[str] = ('spatial',)) -> duckdb.DuckDBPyConnection:
+    """
+    Return a new cursor from process-level DuckDB session with the extensions loaded.
+    """
+    return _session.cursor(extensions)
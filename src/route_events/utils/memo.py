@@ -0,0 +1,21 @@
+from functools import wraps
+from typing import Callable
+
+
+def df_cached_property(func: Callable):
+    """
+    Property which is computed once and cached until the events DataFrame (self._pl_df) is replaced.
+    """
+    cache_attr = f"_{func.__name__}_cache"
+
+    @wraps(func)
+    def getter(self):
+        cached = self.__dict__.get(cache_attr)
+
+        if (cached is None) or (cached[0] is not self._pl_df):
+            cached = (self._pl_df, func(self))
+            self.__dict__[cache_attr] = cached
+
+        return cached[1]
+
+    return property(getter)
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import time
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import tempfile
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Optional
+
+
+# Increment when the parsed output format changes, so older entries are not reused.
+CACHE_VERSION = 1
+
+# Review errors file without data file is removed after this age (in seconds), younger file could be
+# written by a running put.
+ORPHAN_AGE = 60
+
+
+@dataclass
+class ParsedInput(object):
+    """
+    Validated typed DataFrame and review errors of an input file.
+    """
+    data: pl.DataFrame
+    review_errors: pl.DataFrame
+    metadata: dict = field(default_factory=dict)
+
+
+def file_hash(file_path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Content hash of a file.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+class ParseCache(object):
+    """
+    Content-addressed cache of parsed input files. Entry is keyed by input file content hash, schema hash
+    and the parsing options, the typed DataFrame and review errors are stored as Parquet files on local disk.
+    Entries are evicted in LRU order (by file modification time) when the total size exceeds the maximum.
+    """
+    metadata_key = b'metadata'
+
+    def __init__(self, path: str, max_bytes: int = 2_000_000_000):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+
+        os.makedirs(path, exist_ok=True)
+
+    def key(self, file_path: str, schema_hash: str, ignore_review: bool, *options) -> str:
+        """
+        Cache key of an input file.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(
+            json.dumps([CACHE_VERSION, file_hash(file_path), schema_hash, bool(ignore_review), [str(_) for _ in options]]).encode()
+        )
+
+        return digest.hexdigest()
+
+    def _files(self, key: str) -> tuple:
+        return (
+            os.path.join(self.path, f"{key}.parquet"),
+            os.path.join(self.path, f"{key}.review.parquet")
+        )
+
+    def get(self, key: str) -> Optional[ParsedInput]:
+        """
+        Load the parsed input, return None if the key is not in the cache.
+        """
+        data_file, review_file = self._files(key)
+
+        try:
+            table = pq.read_table(data_file)
+            review_errors = pl.read_parquet(review_file)
+            os.utime(data_file)
+        except (OSError, pa.ArrowInvalid, pl.exceptions.PolarsError):
+            with self._lock:
+                self._misses += 1
+
+            return None
+
+        with self._lock:
+            self._hits += 1
+
+        return ParsedInput(
+            data=pl.from_arrow(table),
+            review_errors=review_errors,
+            metadata=json.loads(table.schema.metadata[self.metadata_key])
+        )
+
+    def put(self, key: str, parsed: ParsedInput):
+        """
+        Store the parsed input and evict the least recently used entries.
+        """
+        data_file, review_file = self._files(key)
+        table = parsed.data.to_arrow().replace_schema_metadata(
+            {self.metadata_key: json.dumps(parsed.metadata)}
+        )
+
+        # Review errors is written first, entry is only visible after the data file is written.
+        for target, write in [
+            (review_file, lambda tmp: parsed.review_errors.write_parquet(tmp)),
+            (data_file, lambda tmp: pq.write_table(table, tmp))
+        ]:
+            # Unique temporary file, the same key can be written by multiple threads or processes.
+            fd, tmp = tempfile.mkstemp(dir=self.path, prefix=f"{os.path.basename(target)}.", suffix='.tmp')
+            os.close(fd)
+
+            try:
+                write(tmp)
+                os.replace(tmp, target)
+            except BaseException:
+                os.remove(tmp)
+                raise
+
+        self.evict()
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the total size is below the maximum. Review errors file
+        is counted with its data file, review errors file without data file (orphan) older than ORPHAN_AGE is removed.
+        """
+        with self._lock:
+            files = dict()  # Key to modification time and size of the data and review errors file
+
+            for entry in os.scandir(self.path):
+                if entry.name.endswith('.review.parquet'):
+                    key, kind = entry.name[:-len('.review.parquet')], 'review'
+                elif entry.name.endswith('.parquet'):
+                    key, kind = entry.name[:-len('.parquet')], 'data'
+                else:
+                    continue
+
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+
+                files.setdefault(key, dict())[kind] = (stat.st_mtime, stat.st_size)
+
+            orphans = []
+            entries = []
+            total = 0
+            now = time.time()
+
+            for key, stats in files.items():
+                size = sum([_size for _, _size in stats.values()])
+                total += size
+
+                if 'data' in stats:
+                    entries.append((stats['data'][0], size, key))
+                elif now - stats['review'][0] > ORPHAN_AGE:
+                    orphans.append((stats['review'][0], size, key))
+
+            # Orphans are removed first, regardless of the total size.
+            for n, (_, size, key) in enumerate(orphans + sorted(entries)):
+                if (total <= self.max_bytes) and (n >= len(orphans)):
+                    break
+
+                for file_path in self._files(key):
+                    try:
+                        os.remove(file_path)
+                    except FileNotFoundError:
+                        pass
+
+                total -= size
+
+    def stats(self) -> dict:
+        """
+        Cache statistics.
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses
+            }
+
+
+_cache = None
+
+
+def parse_cache() -> Optional[ParseCache]:
+    """
+    Return process-level parse cache, None if the cache is not configured.
+    """
+    return _cache
+
+
+def set_parse_cache(cache: Optional[ParseCache]):
+    """
+    Set process-level parse cache, None disables the cache.
+    """
+    global _cache
+    _cache = cache
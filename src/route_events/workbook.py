@@ -0,0 +1,125 @@
+import copy
+import polars as pl
+from typing import Dict, List, Tuple, Type
+
+
+class SurveyWorkbook(object):
+    """
+    Multi-route survey Excel workbook. The workbook is read and validated once for every events type, the typed
+    DataFrame is partitioned by route into zero-copy slices and every route gets its own events object.
+    """
+    def __init__(self, excel_path: str, linkid_col: str = 'LINKID'):
+        self.excel_path = excel_path
+        self._linkid_col = linkid_col
+
+        # Parsed workbook (whole workbook events, route slices and review errors) or the raised error,
+        # keyed by the events type and from_excel options.
+        self._parsed = dict()
+
+    @staticmethod
+    def _key(events_type: Type, options: dict) -> tuple:
+        return (events_type, tuple(sorted((key, str(value)) for key, value in options.items())))
+
+    def _partition(self, events) -> Tuple[Dict[str, Tuple[int, int]], pl.DataFrame, Dict[str, pl.DataFrame]]:
+        """
+        Partition the whole workbook events by route. Return the (offset, length) slice of every route, the
+        route ordered DataFrame and review errors of every route.
+        The DataFrame is only sorted if the route rows are not contiguous.
+        """
+        df = events.pl_df
+        routes = df[self._linkid_col]
+
+        # Review error row is the workbook row number, map it before the DataFrame is sorted.
+        review_errors = events.review_errors
+        review_errors = review_errors.with_columns(
+            _route=routes.gather(review_errors['row'])
+        ).partition_by(
+            '_route', as_dict=True, include_key=False
+        )
+
+        runs = routes.rle()
+
+        if runs.len() != routes.n_unique():
+            df = df.sort(self._linkid_col, maintain_order=True)
+            runs = df[self._linkid_col].rle()
+
+        runs = runs.struct.unnest().with_columns(
+            offset=pl.col('len').cum_sum() - pl.col('len')
+        ).filter(
+            pl.col('value').is_not_null()
+        )
+
+        slices = {
+            route: (offset, length) for route, offset, length in runs.select('value', 'offset', 'len').iter_rows()
+        }
+
+        return slices, df, {route[0]: errors for route, errors in review_errors.items()}
+
+    def _load(self, events_type: Type, **kwargs) -> tuple:
+        """
+        Parse the whole workbook with the events type from_excel, once for every options.
+        Error raised while parsing is stored and raised again for every route.
+        """
+        key = self._key(events_type, kwargs)
+
+        if key not in self._parsed:
+            try:
+                events = events_type.from_excel(
+                    excel_path=self.excel_path,
+                    linkid='ALL',
+                    linkid_col=self._linkid_col,
+                    **kwargs
+                )
+                self._parsed[key] = (events, *self._partition(events))
+            except Exception as e:
+                self._parsed[key] = e
+                raise
+
+        parsed = self._parsed[key]
+
+        if isinstance(parsed, Exception):
+            raise parsed
+
+        return parsed
+
+    @property
+    def parse_error(self) -> Exception | None:
+        """
+        Error raised while parsing the workbook, None if the workbook is parsed without error.
+        The error is workbook-wide, it is the same for every route.
+        """
+        for parsed in self._parsed.values():
+            if isinstance(parsed, Exception):
+                return parsed
+
+        return None
+
+    def routes(self, events_type: Type, **kwargs) -> List[str]:
+        """
+        All routes in the workbook, in the partition order (workbook order if the route rows are contiguous).
+        """
+        _, slices, _, _ = self._load(events_type, **kwargs)
+
+        return list(slices)
+
+    def events(self, events_type: Type, route: str, **kwargs):
+        """
+        Events object of a single route. kwargs is passed to the events type from_excel, the workbook is only
+        parsed on the first call for the events type and options.
+        Route which does not exist in the workbook will have an empty events object.
+        """
+        events, slices, df, review_errors = self._load(events_type, **kwargs)
+        offset, length = slices.get(route, (0, 0))
+
+        route_events = copy.copy(events)
+        route_events.pl_df = df.slice(offset, length)
+        route_events._route_id = route
+        route_events._review_errors = review_errors.get(route, events.review_errors.clear())
+
+        return route_events
+
+    def partition(self, events_type: Type, **kwargs) -> dict:
+        """
+        Events object of every route in the workbook.
+        """
+        return {route: self.events(events_type, route, **kwargs) for route in self.routes(events_type, **kwargs)}
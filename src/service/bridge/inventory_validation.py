@@ -5,6 +5,10 @@ from route_events.bridge.inventory import (
     SuperstructureOnlySchema,
 )
 from route_events.bridge.inventory.profile.model import SupsOnlyProfileSchema
+from route_events.bridge.inventory.structure.models import (
+    structure_model,
+    parent_context,
+)
 from route_events.route import LRSRoute
 from pydantic import ValidationError
 
@@ -100,12 +104,13 @@ class BridgeInventoryValidation(object):
                         ignore_review if ignore_review else False
                     )
 
-                    class SupsModel(sups_schema.model):
-                        BRIDGE_ID: str = id_jbt
-                        INV_YEAR: int = self._current_inv.inv_year
+                    sups_model = structure_model(sups_schema.model)
+                    context = parent_context(id_jbt, self._current_inv.inv_year)
 
                     sups_data = [
-                        SupsModel.model_validate(_data).model_dump(by_alias=True)
+                        sups_model.model_validate(
+                            _data, context=context
+                        ).model_dump(by_alias=True)
                         for _data in data.get("BANGUNAN_ATAS", [])
                     ]
 
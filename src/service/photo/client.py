@@ -1,5 +1,7 @@
 from typing import List
+import numpy as np
 from route_events.photo import SurveyPhoto
+from route_events import LRSRoute
 from bm_photo_client import BMPhotoClient, BatchUpdateItem
 from bm_photo_client._pagination import auto_paginate
 
@@ -58,7 +60,7 @@ class SurveyPhotoStorage(object):
         else:
             return valid
 
-    def update_photos(self, photos: List[SurveyPhoto]) -> None:
+    def update_photos(self, photos: List[SurveyPhoto], lrs: LRSRoute = None) -> None:
         """
         Update photo metadata (latitude, longitude, sta_value) in the bm-photo service
         for all valid photos in the list using batch update.
@@ -68,18 +70,29 @@ class SurveyPhotoStorage(object):
 
         Args:
             photos: List of SurveyPhoto objects containing photo_id and updated attributes.
+            lrs: Optional LRSRoute, if provided the photos are placed on the LRS geometry at their STA.
+                Photos with STA outside of the LRS M-Value range keep their coordinates.
         """
         valid_ids = self.valid_photo_ids
+        photos = [photo for photo in photos if photo.photo_id in valid_ids]
+
+        # Photo coordinates located from its STA, NaN if the STA is outside of LRS M-Value range.
+        if (lrs is not None) and photos:
+            sta_long, sta_lat = lrs.locate_m_values(
+                np.array([photo.sta_meters for photo in photos], dtype=np.float64),
+                wkt='EPSG:4326'
+            )
+        else:
+            sta_long = sta_lat = np.full(len(photos), np.nan)
 
         updates = [
             BatchUpdateItem(
                 photo_id=photo.photo_id,
-                latitude=photo.latitude,
-                longitude=photo.longitude,
+                latitude=photo.latitude if np.isnan(sta_lat[i]) else float(sta_lat[i]),
+                longitude=photo.longitude if np.isnan(sta_long[i]) else float(sta_long[i]),
                 sta_value=photo.sta_meters,
             )
-            for photo in photos
-            if photo.photo_id in valid_ids
+            for i, photo in enumerate(photos)
         ]
 
         if updates:
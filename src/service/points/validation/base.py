@@ -1,4 +1,4 @@
-from typing import Type, Literal, Union
+from typing import Type, Literal, Union, List
 from route_events import (
     RoutePointEvents, 
     LRSRoute,
@@ -7,12 +7,13 @@ from route_events import (
 )
 from bm_lrs_client import LRSClient, ColumnMapping
 from ...validation_result.result import ValidationResult
+from ...validation_result.checks import ScheduledValidation, Check
 from ..analysis import segments_points_join
 from sqlalchemy import Engine
 import polars as pl
 
 
-class RoutePointEventsValidation(object):
+class RoutePointEventsValidation(ScheduledValidation):
     """
     Route point events validation
     """
@@ -25,7 +26,8 @@ class RoutePointEventsValidation(object):
             route: str = None,
             survey_year: int = None,
             survey_semester: Literal[1,2] = None,
-            lrs_client: LRSClient = None
+            lrs_client: LRSClient = None,
+            lrs_engine: Literal['numpy', 'duckdb'] = 'numpy'
     ):
         self._events = events
         self._lrs = lrs
@@ -39,6 +41,9 @@ class RoutePointEventsValidation(object):
         # LRS Client
         self._lrs_client = lrs_client
 
+        # LRSRoute M-Value engine, 'duckdb' is kept for comparison
+        self._lrs_engine = lrs_engine
+
         # M Value DataFrame
         self._df_lrs_mv = None
 
@@ -96,7 +101,8 @@ class RoutePointEventsValidation(object):
             if self._lrs is not None and self._lrs_client is None:
                 # OLD METHOD
                 self._df_lrs_mv = self._lrs.get_points_m_value(
-                    self._events.points_lambert
+                    self._events.points_lambert,
+                    engine=self._lrs_engine
                 )
 
             elif self._lrs_client is None:
@@ -1,10 +1,11 @@
 from .base import RoutePointEventsValidation
 from ...photo.client import SurveyPhotoStorage
-from route_events import RouteDefects, RouteDefectsRepo, LRSRoute, SurveyPhoto
+from route_events import RouteDefects, RouteDefectsRepo, LRSRoute, SurveyPhoto, SurveyWorkbook
 from ..analysis import segments_points_join
 from sqlalchemy import Engine
 from typing import List
 from ...validation_result.result import ValidationResult
+from ...validation_result.checks import Check
 import polars as pl
 from pydantic import ValidationError
 
@@ -13,6 +14,7 @@ class RouteDefectsValidation(RoutePointEventsValidation):
     """
     Route Defects Events validation class.
     """
+    check_input_requires = {'survey_photos': ('df_lrs_mv',)}
 
     @classmethod
     def validate_excel(
@@ -26,6 +28,7 @@ class RouteDefectsValidation(RoutePointEventsValidation):
         linkid_col: str = "LINKID",
         ignore_review: bool = False,
         force_write: bool = False,
+        workbook: SurveyWorkbook = None,
     ):
         """
         Validate Defects data in Excel file.
@@ -43,13 +46,26 @@ class RouteDefectsValidation(RoutePointEventsValidation):
         obj = None
 
         try:
-            events = RouteDefects.from_excel(
-                excel_path=excel_path,
-                linkid=route,
-                linkid_col=linkid_col,
-                ignore_review=ignore_review,
-                data_year=survey_year,
-            )
+            if workbook is None:
+                events = RouteDefects.from_excel(
+                    excel_path=excel_path,
+                    linkid=route,
+                    linkid_col=linkid_col,
+                    ignore_review=ignore_review,
+                    collect_review=True,
+                    data_year=survey_year,
+                )
+            else:
+                events = workbook.events(
+                    RouteDefects,
+                    route,
+                    ignore_review=ignore_review,
+                    collect_review=True,
+                    data_year=survey_year,
+                )
+
+            # Review errors are collected in the same parsing pass.
+            result.add_messages(events.review_errors.select("msg"), "review", "review")
 
             obj = cls(
                 route=route,
@@ -70,39 +86,17 @@ class RouteDefectsValidation(RoutePointEventsValidation):
                 else:
                     result.add_message(error["msg"], "rejected")
 
-            if result.status == "rejected":
-                obj = cls(
-                    route=route,
-                    events=pl.DataFrame(),
-                    lrs=None,
-                    sql_engine=sql_engine,
-                    results=result,
-                    survey_year=survey_year,
-                    photo_storage=photo_storage,
-                )
-
-                return obj
-
-            else:
-                events = RouteDefects.from_excel(
-                    excel_path=excel_path,
-                    linkid=route,
-                    linkid_col=linkid_col,
-                    ignore_review=True,
-                    data_year=survey_year,
-                )
-
-                obj = cls(
-                    route=route,
-                    events=events,
-                    lrs=lrs,
-                    sql_engine=sql_engine,
-                    results=result,
-                    survey_year=survey_year,
-                    photo_storage=photo_storage,
-                )
+            obj = cls(
+                route=route,
+                events=pl.DataFrame(),
+                lrs=None,
+                sql_engine=sql_engine,
+                results=result,
+                survey_year=survey_year,
+                photo_storage=photo_storage,
+            )
 
-                return obj
+            return obj
 
         except IndexError:
             result.add_message(
@@ -343,20 +337,26 @@ class RouteDefectsValidation(RoutePointEventsValidation):
     def update_photos(self):
         """
         Update photo coordinates and STA from defect survey data to the bm-photo service.
+        Photo is placed at its STA location on the LRS geometry.
         """
-        self._storage.update_photos(self.survey_photos)
+        self._storage.update_photos(self.survey_photos, lrs=self._lrs)
+
+    def check_registry(self) -> List[Check]:
+        return [
+            Check('damage_severity_check'),
+            Check('lrs_distance_check', inputs=('df_lrs_mv',)),
+            Check('lrs_sta_check', inputs=('df_lrs_mv',)),
+            Check('route_has_rni_check', inputs=('rni',)),
+            Check('sta_not_in_rni_check', inputs=('rni',)),
+            Check('survey_photo_url_check', inputs=('survey_photos',)),
+            Check('photo_id_duplicate_check'),
+
+            Check('surface_type_check', inputs=('rni',)),
+            Check('damage_surface_type_check')
+        ]
 
     def base_validation(self):
         """
         Base validation function
         """
-        self.damage_severity_check()
-        self.lrs_distance_check()
-        self.lrs_sta_check()
-        self.route_has_rni_check()
-        self.sta_not_in_rni_check()
-        self.survey_photo_url_check()
-        self.photo_id_duplicate_check()
-
-        self.surface_type_check()
-        self.damage_surface_type_check()
+        self.run_checks(self.check_registry())
@@ -3,13 +3,15 @@ from route_events import (
     RouteFWD,
     RouteFWDRepo,
     LRSRoute,
+    SurveyWorkbook,
 )
 from ..analysis import segments_points_join
 from sqlalchemy import Engine
 from ...validation_result.result import ValidationResult
+from ...validation_result.checks import Check
 import polars as pl
 from pydantic import ValidationError
-from typing import Literal
+from typing import Literal, List
 
 
 class RouteFWDValidation(RoutePointEventsValidation):
@@ -29,6 +31,7 @@ class RouteFWDValidation(RoutePointEventsValidation):
         ignore_review: bool = False,
         force_write: bool = False,
         survey_semester: Literal[1, 2] = None,
+        workbook: SurveyWorkbook = None,
     ):
         """
         Validate FWD data in Excel file.
@@ -46,14 +49,28 @@ class RouteFWDValidation(RoutePointEventsValidation):
         obj = None
 
         try:
-            events = RouteFWD.from_excel(
-                excel_path=excel_path,
-                linkid=route,
-                linkid_col=linkid_col,
-                ignore_review=ignore_review,
-                data_year=survey_year,
-                data_semester=survey_semester,
-            )
+            if workbook is None:
+                events = RouteFWD.from_excel(
+                    excel_path=excel_path,
+                    linkid=route,
+                    linkid_col=linkid_col,
+                    ignore_review=ignore_review,
+                    collect_review=True,
+                    data_year=survey_year,
+                    data_semester=survey_semester,
+                )
+            else:
+                events = workbook.events(
+                    RouteFWD,
+                    route,
+                    ignore_review=ignore_review,
+                    collect_review=True,
+                    data_year=survey_year,
+                    data_semester=survey_semester,
+                )
+
+            # Review errors are collected in the same parsing pass.
+            result.add_messages(events.review_errors.select("msg"), "review", "review")
 
             obj = cls(
                 route=route,
@@ -74,40 +91,17 @@ class RouteFWDValidation(RoutePointEventsValidation):
                 else:
                     result.add_message(error["msg"], "rejected")
 
-            if result.status == "rejected":
-                obj = cls(
-                    route=route,
-                    events=pl.DataFrame(),
-                    lrs=None,
-                    sql_engine=sql_engine,
-                    results=result,
-                    survey_year=survey_year,
-                    survey_semester=survey_semester,
-                )
-
-                return obj
-
-            else:
-                events = RouteFWD.from_excel(
-                    excel_path=excel_path,
-                    linkid=route,
-                    linkid_col=linkid_col,
-                    ignore_review=True,
-                    data_year=survey_year,
-                    data_semester=survey_semester,
-                )
-
-                obj = cls(
-                    route=route,
-                    events=events,
-                    lrs=lrs,
-                    sql_engine=sql_engine,
-                    results=result,
-                    survey_year=survey_year,
-                    survey_semester=survey_semester,
-                )
+            obj = cls(
+                route=route,
+                events=pl.DataFrame(),
+                lrs=None,
+                sql_engine=sql_engine,
+                results=result,
+                survey_year=survey_year,
+                survey_semester=survey_semester,
+            )
 
-                return obj
+            return obj
 
         except IndexError:
             result.add_message(
@@ -357,14 +351,19 @@ class RouteFWDValidation(RoutePointEventsValidation):
             self._events, year=self._survey_year, semester=self._survey_semester
         )
 
+    def check_registry(self) -> List[Check]:
+        return [
+            Check('d0_surface_check', inputs=('rni',)),
+            Check('surface_thickness_check', inputs=('rni',)),
+            Check('median_direction_check', inputs=('rni',)),
+            Check('lrs_distance_check', inputs=('df_lrs_mv',)),
+            Check('lrs_sta_check', inputs=('df_lrs_mv',)),
+            Check('route_has_rni_check', inputs=('rni',)),
+            Check('sta_not_in_rni_check', inputs=('rni',))
+        ]
+
     def base_validation(self):
         """
         Base validation function
         """
-        self.d0_surface_check()
-        self.surface_thickness_check()
-        self.median_direction_check()
-        self.lrs_distance_check()
-        self.lrs_sta_check()
-        self.route_has_rni_check()
-        self.sta_not_in_rni_check()
+        self.run_checks(self.check_registry())
@@ -3,12 +3,14 @@ from route_events import (
     RouteRTCRepo,
     RouteRTC,
     LRSRoute,
+    SurveyWorkbook,
 )
 from route_events.points.rtc import VEH7C_COL
 from ..analysis import segments_points_join
 from sqlalchemy import Engine
 from typing import List
 from ...validation_result.result import ValidationResult
+from ...validation_result.checks import Check, GEOMETRY
 import polars as pl
 from pydantic import ValidationError
 
@@ -29,6 +31,7 @@ class RouteRTCValidation(RoutePointEventsValidation):
         linkid_col: str = "LINKID",
         ignore_review: bool = False,
         force_write: bool = False,
+        workbook: SurveyWorkbook = None,
     ):
         """
         Validate Defects data in Excel file.
@@ -46,13 +49,26 @@ class RouteRTCValidation(RoutePointEventsValidation):
         obj = None
 
         try:
-            events = RouteRTC.from_excel(
-                excel_path=excel_path,
-                linkid=route,
-                linkid_col=linkid_col,
-                ignore_review=ignore_review,
-                data_year=survey_year,
-            )
+            if workbook is None:
+                events = RouteRTC.from_excel(
+                    excel_path=excel_path,
+                    linkid=route,
+                    linkid_col=linkid_col,
+                    ignore_review=ignore_review,
+                    collect_review=True,
+                    data_year=survey_year,
+                )
+            else:
+                events = workbook.events(
+                    RouteRTC,
+                    route,
+                    ignore_review=ignore_review,
+                    collect_review=True,
+                    data_year=survey_year,
+                )
+
+            # Review errors are collected in the same parsing pass.
+            result.add_messages(events.review_errors.select("msg"), "review", "review")
 
             obj = cls(
                 route=route,
@@ -72,37 +88,16 @@ class RouteRTCValidation(RoutePointEventsValidation):
                 else:
                     result.add_message(error["msg"], "rejected")
 
-            if result.status == "rejected":
-                obj = cls(
-                    route=route,
-                    events=pl.DataFrame(),
-                    lrs=None,
-                    sql_engine=sql_engine,
-                    results=result,
-                    survey_year=survey_year,
-                )
-
-                return obj
-
-            else:
-                events = RouteRTC.from_excel(
-                    excel_path=excel_path,
-                    linkid=route,
-                    linkid_col=linkid_col,
-                    ignore_review=True,
-                    data_year=survey_year,
-                )
-
-                obj = cls(
-                    route=route,
-                    events=events,
-                    lrs=lrs,
-                    sql_engine=sql_engine,
-                    results=result,
-                    survey_year=survey_year,
-                )
+            obj = cls(
+                route=route,
+                events=pl.DataFrame(),
+                lrs=None,
+                sql_engine=sql_engine,
+                results=result,
+                survey_year=survey_year,
+            )
 
-                return obj
+            return obj
 
         except IndexError:
             result.add_message(
@@ -144,15 +139,20 @@ class RouteRTCValidation(RoutePointEventsValidation):
         # Survey photos
         self._photos = None
 
+    def check_registry(self) -> List[Check]:
+        return [
+            Check('lane_width_check', inputs=('rni', GEOMETRY)),
+            Check('invalid_interval_check'),
+            Check('invalid_survey_duration'),
+            Check('lrs_distance_check', inputs=('df_lrs_mv',)),
+            Check('route_has_rni_check', inputs=('rni',))
+        ]
+
     def base_validation(self):
         """
         Base validation function.
         """
-        self.lane_width_check()
-        self.invalid_interval_check()
-        self.invalid_survey_duration()
-        self.lrs_distance_check()
-        self.route_has_rni_check()
+        self.run_checks(self.check_registry())
 
     def invalid_interval_check(self):
         """
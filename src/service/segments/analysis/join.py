@@ -1,7 +1,7 @@
 from route_events import RouteSegmentEvents, RouteRNI
 from typing import Type, Dict, List, Literal
 import polars as pl
-import duckdb
+from route_events.utils.ddb import ddb_cursor
 
 
 def segments_coverage_join(
@@ -17,7 +17,7 @@ def segments_coverage_join(
     Perform DataFrame join between RouteSegmentEvents type, using STA from 'covering' events.
     Covering becomes the 'left' and the target become the 'right'.
     """        
-    ddb = duckdb.connect()
+    ddb = ddb_cursor(extensions=())
 
     def _segment_id_col(obj: Type[RouteSegmentEvents], convert_to_m=False):
         if convert_to_m:
@@ -141,10 +141,11 @@ def segments_join(
         how: str = 'inner',
         l_agg: List[pl.Expr] = None,
         r_agg: List[pl.Expr] = None,
-        suffix: str = '_r'
-) -> pl.DataFrame:
+        suffix: str = '_r',
+        lazy: bool = False
+) -> pl.DataFrame | pl.LazyFrame:
     """
-    Perform DataFrame join between RouteSegmentEvents type.
+    Perform DataFrame join between RouteSegmentEvents type. If lazy is True, then return the join LazyFrame.
     """
     if (type(l_select) != list) or (type(r_select) != list):
         raise TypeError("Only accepts list for columns selection.")
@@ -173,11 +174,11 @@ def segments_join(
         ]
     
     # Initial selection
-    ldf = left.pl_df.select(
+    ldf = left.pl_df.lazy().select(
         _segment_id_col(left, convert_to_m=True) + l_select
     )
 
-    rdf = right.pl_df.select(
+    rdf = right.pl_df.lazy().select(
         _segment_id_col(right, convert_to_m=True) + r_select
     )
 
@@ -212,8 +213,11 @@ def segments_join(
             how=how,
             suffix=suffix
         )
+
+    if lazy:
+        return joined
     
-    return joined
+    return joined.collect()
 
 
 class CompareRNISegments:
@@ -1,17 +1,21 @@
 from route_events.segments import RouteSegmentEvents
 from route_events import LRSRoute
 from ...validation_result.result import ValidationResult
+from ...validation_result.checks import ScheduledValidation, Check, lazy_check
 from bm_lrs_client import LRSClient, ColumnMapping
 from sqlalchemy import Engine
-from typing import Type, Literal, Union
+from typing import Type, Literal, Union, List
 import polars as pl
 from numpy import isclose
 
 
-class RouteSegmentEventsValidation(object):
+class RouteSegmentEventsValidation(ScheduledValidation):
     """
     Route segment events validation
     """
+    # Compare the survey coordinates with its STA location on LRS geometry (lrs_sta_location_check).
+    sta_location_check: bool = False
+
     def __init__(
             self,
             events: Type[RouteSegmentEvents],
@@ -21,7 +25,8 @@ class RouteSegmentEventsValidation(object):
             route: str = None,
             survey_year: int = None,
             survey_semester: Literal[1,2] = None,
-            lrs_client: LRSClient = None
+            lrs_client: LRSClient = None,
+            lrs_engine: Literal['numpy', 'duckdb'] = 'numpy'
     ):
         self._events = events
         self._lrs = lrs
@@ -35,6 +40,9 @@ class RouteSegmentEventsValidation(object):
         # LRS Client
         self._lrs_client = lrs_client
 
+        # LRSRoute M-Value engine, 'duckdb' is kept for comparison
+        self._lrs_engine = lrs_engine
+
         # M Value DataFrame
         self._df_lrs_mv = None
 
@@ -62,7 +70,8 @@ class RouteSegmentEventsValidation(object):
             if self._lrs is not None and self._lrs_client is None:
                 # OLD METHOD using LRS class from GeoJSON
                 df = self._lrs.get_points_m_value(
-                    self._events._points_lambert
+                    self._events.points_lambert,
+                    engine=self._lrs_engine
                 ).sort(
                     [
                         self._events._linkid_col,
@@ -86,7 +95,7 @@ class RouteSegmentEventsValidation(object):
                         m_value='m_val',
                         distance='dist'
                     ),
-                    crs=self._events._points_4326.origin_wkt
+                    crs=self._events.points_4326.origin_wkt
                 )
 
             lanes = []
@@ -138,29 +147,49 @@ class RouteSegmentEventsValidation(object):
         self.lrs_sta_check()
         self.max_sta_check()
 
-    def base_validation(self):
+    def check_registry(self) -> List[Check]:
         """
-        Run all validation function in this class.
+        Base validation checks and its inputs.
         """
-        self.duplicate_segment_check()
-        # self.lane_sequence_check() # Change to optional, will not executed on PCI validation.
-        # self.segment_length_check(tolerance=0.005)
-        self.sta_diff_check(tolerance=0.005)
-        self.sta_gap_check()
-        self.sta_overlap_check()
-        self.survey_max_m_value_check()
-        
+        checks = [
+            Check('duplicate_segment_check'),
+            # Check('lane_sequence_check'), # Change to optional, will not executed on PCI validation.
+            # Check('segment_length_check', kwargs={'tolerance': 0.005}),
+            Check('sta_diff_check', kwargs={'tolerance': 0.005}),
+            Check('sta_gap_check'),
+            Check('sta_overlap_check'),
+            Check('survey_max_m_value_check', inputs=('df_lrs_mv',)),
+        ]
+
         # Does not check start from zero when the data is only partial
         if not self._events.is_partial:
-            self.from_sta_start_from_zero()    
-        
-        self.last_segment_single_to_sta_check()
-        self.survey_date_year_check()
-        self.data_semester_check()
-        self.data_year_check()
+            checks.append(Check('from_sta_start_from_zero'))
+
+        checks.extend([
+            Check('last_segment_single_to_sta_check'),
+            Check('survey_date_year_check'),
+            Check('data_semester_check'),
+            Check('data_year_check'),
+
+            # LRS validation
+            Check('lrs_distance_check', inputs=('df_lrs_mv',)),
+            Check('lrs_monotonic_check', inputs=('df_lrs_mv',)),
+            Check('lrs_direction_check', inputs=('df_lrs_mv',)),
+            Check('lrs_segment_length_check', inputs=('df_lrs_mv',)),
+            Check('lrs_sta_check', inputs=('df_lrs_mv',)),
+            Check('max_sta_check')
+        ])
+
+        if self.sta_location_check:
+            checks.append(Check('lrs_sta_location_check'))
 
-        # Run all LRS Validation
-        self.lrs_validation()
+        return checks
+
+    def base_validation(self):
+        """
+        Run all validation function in this class.
+        """
+        self.run_checks(self.check_registry())
 
     def survey_date_year_check(self):
         """
@@ -360,18 +389,57 @@ class RouteSegmentEventsValidation(object):
 
         return self
     
+    def lrs_sta_location_check(
+            self,
+            sta: Literal['from', 'to'] = 'to',
+            tolerance: int = 30
+        ):
+        """
+        Compare survey point coordinate with the location of its STA on LRS geometry, without snapping the points.
+        Optional, only executed in the base validation if sta_location_check is True.
+        """
+        if sta == 'to':
+            sta_col = self._events._to_sta_col
+        elif sta == 'from':
+            sta_col = self._events._from_sta_col
+        else:
+            raise ValueError(f"Only accept 'from' or 'to' sta type. Got {sta} instead.")
+
+        points = self._events.points_lambert
+
+        errors = self._lrs.get_points_sta_drift(
+            points,
+            points._rows[sta_col].cast(pl.Float64).to_numpy()*self._events.sta_conversion
+        ).filter(
+            pl.col('drift').gt(tolerance)
+        ).select(
+            msg = pl.format(
+                "Koordinat segmen {}-{} {} berjarak {}m dari lokasi STA pada geometri LRS.",
+                pl.col(self._events._from_sta_col),
+                pl.col(self._events._to_sta_col),
+                pl.col(self._events._lane_code_col),
+                pl.col('drift').round(2)
+            )
+        )
+
+        self._result.add_messages(
+            errors,
+            'error',
+            'force'
+        )
+
+        return self
+
     def duplicate_segment_check(self):
         """
         Check for duplicate segment.
         """
-        errors_ = self._events.is_duplicate_segment()
+        errors_ = self._events.is_duplicate_segment(as_df=True)
 
-        if len(errors_) == 0:
+        if errors_.is_empty():
             return self
         
-        errors = pl.DataFrame(
-            self._events.is_duplicate_segment()
-        ).select(
+        errors = errors_.select(
             msg = pl.format(
                 "Segmen {}-{} {} merupakan segmen dengan duplikat.",
                 pl.col('from_sta'),
@@ -392,14 +460,12 @@ class RouteSegmentEventsValidation(object):
         Check for incorrect lane sequence. All segment should have lanes that start from L1 or R1,
         and has 1 increment.
         """
-        errors_ = self._events.incorrect_lane_sequence()
+        errors_ = self._events.incorrect_lane_sequence(as_df=True)
 
-        if len(errors_) == 0:
+        if errors_.is_empty():
             return self
         
-        errors = pl.DataFrame(
-            errors_
-        ).select(
+        errors = errors_.select(
             msg = pl.format(
                 "Segmen {}-{} memiliki kode lajur yang tidak sesuai dengan aturan, yaitu {}",
                 pl.col('from_sta'),
@@ -415,19 +481,13 @@ class RouteSegmentEventsValidation(object):
 
         return self
     
-    def segment_length_check(self, tolerance=0):
+    @lazy_check('error', 'force')
+    def segment_length_check(self, tolerance=0) -> pl.LazyFrame:
         """
         Check segment with incorrect segment length. Exclude the last segment, 
         because last segment could have short segment length.
         """
-        errors_ = self._events.incorrect_segment_length(tolerance=tolerance)
-
-        if len(errors_) == 0:
-            return self
-        
-        errors = pl.DataFrame(
-            errors_
-        ).select(
+        return self._events.incorrect_segment_length(tolerance=tolerance, as_df=True, lazy=True).select(
             msg = pl.format(
                 "Segmen {}-{} {} memiliki panjang segmen yang tidak sesuai dengan kriteria, yaitu {}",
                 pl.col('from_sta'),
@@ -436,27 +496,13 @@ class RouteSegmentEventsValidation(object):
                 pl.col(self._events._seg_len_col.lower())
             )
         )
-
-        self._result.add_messages(
-            errors,
-            'error', 
-            'force'
-        )
-
-        return self
     
-    def sta_diff_check(self, tolerance=0):
+    @lazy_check('error', 'force')
+    def sta_diff_check(self, tolerance=0) -> pl.LazyFrame:
         """
         Check segment with incorrect STA difference, compared to its segment length.
         """
-        errors_ = self._events.incorrect_sta_diff(tolerance=tolerance)
-
-        if len(errors_) == 0:
-            return self
-        
-        errors = pl.DataFrame(
-            errors_
-        ).select(
+        return self._events.incorrect_sta_diff(tolerance=tolerance, as_df=True, lazy=True).select(
             msg = pl.format(
                 "Segmen {}-{} {} memiliki nilai FROM_STA yang lebih besar dari TO_STA, atau selisih FROM-TO yang tidak cocok dengan panjang segmen, yaitu {}",
                 pl.col('from_sta'),
@@ -465,27 +511,17 @@ class RouteSegmentEventsValidation(object):
                 pl.col(self._events._seg_len_col.lower())
             )
         )
-
-        self._result.add_messages(
-            errors,
-            'error',
-            'force'
-        )
-
-        return self
     
     def sta_gap_check(self):
         """
         Check if there is measurement gap in each lane.
         """
-        errors_ = self._events.sta_gap()
+        errors_ = self._events.sta_gap(as_df=True)
 
-        if len(errors_) == 0:
+        if errors_.is_empty():
             return self
         
-        errors = pl.DataFrame(
-            errors_
-        ).filter(
+        errors = errors_.filter(
             # For main lane (R1 and L1) missing data is not negotiable
             pl.col('lane').is_in(['L1', 'R1', 'l1', 'r1'])
         ).select(
@@ -503,9 +539,7 @@ class RouteSegmentEventsValidation(object):
             'force'
         )
 
-        errors = pl.DataFrame(
-            errors_
-        ).filter(
+        errors = errors_.filter(
             # For other lanes, missing data is negotiable
             pl.col('lane').is_in(['L1', 'R1', 'l1', 'r1']).not_()
         ).select(
@@ -529,14 +563,12 @@ class RouteSegmentEventsValidation(object):
         """
         Check if there is overlapping segment.
         """
-        errors_ = self._events.overlapping_segments()
+        errors_ = self._events.overlapping_segments(as_df=True)
 
-        if len(errors_) == 0:
+        if errors_.is_empty():
             return self
         
-        errors = pl.DataFrame(
-            errors_
-        ).select(
+        errors = errors_.select(
             msg = pl.format(
                 "Segmen {}-{} {} tumpang tindih dengan segmen {}-{} {}",
                 pl.col('from_sta'),
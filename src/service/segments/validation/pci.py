@@ -8,10 +8,12 @@ from route_events import (
     LRSRoute, 
     RoutePCIRepo,
     RouteDefectsRepo,
-    RouteDefects
+    RouteDefects,
+    SurveyWorkbook
 )
 from ...validation_result.result import ValidationResult
-from typing import Type
+from ...validation_result.checks import Check, lazy_check
+from typing import Type, List
 from sqlalchemy import Engine
 from sqlalchemy.exc import NoSuchTableError
 import polars as pl
@@ -32,7 +34,8 @@ class RoutePCIValidation(RouteSegmentEventsValidation):
         lrs: LRSRoute,
         linkid_col: str = 'LINKID',
         ignore_review: bool = False,
-        force_write: bool = False
+        force_write: bool = False,
+        workbook: SurveyWorkbook = None
     ):
         """
         Validate PCI data in excel file.
@@ -49,13 +52,26 @@ class RoutePCIValidation(RouteSegmentEventsValidation):
             
         obj = None
         try:
-            events = RoutePCI.from_excel(
-                excel_path=excel_path,
-                linkid=route,
-                linkid_col=linkid_col,
-                ignore_review=ignore_review,
-                data_year=survey_year
-            )
+            if workbook is None:
+                events = RoutePCI.from_excel(
+                    excel_path=excel_path,
+                    linkid=route,
+                    linkid_col=linkid_col,
+                    ignore_review=ignore_review,
+                    collect_review=True,
+                    data_year=survey_year
+                )
+            else:
+                events = workbook.events(
+                    RoutePCI,
+                    route,
+                    ignore_review=ignore_review,
+                    collect_review=True,
+                    data_year=survey_year
+                )
+
+            # Review errors are collected in the same parsing pass.
+            result.add_messages(events.review_errors.select('msg'), 'review', 'review')
 
             obj = cls(
                 route=route,
@@ -75,37 +91,16 @@ class RoutePCIValidation(RouteSegmentEventsValidation):
                 else:
                     result.add_message(error['msg'], 'rejected')
 
-            if result.status == 'rejected':
-                obj = cls(
-                    route=route,
-                    events=pl.DataFrame(),
-                    lrs=None,
-                    sql_engine=sql_engine,
-                    results=result,
-                    survey_year=survey_year
-                )
-
-                return obj
-            
-            else:
-                events = RoutePCI.from_excel(
-                    excel_path=excel_path,
-                    linkid=route,
-                    linkid_col=linkid_col,
-                    ignore_review=True,
-                    data_year=survey_year
-                )
-
-                obj = cls(
-                    route=route,
-                    events=events,
-                    lrs=lrs,
-                    sql_engine=sql_engine,
-                    results=result,
-                    survey_year=survey_year
-                )
+            obj = cls(
+                route=route,
+                events=pl.DataFrame(),
+                lrs=None,
+                sql_engine=sql_engine,
+                results=result,
+                survey_year=survey_year
+            )
 
-                return obj
+            return obj
         
         except IndexError:
             result.add_message(f"File '{excel_path}' tidak dapat ditemukan.", 'rejected')
@@ -159,7 +154,8 @@ class RoutePCIValidation(RouteSegmentEventsValidation):
             self._rni = self._rni_repo.get_by_linkid(
                 self._route, 
                 year=self._survey_year,
-                raise_if_table_does_not_exists=True
+                raise_if_table_does_not_exists=True,
+                geometry=False
             )
 
             return self._rni
@@ -183,7 +179,8 @@ class RoutePCIValidation(RouteSegmentEventsValidation):
         else:
             return self._defects
         
-    def invalid_pci_check(self):
+    @lazy_check('error')
+    def invalid_pci_check(self) -> pl.LazyFrame:
         """
         Check for segments with invalid PCI score compared to its damage value.
         """
@@ -193,7 +190,9 @@ class RoutePCIValidation(RouteSegmentEventsValidation):
             pl.col(self._events._lane_code_col),
             pl.col(self._events._pci_col)
         ]
-        errors = self._events.invalid_pci_value().filter(
+        invalid_pci = self._events.invalid_pci_value(lazy=True)
+
+        errors = invalid_pci.filter(
             pl.col(self._events._pci_col).is_not_null()
         ).select(
             msg=pl.when(
@@ -211,12 +210,7 @@ class RoutePCIValidation(RouteSegmentEventsValidation):
             )
         )
 
-        self._result.add_messages(
-            errors,
-            'error'
-        )
-
-        null_errors = self._events.invalid_pci_value().filter(
+        null_errors = invalid_pci.filter(
             pl.col(self._events._pci_col).is_null()
         ).select(
             msg=pl.format(
@@ -225,12 +219,7 @@ class RoutePCIValidation(RouteSegmentEventsValidation):
             )
         )
 
-        self._result.add_messages(
-            null_errors,
-            'error'
-        )
-
-        return
+        return pl.concat([errors, null_errors])
     
     def has_defect_data_check(self):
         """
@@ -459,17 +448,13 @@ class RoutePCIValidation(RouteSegmentEventsValidation):
             self._result.add_message("Data defect tidak tersedia untuk dibandingkan.", "error")
             return
         
-    def damage_severity_check(self):
+    @lazy_check('error')
+    def damage_severity_check(self) -> pl.LazyFrame:
         """
         Check inconsistency between damage volume and its severity. 0/None volume should also come with NA/None severity.
         Greater than 0 volume should come with other than NA severity.
         """
-        errors_ = self._events.invalid_volume_with_severity()
-
-        if len(errors_) == 0:
-            return
-        
-        msg = pl.DataFrame(errors_).select(
+        return self._events.invalid_volume_with_severity(as_df=True, lazy=True).select(
             msg = pl.format(
                 "Segmen {}-{} {} memiliki volume dan tingkat kerusakan {} yang tidak cocok.",
                 pl.col('from_sta'),
@@ -478,13 +463,6 @@ class RoutePCIValidation(RouteSegmentEventsValidation):
                 pl.col('damage_column')
             )
         )
-
-        self._result.add_messages(
-            msg,
-            'error'
-        )
-
-        return
         
     def defects_point_check(self):
         """
@@ -600,13 +578,14 @@ class RoutePCIValidation(RouteSegmentEventsValidation):
         """
         self._repo.put(self._events, year=self._survey_year, semester=semester)
 
-    def base_validation(self):
-        super().base_validation()
-        self.invalid_pci_check()
-        self.rni_surf_type_comparison()
-        self.rni_surf_type_segment_length_check()
-        self.damage_severity_check()
-        self.has_defect_data_check()
-        
-        # self.defect_surf_type_segment_length_check()  # Temporary disabled on 17/12/2025 on mas made request
-        # self.defects_point_check()
+    def check_registry(self) -> List[Check]:
+        return super().check_registry() + [
+            Check('invalid_pci_check'),
+            Check('rni_surf_type_comparison', inputs=('rni',), cost=2),
+            Check('rni_surf_type_segment_length_check', inputs=('rni',), cost=2),
+            Check('damage_severity_check'),
+            Check('has_defect_data_check', inputs=('defects',)),
+
+            # Check('defect_surf_type_segment_length_check', inputs=('defects',)),  # Temporary disabled on 17/12/2025 on mas made request
+            # Check('defects_point_check', inputs=('defects',)),
+        ]
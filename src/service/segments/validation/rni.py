@@ -1,7 +1,8 @@
 from .base import RouteSegmentEventsValidation
 from ..analysis import segments_join
-from route_events import RouteRNI, LRSRoute, RouteRNIRepo
+from route_events import RouteRNI, LRSRoute, RouteRNIRepo, SurveyWorkbook
 from ...validation_result.result import ValidationResult
+from ...validation_result.checks import Check, lazy_check
 from typing import Type, List
 from sqlalchemy import Engine
 import polars as pl
@@ -25,7 +26,8 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
         lrs: LRSRoute, 
         linkid_col: str = 'LINKID',
         ignore_review: bool = False,
-        force_write: bool = False
+        force_write: bool = False,
+        workbook: SurveyWorkbook = None
     ):
         """
         Validate RNI data in excel file.
@@ -42,14 +44,28 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
         
         obj = None
         try:
-            events = RouteRNI.from_excel(
-                excel_path=excel_path,
-                linkid=route,
-                linkid_col=linkid_col,
-                ignore_review=ignore_review,
-                data_year=survey_year,
-                filter=pl.col('^.+IL_IVR$').eq(PARTIAL_UPDATE_KEYWORDS)
-            )
+            if workbook is None:
+                events = RouteRNI.from_excel(
+                    excel_path=excel_path,
+                    linkid=route,
+                    linkid_col=linkid_col,
+                    ignore_review=ignore_review,
+                    collect_review=True,
+                    data_year=survey_year,
+                    filter=pl.col('^.+IL_IVR$').eq(PARTIAL_UPDATE_KEYWORDS)
+                )
+            else:
+                events = workbook.events(
+                    RouteRNI,
+                    route,
+                    ignore_review=ignore_review,
+                    collect_review=True,
+                    data_year=survey_year,
+                    filter=pl.col('^.+IL_IVR$').eq(PARTIAL_UPDATE_KEYWORDS)
+                )
+
+            # Review errors are collected in the same parsing pass.
+            result.add_messages(events.review_errors.select('msg'), 'review', 'review')
 
             obj = cls(
                 route=route,
@@ -69,37 +85,16 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
                 else:
                     result.add_message(error['msg'], 'rejected')
                 
-            if result.status == 'rejected':
-                obj = cls(
-                    route=route,
-                    events=pl.DataFrame(),
-                    lrs=lrs,
-                    sql_engine=sql_engine,
-                    results=result,
-                    survey_year=survey_year
-                )
-
-                return obj
-            else:
-                events = RouteRNI.from_excel(
-                    excel_path=excel_path,
-                    linkid=route,
-                    linkid_col=linkid_col,
-                    ignore_review=True,
-                    data_year=survey_year,
-                    filter=pl.col('^.+IL_IVR$').eq(PARTIAL_UPDATE_KEYWORDS)
-                )
-                
-                obj = cls(
-                    route=route,
-                    events=events,
-                    lrs=lrs,
-                    sql_engine=sql_engine,
-                    results=result,
-                    survey_year=survey_year
-                )
+            obj = cls(
+                route=route,
+                events=pl.DataFrame(),
+                lrs=lrs,
+                sql_engine=sql_engine,
+                results=result,
+                survey_year=survey_year
+            )
 
-                return obj
+            return obj
             
         except IndexError:
             result.add_message(f"File '{excel_path}' tidak dapat ditemukan.", 'rejected')
@@ -148,7 +143,8 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
             self._prev_data = self._repo.get_by_linkid(
                 self._route, 
                 year=self._survey_year-1,
-                raise_if_table_does_not_exists=True
+                raise_if_table_does_not_exists=True,
+                geometry=False
             )
 
             return self._prev_data
@@ -191,6 +187,7 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
                 self._route,
                 year=self._survey_year,
                 raise_if_table_does_not_exists=True,
+                geometry=False
             )
             
             return self._prev_sem_data
@@ -200,17 +197,12 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
 
     def side_columns_check(self, current_year_only: bool = False):
         if current_year_only:
-            errors_ = self._events.incorrect_side_columns(survey_year=self._survey_year)
+            errors = self._events.incorrect_side_columns(survey_year=self._survey_year, as_df=True)
         else:
-            errors_ = self._events.incorrect_side_columns()
+            errors = self._events.incorrect_side_columns(as_df=True)
 
-        if len(errors_) == 0:
+        if errors.is_empty():
             return self
-        
-        errors = pl.DataFrame(
-            errors_,
-            infer_schema_length=None
-        )
 
         na_msg = pl.format(
             "Segmen {}-{} pada sisi {} tidak memiliki nilai {}.",
@@ -274,18 +266,12 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
 
         return self
     
-    def road_type_spec_check(self):
+    @lazy_check('error', 'force')
+    def road_type_spec_check(self) -> pl.LazyFrame:
         """
         Check segment with incorrect road type specification.
         """
-        errors_ = self._events.incorrect_road_type_spec()
-
-        if len(errors_) == 0:
-            return self
-        
-        errors = pl.DataFrame(
-            errors_
-        ).select(
+        return self._events.incorrect_road_type_spec(as_df=True, lazy=True).select(
             msg=pl.format(
                 "Segmen {}-{} memiliki spesifikasi yang tidak cocok dengan tipe jalan {}.",
                 pl.col('from_sta'),
@@ -293,30 +279,18 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
                 pl.col('road_type')
             )
         )
-
-        self._result.add_messages(
-            errors,
-            'error',
-            'force'
-        )
-
-        return self
     
-    def inner_shoulder_check(self, current_year_only: bool = True):
+    @lazy_check('error', 'force')
+    def inner_shoulder_check(self, current_year_only: bool = True) -> pl.LazyFrame:
         """
         Check segment with incorrect median and inner shoulder combination.
         """
         if current_year_only:
-            errors_ = self._events.incorrect_inner_shoulder(survey_year=self._survey_year)
+            errors_ = self._events.incorrect_inner_shoulder(survey_year=self._survey_year, as_df=True, lazy=True)
         else:
-            errors_ = self._events.incorrect_inner_shoulder()
+            errors_ = self._events.incorrect_inner_shoulder(as_df=True, lazy=True)
 
-        if len(errors_) == 0:
-            return self
-        
-        errors = pl.DataFrame(
-            errors_
-        ).select(
+        return errors_.select(
             msg=pl.when(
                 pl.col('has_median')
             ).then(
@@ -333,27 +307,13 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
                 )
             )
         )
-
-        self._result.add_messages(
-            errors,
-            'error',
-            'force'
-        )
-
-        return self
     
-    def surface_width_check(self, width_delta: int = 2):
+    @lazy_check('error', 'force')
+    def surface_width_check(self, width_delta: int = 2) -> pl.LazyFrame:
         """
         Check segment with surface width that does not match the total lane width.
         """
-        errors_ = self._events.incorrect_surface_width(width_delta=width_delta)
-
-        if len(errors_) == 0:
-            return self
-        
-        errors = pl.DataFrame(
-            errors_
-        ).select(
+        return self._events.incorrect_surface_width(width_delta=width_delta, as_df=True, lazy=True).select(
             msg = pl.when(
                 pl.col('has_median').not_()
             ).then(
@@ -370,31 +330,21 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
                 )
             )
         )
-
-        self._result.add_messages(
-            errors,
-            'error',
-            'force'
-        )
-
-        return self
     
     def single_value_attribute_check(self, column: str):
         """
         Check for segment with attribute N-Unique count above 1.
         """
-        errors_ = self._events.segment_attribute_n_unique([column], filter=('gt', 1))
+        errors_ = self._events.segment_attribute_n_unique([column], as_df=True, filter=('gt', 1))
 
-        if len(errors_) == 0:
+        if errors_.is_empty():
             return self
         
-        errors = pl.DataFrame(
-            errors_
-        ).select(
+        errors = errors_.select(
             msg=pl.format(
                 "Segmen {}-{} memiliki nilai unik {} lebih dari 1.",
-                pl.col('from_sta'),
-                pl.col('to_sta'),
+                pl.col(self._events._from_sta_col),
+                pl.col(self._events._to_sta_col),
                 pl.lit(column)
             )
         )
@@ -407,7 +357,8 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
 
         return self
     
-    def decreasing_lane_width_check(self, tolerance=0.01):
+    @lazy_check('error', 'force')
+    def decreasing_lane_width_check(self, tolerance=0.01) -> pl.LazyFrame:
         """
         Check segment with decreasing lane widths.
         """
@@ -417,10 +368,11 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
             left = self._events,
             right = self.prev_data,
             l_select=[lane_w_col],
-            r_select=[lane_w_col]
+            r_select=[lane_w_col],
+            lazy=True
         )
 
-        errors = joined.filter(
+        return joined.filter(
             pl.col(lane_w_col).lt(pl.col(lane_w_col+'_r').sub(tolerance))
         ).select(
             msg=pl.format(
@@ -432,16 +384,9 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
                 pl.col(lane_w_col)
             )
         )
-
-        self._result.add_messages(
-            errors,
-            'error',
-            'force'
-        )
-
-        return self
     
-    def decreasing_surf_width_check(self, tolerance=0.01):
+    @lazy_check('error', 'force')
+    def decreasing_surf_width_check(self, tolerance=0.01) -> pl.LazyFrame:
         """
         Check segment with decreasing surface width if compared to previous year data.
         """
@@ -460,10 +405,11 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
             l_select = [surf_w_col, med_w_col],
             r_select = [surf_w_col, med_w_col],
             l_agg = rni_agg,
-            r_agg = rni_agg
+            r_agg = rni_agg,
+            lazy = True
         )
 
-        errors = joined.filter(
+        return joined.filter(
             pl.when(
                 pl.col('has_median')
             ).then(
@@ -492,16 +438,9 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
                 )
             )
         )
-
-        self._result.add_messages(
-            errors,
-            'error',
-            'force'
-        )
-
-        return self
     
-    def decreasing_lane_count(self):
+    @lazy_check('error', 'force')
+    def decreasing_lane_count(self) -> pl.LazyFrame:
         """
         Check for segment with decreasing number of lanes if compared to previous year data.
         """
@@ -511,10 +450,11 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
             left = self._events,
             right = self._prev_data,
             l_agg = [pl.col(lane_code_col).n_unique()],
-            r_agg = [pl.col(lane_code_col).n_unique()]
+            r_agg = [pl.col(lane_code_col).n_unique()],
+            lazy = True
         )
 
-        errors = joined.filter(
+        return joined.filter(
             pl.col(lane_code_col).lt(pl.col(lane_code_col+'_r'))
         ).select(
             msg = pl.format(
@@ -525,16 +465,9 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
                 pl.col(lane_code_col)
             )
         )
-
-        self._result.add_messages(
-            errors,
-            'error',
-            'force'
-        )
-
-        return self
     
-    def paved_to_unpaved_check(self):
+    @lazy_check('error', 'force')
+    def paved_to_unpaved_check(self) -> pl.LazyFrame:
         """
         Check for segment which has surface type degradation compared to previous year data.
         """
@@ -561,13 +494,14 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
         }
 
         # Start filtering error segments
-        errors = segments_join(
+        return segments_join(
             left = self._events,
             right = self.prev_data,
             l_select = [surf_type_col],
             r_select = [surf_type_col],
             l_agg = [pl.col(surf_type_col).max()],
-            r_agg = [pl.col(surf_type_col).max()]
+            r_agg = [pl.col(surf_type_col).max()],
+            lazy = True
         ).with_columns(
             # The surface type needed to be casted to string
             current_cat=pl.col(surf_type_col).cast(pl.String).replace(surf_mapping_dict),
@@ -583,45 +517,45 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
                 pl.col(self._events._to_sta_col).truediv(self._events.sta_conversion)
             )
         )
-
-        self._result.add_messages(
-            errors,
-            'error',
-            'force'
-        )
-
-        return self
     
-    def surface_year_check(self):
+    @lazy_check('error')
+    def surface_year_check(self) -> pl.LazyFrame:
         """
         Generate error message for route with incorrect surface year.
         """
-        errors_ = self._events.incorrect_surf_year()
-
-        if len(errors_) == 0:
-            return
-        
-        errors = pl.DataFrame(errors_).select(
+        return self._events.incorrect_surf_year(as_df=True, lazy=True).select(
             msg = pl.format(
                 "Segmen {}-{} {} memiliki surface year yang lebih besar dari tahun data yaitu {}",
                 pl.col('from_sta'),
                 pl.col('to_sta'),
-                pl.col('lane_code'),
+                pl.col('lane'),
                 pl.col(self._events._surf_year_col.lower())
             )
         )
 
-        self._result.add_messages(
-            errors,
-            'error'
-        )
-
     def put_data(self, semester: int=2):
         """
         Delete and insert events data to geodatabase table.
         """
         self._repo.put(self._events, self._survey_year, semester)
 
+    def check_registry(self) -> List[Check]:
+        return super().check_registry() + [
+            Check('segment_length_check', kwargs={'tolerance': 0.005}),
+            Check('surface_year_check'),
+            Check('lane_sequence_check'),
+            # Check('side_columns_check'),  # TEMPORARY DISABLED
+            Check('road_type_spec_check'),
+            Check('inner_shoulder_check', kwargs={'current_year_only': True}),  # TEMPORARY ONLY CHECK CURRENT YEAR DATA
+            Check('surface_width_check'),
+            Check('single_value_attribute_check', kwargs={'column': 'VER_ALIGNMENT'}, name='ver_alignment_check'),
+            Check('single_value_attribute_check', kwargs={'column': 'HOR_ALIGNMENT'}, name='hor_alignment_check'),
+            Check('decreasing_lane_width_check', inputs=('prev_data',), cost=2),
+            Check('decreasing_surf_width_check', inputs=('prev_data',), cost=2),
+            Check('decreasing_lane_count', inputs=('prev_data',), cost=2),
+            Check('paved_to_unpaved_check', inputs=('prev_data',), cost=2)
+        ]
+
     def base_validation(self):
         if self.prev_sem_data.no_data:
             self._result.add_message("Update parsial, namun data tahun lalu tidak tersedia", "error")
@@ -629,19 +563,8 @@ class RouteRNIValidation(RouteSegmentEventsValidation):
         
         super().base_validation()
 
-        self.segment_length_check(tolerance=0.005)
-        self.surface_year_check()
-        self.lane_sequence_check()
-        # self.side_columns_check()  # TEMPORARY DISABLED
-        self.road_type_spec_check()
-        self.inner_shoulder_check(current_year_only=True)  # TEMPORARY ONLY CHECK CURRENT YEAR DATA
-        self.surface_width_check()
-        self.single_value_attribute_check('VER_ALIGNMENT')
-        self.single_value_attribute_check('HOR_ALIGNMENT')
-        self.decreasing_lane_width_check()
-        self.decreasing_surf_width_check()
-        self.decreasing_lane_count()
-        self.paved_to_unpaved_check()
+        if self.fail_fast_run and self._result.has_blocking_error:
+            return
 
         if self._events.is_partial:
             # Merge with old data and conduct check to make sure new data has correct STA interval
@@ -8,10 +8,12 @@ from route_events import (
     RouteRNI,
     RouteRNIRepo,
     RoutePOKRepo,
-    RoutePOK
+    RoutePOK,
+    SurveyWorkbook
 )
 from ...validation_result.result import ValidationResult
-from typing import Type, Literal
+from ...validation_result.checks import Check
+from typing import Type, Literal, List
 from sqlalchemy import Engine
 import polars as pl
 from pydantic import ValidationError
@@ -32,7 +34,8 @@ class RouteRoughnessValidation(RouteSegmentEventsValidation):
         lrs: LRSRoute, 
         linkid_col: str = 'LINKID',
         ignore_review: bool = False,
-        force_write: bool = False
+        force_write: bool = False,
+        workbook: SurveyWorkbook = None
     ):
         """
         Validate RNI data in excel file.
@@ -49,14 +52,28 @@ class RouteRoughnessValidation(RouteSegmentEventsValidation):
 
         obj = None
         try:
-            events = RouteRoughness.from_excel(
-                excel_path=excel_path,
-                linkid=route,
-                linkid_col=linkid_col,
-                ignore_review=ignore_review,
-                data_year=survey_year,
-                data_semester=survey_semester
-            )
+            if workbook is None:
+                events = RouteRoughness.from_excel(
+                    excel_path=excel_path,
+                    linkid=route,
+                    linkid_col=linkid_col,
+                    ignore_review=ignore_review,
+                    collect_review=True,
+                    data_year=survey_year,
+                    data_semester=survey_semester
+                )
+            else:
+                events = workbook.events(
+                    RouteRoughness,
+                    route,
+                    ignore_review=ignore_review,
+                    collect_review=True,
+                    data_year=survey_year,
+                    data_semester=survey_semester
+                )
+
+            # Review errors are collected in the same parsing pass.
+            result.add_messages(events.review_errors.select('msg'), 'review', 'review')
 
             obj = cls(
                 route=route,
@@ -77,39 +94,17 @@ class RouteRoughnessValidation(RouteSegmentEventsValidation):
                 else:
                     result.add_message(error['msg'], 'rejected')
                 
-            if result.status == 'rejected':
-                obj = cls(
-                    route=route,
-                    events=pl.DataFrame(),
-                    lrs=None,
-                    sql_engine=sql_engine,
-                    results=result,
-                    survey_year=survey_year,
-                    survey_semester=survey_semester
-                )
-
-                return obj
-            else:
-                events = RouteRoughness.from_excel(
-                    excel_path=excel_path,
-                    linkid=route,
-                    linkid_col=linkid_col,
-                    ignore_review=True,
-                    data_year=survey_year,
-                    data_semester=survey_semester
-                )
-                
-                obj = cls(
-                    route=route,
-                    events=events,
-                    lrs=lrs,
-                    sql_engine=sql_engine,
-                    results=result,
-                    survey_year=survey_year,
-                    survey_semester=survey_semester
-                )
+            obj = cls(
+                route=route,
+                events=pl.DataFrame(),
+                lrs=None,
+                sql_engine=sql_engine,
+                results=result,
+                survey_year=survey_year,
+                survey_semester=survey_semester
+            )
 
-                return obj
+            return obj
         
         except IndexError:
             result.add_message(f"File '{excel_path}' tidak dapat ditemukan.", 'rejected')
@@ -191,7 +186,8 @@ class RouteRoughnessValidation(RouteSegmentEventsValidation):
             self._prev_rni = self._rni_repo.get_by_linkid(
                 self._route, 
                 year=self._survey_year-1,
-                raise_if_table_does_not_exists=True
+                raise_if_table_does_not_exists=True,
+                geometry=False
             )
 
             return self._prev_rni
@@ -208,7 +204,8 @@ class RouteRoughnessValidation(RouteSegmentEventsValidation):
             self._rni = self._rni_repo.get_by_linkid(
                 self._route, 
                 year=self._survey_year,
-                raise_if_table_does_not_exists=True
+                raise_if_table_does_not_exists=True,
+                geometry=False
             )
 
             return self._rni
@@ -369,13 +366,13 @@ class RouteRoughnessValidation(RouteSegmentEventsValidation):
         """
         self._repo.put(self._events, year=self._survey_year, semester=self._survey_sem)
 
-    def base_validation(self):
-        super().base_validation()
-
-        self.lane_sequence_check()
-        self.survey_date_year_check()
-        self.segment_length_check(tolerance=0.005)
-        self.kemantapan_comparison_check()
-        self.rni_segments_comparison()
-        self.route_has_rni_check()
-        self.pok_iri_check()
\ No newline at end of file
+    def check_registry(self) -> List[Check]:
+        return super().check_registry() + [
+            Check('lane_sequence_check'),
+            Check('survey_date_year_check', name='survey_date_year_recheck'),
+            Check('segment_length_check', kwargs={'tolerance': 0.005}),
+            Check('kemantapan_comparison_check', inputs=('prev_data', 'prev_rni', 'rni')),
+            Check('rni_segments_comparison', inputs=('rni',)),
+            Check('route_has_rni_check', inputs=('rni',)),
+            Check('pok_iri_check', inputs=('pok',))
+        ]
\ No newline at end of file
@@ -0,0 +1,408 @@
+from .result import ValidationResult
+from contextlib import nullcontext
+from concurrent.futures import Executor, ThreadPoolExecutor, Future
+from dataclasses import dataclass, field
+from functools import wraps
+from threading import local, Lock
+from typing import Callable, Dict, List, Literal, Tuple
+import polars as pl
+import time
+
+
+# Check input which is not loaded, but a resource which can not be used concurrently.
+# The events and RNI geometry use a DuckDB cursor, checks using the geometry are run one at a time
+# and only after all inputs are loaded (input such as df_lrs_mv also creates the events geometry).
+GEOMETRY = 'geometry'
+
+CHECK_TIMES_SCHEMA = {
+    'name': pl.String,
+    'kind': pl.String,
+    'wall_time': pl.Float64,
+    'msg_count': pl.Int64
+}
+
+
+def lazy_check(status: Literal['rejected', 'error', 'review'], ignore_in: Literal['force', 'review'] = None):
+    """
+    Check which only builds a LazyFrame of its messages (message in the first column). Calling the check collects
+    the LazyFrame and adds the messages to the validation result. In the fused run, LazyFrame of all lazy checks
+    are collected at once with collect_all.
+    """
+    def decorator(func: Callable[..., pl.LazyFrame]):
+        @wraps(func)
+        def check(self, *args, **kwargs):
+            self._result.add_messages(func(self, *args, **kwargs).collect(), status, ignore_in)
+
+            return self
+
+        check.messages = func
+        check.status = status
+        check.ignore_in = ignore_in
+
+        return check
+
+    return decorator
+
+
+@dataclass
+class Check(object):
+    """
+    Validation check, a validator check method with its keyword arguments and inputs. Input is the validator
+    property used by the check (e.g. df_lrs_mv, prev_data, rni or pok), events is always available.
+    Cost is used for running cheap checks first in the fail-fast run, default to the loaded inputs count.
+    """
+    method: str
+    inputs: Tuple[str, ...] = ()
+    kwargs: dict = field(default_factory=dict)
+    name: str = None
+    cost: int = None
+
+    def __post_init__(self):
+        if self.name is None:
+            self.name = self.method
+
+        if self.cost is None:
+            self.cost = len([_input for _input in self.inputs if _input != GEOMETRY])
+
+
+class _CallerThreadExecutor(Executor):
+    """
+    Executor which runs the function in the caller thread.
+    """
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future = Future()
+
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+        return future
+
+
+class ScheduledValidation(object):
+    """
+    Validator mixin for running checks declared in check_registry on a thread pool. Every input is loaded
+    once and before the checks which use it are started. Every check writes its messages into its own
+    ValidationResult, which is merged into the validator result in the registry order.
+    """
+    # Thread pool size, 1 (default) runs all checks sequentially in the caller thread.
+    check_workers: int = 1
+
+    # Collect all lazy checks in a single collect_all call, instead of collecting every check separately.
+    fuse_lazy_checks: bool = True
+
+    # Input which is loaded from other input, e.g. {'survey_photos': ('df_lrs_mv',)}
+    check_input_requires: Dict[str, Tuple[str, ...]] = {}
+
+    # Run the checks one at a time from the cheapest, and skip the rest after a check with blocking error.
+    fail_fast: bool = False
+
+    # Maximum messages of a single check, the rest of the check messages are dropped.
+    check_message_cap: int = None
+
+    @property
+    def _result(self) -> ValidationResult:
+        """
+        Validation result, or the check result if accessed from a running check.
+        """
+        check_local = self.__dict__.get('_check_local')
+        check_result = getattr(check_local, 'result', None)
+
+        if check_result is not None:
+            return check_result
+
+        return self.__dict__['_validation_result']
+
+    @_result.setter
+    def _result(self, result: ValidationResult):
+        self.__dict__['_validation_result'] = result
+
+    def check_registry(self) -> List[Check]:
+        """
+        Checks run by base_validation, in the message order.
+        """
+        return []
+
+    @property
+    def check_times(self) -> pl.DataFrame:
+        """
+        Wall time (in seconds) of every input, check and the whole run of the last run_checks.
+        """
+        return self.__dict__.get('_check_times', pl.DataFrame(schema=CHECK_TIMES_SCHEMA))
+
+    @property
+    def skipped_checks(self) -> List[str]:
+        """
+        Checks which are skipped by the last fail-fast run_checks.
+        """
+        return self.check_times.filter(kind='skipped')['name'].to_list()
+
+    @property
+    def fail_fast_run(self) -> bool:
+        """
+        True if the last run_checks is run with run_checks_fail_fast, either from fail_fast or its argument.
+        """
+        return self.__dict__.get('_check_fail_fast', False)
+
+    def _input_order(self, checks: List[Check]) -> List[str]:
+        """
+        All checks inputs, required input is ordered before the input which requires it.
+        """
+        names = []
+
+        def add(name: str):
+            if name in names:
+                return
+
+            for required in self.check_input_requires.get(name, ()):
+                add(required)
+
+            names.append(name)
+
+        for check in checks:
+            for _input in check.inputs:
+                if _input != GEOMETRY:
+                    add(_input)
+
+        return names
+
+    def _load_input(self, name: str, inputs: Dict[str, Future]) -> float:
+        """
+        Load the input after its required inputs are loaded.
+        """
+        for required in self.check_input_requires.get(name, ()):
+            inputs[required].result()
+
+        start = time.perf_counter()
+        getattr(self, name)
+
+        return time.perf_counter() - start
+
+    def _run_check(self, check: Check, inputs: Dict[str, Future], geometry_lock: Lock) -> Tuple[ValidationResult, float]:
+        """
+        Run a single check after its inputs are loaded, messages are written into a new ValidationResult.
+        """
+        if GEOMETRY in check.inputs:
+            wait_for = list(inputs)
+        else:
+            wait_for = check.inputs
+
+        for _input in wait_for:
+            inputs[_input].result()  # Raise the input loading error
+
+        result = self.__dict__['_validation_result'].buffer()
+        self._check_local.result = result
+
+        method = self._lazy_check(check)
+
+        try:
+            with geometry_lock if GEOMETRY in check.inputs else nullcontext():
+                start = time.perf_counter()
+
+                if method is None:
+                    getattr(self, check.method)(**check.kwargs)
+                else:
+                    result.add_messages(self._lazy_plan(check).collect(), method.status, method.ignore_in)
+
+                wall_time = time.perf_counter() - start
+
+            return result, wall_time
+        finally:
+            self._check_local.result = None
+
+    def _lazy_check(self, check: Check) -> Callable | None:
+        """
+        Check method decorated with lazy_check, None if the check is not a lazy check.
+        """
+        method = getattr(type(self), check.method)
+
+        if hasattr(method, 'messages'):
+            return method
+
+        return None
+
+    def _lazy_plan(self, check: Check) -> pl.LazyFrame:
+        """
+        Lazy check messages LazyFrame, limited to one message over the message cap.
+        """
+        plan = self._lazy_check(check).messages(self, **check.kwargs)
+
+        if self.check_message_cap is None:
+            return plan
+        else:
+            return plan.head(self.check_message_cap + 1)
+
+    def _cap_messages(self, check: Check, result: ValidationResult, times: list) -> ValidationResult:
+        """
+        Keep the first check_message_cap messages of the check result, record the capped check.
+        """
+        if (self.check_message_cap is None) or (result.message_count <= self.check_message_cap):
+            return result
+
+        times.append((check.name, 'capped', None, result.message_count))
+
+        return result.head(self.check_message_cap)
+
+    def _collect_lazy_checks(self, checks: List[Check], inputs: Dict[str, Future]) -> Tuple[List[Tuple[ValidationResult, float]], float]:
+        """
+        Build the LazyFrame of every lazy check and collect all of them at once. Return the result and LazyFrame
+        build time of every check, and the collect_all wall time.
+        """
+        for check in checks:
+            for _input in check.inputs:
+                if _input != GEOMETRY:
+                    inputs[_input].result()  # Raise the input loading error
+
+        plans = []
+        build_times = []
+
+        for check in checks:
+            start = time.perf_counter()
+            plans.append(self._lazy_plan(check))
+            build_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        dfs = pl.collect_all(plans)
+        collect_time = time.perf_counter() - start
+
+        results = []
+
+        for check, df, build_time in zip(checks, dfs, build_times):
+            method = self._lazy_check(check)
+            result = self.__dict__['_validation_result'].buffer()
+            result.add_messages(df, method.status, method.ignore_in)
+            results.append((result, build_time))
+
+        return results, collect_time
+
+    def run_checks(
+            self,
+            checks: List[Check],
+            max_workers: int = None,
+            fused: bool = None,
+            fail_fast: bool = None
+        ) -> pl.DataFrame:
+        """
+        Run the checks and merge the messages into the validation result in the checks order.
+        If fused is True (default to fuse_lazy_checks), lazy checks are collected at once with collect_all.
+        If fail_fast is True (default to fail_fast), the checks are run with run_checks_fail_fast.
+        If a check raises an error, messages of the previous checks are merged and the error is raised.
+        Return the inputs and checks wall time, also available in check_times.
+        """
+        if self.fail_fast if fail_fast is None else fail_fast:
+            return self.run_checks_fail_fast(checks)
+
+        self.__dict__['_check_fail_fast'] = False
+        max_workers = max_workers or self.check_workers
+        fused = self.fuse_lazy_checks if fused is None else fused
+        start = time.perf_counter()
+        times = []
+
+        if '_check_local' not in self.__dict__:
+            self.__dict__['_check_local'] = local()
+
+        if max_workers == 1:
+            pool = _CallerThreadExecutor()
+        else:
+            pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='check')
+
+        try:
+            # Inputs are submitted first, so every input is started before any check waits for it.
+            inputs = dict()
+
+            for name in self._input_order(checks):
+                inputs[name] = pool.submit(self._load_input, name, inputs)
+
+            # Checks index to the lazy check index in the fused collect_all
+            lazy = dict()
+
+            if fused:
+                for i, check in enumerate(checks):
+                    if self._lazy_check(check) is not None:
+                        lazy[i] = len(lazy)
+
+            if lazy:
+                fused_future = pool.submit(self._collect_lazy_checks, [checks[i] for i in lazy], inputs)
+
+            geometry_lock = Lock()
+            futures = [
+                None if i in lazy else pool.submit(self._run_check, check, inputs, geometry_lock)
+                for i, check in enumerate(checks)
+            ]
+
+            # Input loading error is raised by the check which uses it.
+            for name, future in inputs.items():
+                if future.exception() is None:
+                    times.append((name, 'input', future.result(), None))
+
+            for i, (check, future) in enumerate(zip(checks, futures)):
+                if i in lazy:
+                    fused_results, collect_time = fused_future.result()
+                    result, wall_time = fused_results[lazy[i]]
+                else:
+                    result, wall_time = future.result()
+
+                result = self._cap_messages(check, result, times)
+                self.__dict__['_validation_result'].extend(result)
+                times.append((check.name, 'check', wall_time, result.message_count))
+
+            if lazy:
+                times.append(('collect_all', 'fused', collect_time, None))
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+            times.append(('total', 'run', time.perf_counter() - start, None))
+            self.__dict__['_check_times'] = pl.DataFrame(times, schema=CHECK_TIMES_SCHEMA, orient='row')
+
+        return self.check_times
+
+    def run_checks_fail_fast(self, checks: List[Check]) -> pl.DataFrame:
+        """
+        Run the checks one at a time in the caller thread, ordered by the check cost (registry order for the
+        same cost). Inputs are loaded only before the first check which uses it. After a check with blocking
+        error (rejected or error without ignore_in) the rest of the checks are skipped and recorded in
+        check_times and skipped_checks. Messages of the finished checks are merged in the checks order.
+        """
+        self.__dict__['_check_fail_fast'] = True
+        start = time.perf_counter()
+        times = []
+        results = dict()
+
+        if '_check_local' not in self.__dict__:
+            self.__dict__['_check_local'] = local()
+
+        pool = _CallerThreadExecutor()
+        inputs = dict()
+        order = sorted(range(len(checks)), key=lambda i: checks[i].cost)
+
+        try:
+            for n, i in enumerate(order):
+                check = checks[i]
+
+                for name in self._input_order([check]):
+                    if name not in inputs:
+                        inputs[name] = pool.submit(self._load_input, name, inputs)
+
+                        if inputs[name].exception() is None:
+                            times.append((name, 'input', inputs[name].result(), None))
+
+                result, wall_time = self._run_check(check, inputs, nullcontext())
+                results[i] = (self._cap_messages(check, result, times), wall_time)
+
+                if result.has_blocking_error:
+                    for j in order[n+1:]:
+                        times.append((checks[j].name, 'skipped', None, None))
+
+                    break
+        finally:
+            for i, check in enumerate(checks):
+                if i in results:
+                    result, wall_time = results[i]
+                    self.__dict__['_validation_result'].extend(result)
+                    times.append((check.name, 'check', wall_time, result.message_count))
+
+            times.append(('total', 'run', time.perf_counter() - start, None))
+            self.__dict__['_check_times'] = pl.DataFrame(times, schema=CHECK_TIMES_SCHEMA, orient='row')
+
+        return self.check_times
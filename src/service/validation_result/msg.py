@@ -28,11 +28,21 @@ class ValidationMessages(object):
             self._id_col: pl.String
         }
 
+        self._supported_status = allowed_status
+        self._supported_ignore = allowed_ignored_status
+
+        # DataFrame chunks in the message order, from add_messages, extend and the flushed builders.
         self._df = pl.DataFrame([], schema=self._df_schema)
         self._messages = [self._df]
 
-        self._supported_status = allowed_status
-        self._supported_ignore = allowed_ignored_status
+        # Columnar builders for messages added one at a time. Status is stored as the status index and
+        # ignore_in as 0 (not ignorable) or the ignore index + 1.
+        self._msg_builder = []
+        self._status_idx_builder = []
+        self._ignore_idx_builder = []
+
+        # Message count of every status index and ignore index (0 is not ignorable).
+        self._count = [[0]*(len(self._supported_ignore) + 1) for _ in self._supported_status]
 
     def add_message(self, msg: str, msg_status: str, ignore_in=None):
         """
@@ -44,16 +54,13 @@ class ValidationMessages(object):
         if (ignore_in not in self._supported_ignore) and (ignore_in is not None):
             raise ValueError(f"ignore message in {ignore_in} is not supported.")
         
-        new_row = pl.DataFrame({
-            'msg': [msg],  
-            'status': [msg_status], 
-            'status_idx': [self._supported_status.index(msg_status)],
-            'ignore_in': [ignore_in], 
-            'id': [self._id]
-        }, schema=self._df_schema)
+        status_idx = self._supported_status.index(msg_status)
+        ignore_idx = 0 if ignore_in is None else self._supported_ignore.index(ignore_in) + 1
 
-        self._messages.append(new_row)
-        # self._df = pl.concat([self._df, new_row])
+        self._msg_builder.append(msg)
+        self._status_idx_builder.append(status_idx)
+        self._ignore_idx_builder.append(ignore_idx)
+        self._count[status_idx][ignore_idx] += 1
 
         return self
     
@@ -67,21 +74,119 @@ class ValidationMessages(object):
         if (ignore_in not in self._supported_ignore) and (ignore_in is not None):
             raise ValueError(f"ignore message in {ignore_in} is not supported.")
         
-        self._df = self._messages.append(
+        status_idx = self._supported_status.index(msg_status)
+        ignore_idx = 0 if ignore_in is None else self._supported_ignore.index(ignore_in) + 1
+
+        self._flush()
+        self._messages.append(
             df.select(
                 pl.first().alias('msg')
             ).with_columns(
                 status=pl.lit(msg_status),
-                status_idx=pl.lit(self._supported_status.index(msg_status)).cast(pl.Int16),
+                status_idx=pl.lit(status_idx).cast(pl.Int16),
                 ignore_in=pl.lit(ignore_in).cast(pl.String),
                 id=pl.lit(self._id)
             ).select(
                 ['msg', 'status', 'status_idx', 'ignore_in', 'id']
             )
         )
+        self._count[status_idx][ignore_idx] += df.height
 
         return self
     
+    def extend(self, other: "ValidationMessages"):
+        """
+        Concat messages from other ValidationMessages, message id is kept.
+        """
+        self._flush()
+        self._messages.append(other.df)
+
+        for msg_status, ignore_in, count in other.counts():
+            status_idx = self._supported_status.index(msg_status)
+            ignore_idx = 0 if ignore_in is None else self._supported_ignore.index(ignore_in) + 1
+            self._count[status_idx][ignore_idx] += count
+
+        return self
+
+    def head(self, n: int) -> "ValidationMessages":
+        """
+        New ValidationMessages with the first n messages.
+        """
+        df = self.df.head(n)
+        other = ValidationMessages(self._id, self._supported_status, self._supported_ignore)
+        other._messages.append(df)
+
+        for status_idx, ignore_in, count in df.group_by(
+            [self._status_idx_col, self._ignore_in_col]
+        ).len().rows():
+            ignore_idx = 0 if ignore_in is None else self._supported_ignore.index(ignore_in) + 1
+            other._count[status_idx][ignore_idx] += count
+
+        return other
+
+    def _flush(self):
+        """
+        Move the messages in the columnar builders into a DataFrame chunk.
+        """
+        if not self._msg_builder:
+            return self
+
+        self._messages.append(
+            pl.DataFrame({
+                self._msg_col: pl.Series(self._msg_builder, dtype=pl.String),
+                self._status_idx_col: pl.Series(self._status_idx_builder, dtype=pl.Int16),
+                '_ignore_idx': pl.Series(self._ignore_idx_builder, dtype=pl.Int8)
+            }).select(
+                pl.col(self._msg_col),
+                pl.col(self._status_idx_col).replace_strict(
+                    list(range(len(self._supported_status))),
+                    self._supported_status,
+                    return_dtype=pl.String
+                ).alias(self._status_col),
+                pl.col(self._status_idx_col),
+                pl.col('_ignore_idx').replace_strict(
+                    list(range(1, len(self._supported_ignore) + 1)),
+                    self._supported_ignore,
+                    default=None,
+                    return_dtype=pl.String
+                ).alias(self._ignore_in_col),
+                pl.lit(self._id, dtype=pl.String).alias(self._id_col)
+            )
+        )
+
+        self._msg_builder = []
+        self._status_idx_builder = []
+        self._ignore_idx_builder = []
+
+        return self
+
+    def counts(self) -> list:
+        """
+        Messages count of every status and ignore_in combination with at least one message.
+        """
+        ignores = [None] + self._supported_ignore
+
+        return [
+            (msg_status, ignores[ignore_idx], count)
+            for msg_status, row in zip(self._supported_status, self._count)
+            for ignore_idx, count in enumerate(row)
+            if count > 0
+        ]
+
+    @property
+    def count(self) -> int:
+        """
+        All messages count.
+        """
+        return sum(sum(row) for row in self._count)
+
+    @property
+    def all_status(self) -> list:
+        """
+        All status with at least one message, in the status index order.
+        """
+        return [status for status, row in zip(self._supported_status, self._count) if sum(row) > 0]
+
     def filter(self, ignored: list | str):
         """
         Get message with 'ignore_in' filter applied.
@@ -119,6 +224,8 @@ class ValidationMessages(object):
         """
         Return the concatted DataFrames/messages.
         """
+        self._flush()
+
         # If contain other object other than the original self._df
         if len(self._messages) > 1:
             self._df =  pl.concat(self._messages)
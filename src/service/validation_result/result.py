@@ -31,6 +31,11 @@ class ValidationResult(object):
         else:
             self._ignore_in = None
 
+        # Running aggregates of the added messages.
+        self._min_status_idx = len(self._state) - 1  # Minimum status index of the non-ignored messages
+        self._ignore_tags = set()  # All ignore_in tags
+        self._has_non_ignorable = False  # Any message without ignore_in
+
     @classmethod
     def from_validation_process(cls, id: str):
         """
@@ -52,14 +57,14 @@ class ValidationResult(object):
         """
         Get all messages count.
         """
-        return self._msg.df.select(pl.len())['len'][0]
+        return self._msg.count
     
     @property
     def all_message_status(self) -> List[str]:
         """
         All available message status.
         """
-        return self._msg.df[self._msg._status_col].unique().to_list()
+        return self._msg.all_status
     
     @property
     def all_ignorables(self) -> List[str]:
@@ -70,12 +75,10 @@ class ValidationResult(object):
         """
         if self.status == 'rejected':
             return []
-        elif self._msg.df[self._msg._ignore_in_col].is_null().any():
+        elif self._has_non_ignorable:
             return []
         else:
-            return self._msg.df.filter(
-                pl.col(self._msg._ignore_in_col).is_not_null()
-            )[self._msg._ignore_in_col].unique().to_list()
+            return [tag for tag in self._msg._supported_ignore if tag in self._ignore_tags]
     
     def get_filtered_msg(self)->pl.DataFrame:
         """
@@ -96,6 +99,7 @@ class ValidationResult(object):
         Add message to ValidationMessage
         """
         self._msg.add_message(msg, status, ignore_in)
+        self._track(status, ignore_in, 1)
 
         return self
 
@@ -109,6 +113,71 @@ class ValidationResult(object):
         Concat a DataFrame containing messages.
         """
         self._msg.add_messages(df, status, ignore_in)
+        self._track(status, ignore_in, df.height)
+
+        return self
+
+    def buffer(self) -> "ValidationResult":
+        """
+        Empty ValidationResult with the same id and ignore_in, e.g. for collecting a single check messages
+        which is then added with extend.
+        """
+        return ValidationResult(self._msg._id, ignore_in=self._ignore_in)
+
+    def extend(self, other: "ValidationResult"):
+        """
+        Add all messages from other ValidationResult, e.g. result of other route in the same workbook.
+        """
+        self._msg.extend(other._msg)
+
+        for status, ignore_in, count in other._msg.counts():
+            self._track(status, ignore_in, count)
+
+        return self
+
+    def head(self, n: int) -> "ValidationResult":
+        """
+        New ValidationResult with the first n messages, e.g. for capping a single check messages.
+        """
+        result = self.buffer()
+        result._msg = self._msg.head(n)
+
+        for status, ignore_in, count in result._msg.counts():
+            result._track(status, ignore_in, count)
+
+        return result
+
+    @property
+    def has_blocking_error(self) -> bool:
+        """
+        Any rejected message or error message without ignore_in. The status can not be better than error
+        and there are no ignorables, regardless of the other messages.
+        """
+        return any(
+            (status == 'rejected') or ((status == 'error') and (ignore_in is None))
+            for status, ignore_in, _ in self._msg.counts()
+        )
+
+    def _track(self, status: str, ignore_in: str | None, count: int):
+        """
+        Update the running aggregates with added messages. Message is not ignored if ignore_in is None,
+        the message status is rejected or its ignore_in is not ignored (same as ValidationMessages.filter).
+        """
+        if count == 0:
+            return self
+
+        if ignore_in is None:
+            self._has_non_ignorable = True
+        else:
+            self._ignore_tags.add(ignore_in)
+
+        if (
+            (self._ignore_in is None) or
+            (ignore_in is None) or
+            (status == 'rejected') or
+            (ignore_in not in self._ignore_in)
+        ):
+            self._min_status_idx = min(self._min_status_idx, self._state.index(status))
 
         return self
 
@@ -117,13 +186,7 @@ class ValidationResult(object):
         """
         Validation result status.
         """
-        if self.get_filtered_msg().is_empty():
-            return self._state[-1]
-        else:
-            return self._state[
-                self.get_filtered_msg().
-                sort('status_idx')['status_idx'].min()
-            ]
+        return self._state[self._min_status_idx]
         
     def to_smd_format(
             self, 
@@ -0,0 +1,267 @@
+"""
+Benchmark the optimized paths against their reference implementation.
+This script is not part of the unit tests, run it from the repository root with all or the selected benchmarks:
+
+    python -m tests.benchmark
+    python -m tests.benchmark lrs_decoder
+"""
+
+import sys
+import time
+from typing import Callable, Dict
+
+import numpy as np
+import polars as pl
+from pydantic import ValidationError
+
+from route_events import RouteRNI, SurveyWorkbook
+from route_events.route.decoder import decode_features, decode_features_loop
+from route_events.route.index import SegmentIndex
+from route_events.route.snap import snap_points
+from route_events.schema import RouteEventsSchema
+from route_events.segments.base.index import SegmentIntervalIndex
+from route_events.segments.base.model import RouteSegmentEvents
+from src.service.validation_result.result import ValidationResult
+from tests.domain.lrs.test_lrs_decoder import synthetic_route
+from tests.domain.lrs.test_segment_index import synthetic_polyline
+from tests.domain.route_segments.test_interval_index import PolarsReference, synthetic_route as synthetic_segments
+from tests.service.test_validation_checks import SlowValidation
+
+
+BENCHMARKS: Dict[str, Callable[[], None]] = dict()
+
+
+def benchmark(func: Callable[[], None]) -> Callable[[], None]:
+    """
+    Register a benchmark function, named after the function without the bench_ prefix.
+    """
+    BENCHMARKS[func.__name__.removeprefix('bench_')] = func
+
+    return func
+
+
+def timed(func: Callable, repeat: int = 1) -> float:
+    """
+    Average wall-clock time (in seconds) of the function call.
+    """
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        func()
+
+    return (time.perf_counter() - start)/repeat
+
+
+@benchmark
+def bench_lrs_decoder():
+    """
+    Vectorized decoder against vertex loop decoder on 50k vertex route.
+    """
+    features = [synthetic_route(50_000)]
+    loop = timed(lambda: decode_features_loop(features), repeat=5)
+    vectorized = timed(lambda: decode_features(features), repeat=5)
+
+    print(f"50k vertex decode: loop {loop*1000:.1f}ms, vectorized {vectorized*1000:.1f}ms")
+
+
+@benchmark
+def bench_segment_index():
+    """
+    Indexed snapping against brute force snapping, for points near the route and far from the route.
+    """
+    vx, vy = synthetic_polyline(30_000)
+    rng = np.random.default_rng(3)
+    idx = rng.integers(0, 30_000, 2000)
+    px = vx[idx] + rng.normal(0, 10, 2000)
+    py = vy[idx] + rng.normal(0, 10, 2000)
+
+    brute_force = timed(lambda: snap_points(px, py, vx, vy))
+    build = timed(lambda: SegmentIndex(vx, vy))
+    index = SegmentIndex(vx, vy)
+    indexed = timed(lambda: index.snap(px, py))
+
+    print(
+        f"30k vertex, 2k points snapping: brute force {brute_force*1000:.1f}ms, "
+        f"index build {build*1000:.1f}ms, indexed {indexed*1000:.1f}ms"
+    )
+
+    # Broken survey file, every point is far from the route.
+    vx, vy = synthetic_polyline(2000)
+    rng = np.random.default_rng(4)
+    idx = rng.integers(0, 2000, 20_000)
+    angle = rng.uniform(0, 2*np.pi, 20_000)
+    offset = rng.choice([500, 2000, 5000], 20_000)
+    px = vx[idx] + offset*np.cos(angle)
+    py = vy[idx] + offset*np.sin(angle)
+
+    brute_force = timed(lambda: snap_points(px, py, vx, vy))
+    index = SegmentIndex(vx, vy)
+    indexed = timed(lambda: index.snap(px, py))
+
+    print(f"2k vertex, 20k off-route points: brute force {brute_force*1000:.1f}ms, indexed {indexed*1000:.1f}ms")
+
+
+@benchmark
+def bench_schema_engine():
+    """
+    Polars schema engine against Pydantic model on RNI Excel input.
+    """
+    schema = RouteEventsSchema('src/route_events/segments/rni/schema.json', ignore_review_err=True)
+    df_str = pl.read_excel(
+        'tests/domain/route_segments/input_excels/balai_5_15007_15008_15009_15010.xlsx',
+        engine='calamine',
+        infer_schema_length=None
+    ).rename(str.upper).cast(pl.String)
+
+    def validate(backend: str):
+        try:
+            schema.validate(df_str, backend=backend)
+        except ValidationError:
+            pass
+
+    pydantic = timed(lambda: validate('pydantic'))
+    polars = timed(lambda: validate('polars'))
+
+    print(f"{df_str.height} rows validation: pydantic {pydantic*1000:.1f}ms, polars {polars*1000:.1f}ms")
+
+
+@benchmark
+def bench_typed_input():
+    """
+    String and typed PCI Excel input, read time and number of string cells parsed by the validator.
+    """
+    excel_path = 'tests/domain/route_segments/input_excels/pci_14_17-08-2025_133137_8988.xlsx'
+    schema = RouteEventsSchema('src/route_events/segments/pci/schema.json', ignore_review_err=True)
+
+    def read_str():
+        return pl.read_excel(
+            excel_path,
+            engine='calamine',
+            infer_schema_length=None
+        ).rename(str.upper).cast(pl.String)
+
+    def string_cells(df: pl.DataFrame) -> int:
+        return df.select(pl.col(pl.String).is_not_null().sum()).sum_horizontal()[0]
+
+    df_str = read_str()
+    df_typed = schema.read_excel(excel_path)
+    str_time = timed(read_str)
+    typed_time = timed(lambda: schema.read_excel(excel_path))
+
+    print(
+        f"{df_str.height} rows PCI input: string {str_time*1000:.1f}ms ({df_str.width} columns, "
+        f"{string_cells(df_str)} string cells), typed {typed_time*1000:.1f}ms ({df_typed.width} columns, "
+        f"{string_cells(df_typed)} string cells)"
+    )
+
+
+@benchmark
+def bench_interval_index():
+    """
+    Segment interval index against Polars group by on synthetic 200km 4 lanes route.
+    """
+    df = synthetic_segments(length_km=200, lanes=4)
+    events = RouteSegmentEvents(df.to_arrow(), route='01001', geometry=False)
+
+    def group_by():
+        PolarsReference.sta_gap(df)
+        PolarsReference.overlapping_segments(df)
+        PolarsReference.is_duplicate_segment(df)
+        PolarsReference.incorrect_lane_sequence(df)
+        PolarsReference.segment_attribute_n_unique(df, ['ATTR'])
+
+    def query(index: SegmentIntervalIndex):
+        index.gaps()
+        index.overlaps()
+        index.duplicates()
+        index.segment_sequence_gap(df['LANE_CODE'].str.tail(1).cast(pl.Int16))
+        index.segment_n_unique(df['ATTR'])
+
+    def methods():
+        events.sta_gap()
+        events.overlapping_segments()
+        events.is_duplicate_segment()
+        events.incorrect_lane_sequence()
+        events.segment_attribute_n_unique(['ATTR'], filter=('gt', 1))
+
+    group_by_time = timed(group_by)
+    build = timed(lambda: SegmentIntervalIndex(df))
+    index = SegmentIntervalIndex(df)
+    query_time = timed(lambda: query(index))
+    methods_time = timed(methods)
+
+    print(
+        f"{df.height} rows: group by {group_by_time*1000:.1f}ms, index build {build*1000:.1f}ms, "
+        f"index query {query_time*1000:.1f}ms, events methods (with DTO) {methods_time*1000:.1f}ms"
+    )
+
+
+@benchmark
+def bench_survey_workbook():
+    """
+    Parse the workbook once and partition, compared with parsing the workbook for every route.
+    """
+    excel_path = 'tests/domain/route_segments/input_excels/balai_5_15007_15008_15009_15010.xlsx'
+    routes = ['15007', '15008', '15009', '15010']
+
+    def per_route():
+        for route in routes:
+            RouteRNI.from_excel(excel_path, linkid=route, collect_review=True)
+
+    def partitioned():
+        workbook = SurveyWorkbook(excel_path)
+        for route in routes:
+            workbook.events(RouteRNI, route, collect_review=True)
+
+    per_route_time = timed(per_route)
+    partitioned_time = timed(partitioned)
+
+    print(f"{len(routes)} routes: parse per route {per_route_time*1000:.1f}ms, workbook {partitioned_time*1000:.1f}ms")
+
+
+@benchmark
+def bench_scheduled_checks():
+    """
+    Sequential and concurrent checks wall-clock time, with slow inputs and checks.
+    """
+    for workers in [1, 4]:
+        check = SlowValidation(ValidationResult('01001'), delay=0.1)
+        run_time = timed(lambda: check.run_checks(check.check_registry(), max_workers=workers))
+
+        print(f"{workers} worker(s): {run_time*1000:.1f}ms")
+        print(check.check_times)
+
+
+@benchmark
+def bench_validation_result():
+    """
+    Add messages one at a time, with status read after every message.
+    """
+    def add_messages():
+        result = ValidationResult('1234')
+
+        for i in range(50000):
+            result.add_message(f'msg {i}', 'error', 'force' if i % 2 else None)
+            result.status
+            result.all_ignorables
+
+        result.get_all_messages(drop_duplicate=False)
+
+    print(f"50000 messages: {timed(add_messages)*1000:.1f}ms")
+
+
+def main(names):
+    for name in names or BENCHMARKS:
+        if name not in BENCHMARKS:
+            print(f"Unknown benchmark {name}, available: {', '.join(BENCHMARKS)}")
+            return False
+
+    for name in names or BENCHMARKS:
+        print(f"\n[{name}]")
+        BENCHMARKS[name]()
+
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main(sys.argv[1:]) else 1)
@@ -0,0 +1,72 @@
+import unittest
+import numpy as np
+import polars as pl
+from route_events.geometry import Points, LAMBERT_WKT
+from route_events.geometry.projection import LAMBERT, transform_coordinates
+from route_events.utils.ddb import ddb_cursor
+
+
+class TestLambertProjection(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.lon = rng.uniform(95, 141, 10_000)
+        self.lat = rng.uniform(-11, 6, 10_000)
+        self.ddb = ddb_cursor(('spatial',))
+
+    def test_forward(self):
+        """
+        Compare projected coordinates with DuckDB ST_Transform, difference should be below 1mm.
+        """
+        coords = pl.DataFrame({'lat': self.lat, 'lon': self.lon})
+        expected = self.ddb.sql(f"""
+            select ST_X(point) as x, ST_Y(point) as y from
+            (select ST_Transform(ST_Point(lat, lon), 'EPSG:4326', '{LAMBERT_WKT}') as point from coords)
+            """).pl()
+
+        x, y = LAMBERT.forward(self.lon, self.lat)
+
+        self.assertTrue(np.abs(x - expected['x'].to_numpy()).max() < 1e-3)
+        self.assertTrue(np.abs(y - expected['y'].to_numpy()).max() < 1e-3)
+
+    def test_inverse(self):
+        """
+        Compare unprojected coordinates with DuckDB ST_Transform, difference should be below 1mm.
+        """
+        x, y = LAMBERT.forward(self.lon, self.lat)
+        coords = pl.DataFrame({'x': x, 'y': y})
+        expected = self.ddb.sql(f"""
+            select ST_X(point) as lat, ST_Y(point) as lon from
+            (select ST_Transform(ST_Point(x, y), '{LAMBERT_WKT}', 'EPSG:4326') as point from coords)
+            """).pl()
+
+        lon, lat = LAMBERT.inverse(x, y)
+
+        # 1e-8 degree is around 1mm
+        self.assertTrue(np.abs(lon - expected['lon'].to_numpy()).max() < 1e-8)
+        self.assertTrue(np.abs(lat - expected['lat'].to_numpy()).max() < 1e-8)
+        self.assertTrue(np.abs(lon - self.lon).max() < 1e-8)
+
+    def test_unsupported_transformation(self):
+        """
+        Unsupported transformation should fall back to DuckDB.
+        """
+        self.assertIsNone(transform_coordinates(self.lat, self.lon, 'EPSG:4326', 'EPSG:3857'))
+
+    def test_points_transform(self):
+        """
+        Points transformation with native projection, including the invert and null coordinates.
+        """
+        df = pl.DataFrame({
+            'id': [1, 2, 3],
+            'long': [95.42103999972832, 107.79631039982367, None],
+            'lat': [5.647860000331377, -6.2886600492326155, None]
+        })
+
+        transformed = Points(df, long_col='long', lat_col='lat', wkt='EPSG:4326', ids_column=['id']).transform(
+            LAMBERT_WKT, invert=True
+        )
+
+        self.assertEqual(transformed._rows.columns, ['id', 'long', 'lat'])
+        self.assertAlmostEqual(transformed._rows['lat'][0], 609253.9258999936, places=6)
+        self.assertAlmostEqual(transformed._rows['long'][0], -2184157.971000001, places=6)
+        self.assertEqual(transformed._rows['lat'].null_count(), 1)
@@ -0,0 +1,136 @@
+from route_events.route import LRSRoute, LRSRouteCache
+from route_events.geometry.point import Points
+from route_events.geometry import LAMBERT_WKT
+from concurrent.futures import ThreadPoolExecutor
+import unittest
+import polars as pl
+
+
+class FakeTimer(object):
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRSRouteCache(unittest.TestCase):
+    def setUp(self):
+        self.load_count = 0
+
+        def loader(grpc_host, route):
+            self.load_count += 1
+
+            if route == 'ABCD':
+                return None  # Route does not exists on LRS Network
+
+            return LRSRoute.from_geojson_file('tests/domain/lrs/lrs_15010.json')
+
+        self.loader = loader
+
+    def test_hit_and_miss(self):
+        """
+        Test cache hit and miss counter.
+        """
+        cache = LRSRouteCache(loader=self.loader)
+
+        first = cache.get('localhost:50052', '15010')
+        second = cache.get('localhost:50052', '15010')
+
+        self.assertTrue(first is second)
+        self.assertEqual(self.load_count, 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.vertex_count, first.vertex_count)
+
+        # Different geometry version is a different entry
+        cache.get('localhost:50052', '15010', geometry_version='2025')
+        self.assertEqual(self.load_count, 2)
+
+    def test_empty_route_not_cached(self):
+        """
+        Test route which does not exists in the LRS Network.
+        """
+        cache = LRSRouteCache(loader=self.loader)
+
+        self.assertTrue(cache.get('localhost:50052', 'ABCD') is None)
+        self.assertTrue(cache.get('localhost:50052', 'ABCD') is None)
+        self.assertEqual(self.load_count, 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_ttl(self):
+        """
+        Test cache entry expiration.
+        """
+        timer = FakeTimer()
+        cache = LRSRouteCache(ttl=60, loader=self.loader, timer=timer)
+
+        cache.get('localhost:50052', '15010')
+        timer.now = 30
+        cache.get('localhost:50052', '15010')
+        self.assertEqual(self.load_count, 1)
+
+        timer.now = 61
+        cache.get('localhost:50052', '15010')
+        self.assertEqual(self.load_count, 2)
+
+    def test_max_vertices(self):
+        """
+        Test LRU eviction based on vertex count.
+        """
+        vertex_count = LRSRoute.from_geojson_file('tests/domain/lrs/lrs_15010.json').vertex_count
+        cache = LRSRouteCache(max_vertices=vertex_count*2, loader=self.loader)
+
+        cache.get('localhost:50052', '15010', geometry_version=1)
+        cache.get('localhost:50052', '15010', geometry_version=2)
+        cache.get('localhost:50052', '15010', geometry_version=1)  # Version 2 is now the least recently used
+        cache.get('localhost:50052', '15010', geometry_version=3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertTrue(cache.vertex_count <= vertex_count*2)
+
+        cache.get('localhost:50052', '15010', geometry_version=1)
+        self.assertEqual(self.load_count, 3)
+
+        # Route larger than the cache size is returned but not cached
+        cache = LRSRouteCache(max_vertices=10, loader=self.loader)
+        self.assertTrue(cache.get('localhost:50052', '15010') is not None)
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate(self):
+        """
+        Test cache invalidation.
+        """
+        cache = LRSRouteCache(loader=self.loader)
+        cache.get('localhost:50052', '15010')
+        cache.invalidate('15010')
+
+        self.assertEqual(len(cache), 0)
+
+    def test_concurrent_queries(self):
+        """
+        Test cached route queried by concurrent threads, with the same result as sequential queries.
+        """
+        cache = LRSRouteCache(loader=self.loader)
+        lrs = cache.get('localhost:50052', '15010')
+        points = Points(
+            pl.read_parquet('tests/domain/lrs/lambert_15010.parquet').head(50),
+            'TO_STA_LAT',
+            'TO_STA_LONG',
+            wkt=LAMBERT_WKT
+        )
+
+        def query(_):
+            route = cache.get('localhost:50052', '15010')
+
+            return route.get_points_m_value(points, engine='duckdb').sort('point_id')
+
+        expected = query(None)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(query, range(32)))
+
+        self.assertIs(cache.get('localhost:50052', '15010'), lrs)
+
+        for m_values in results:
+            self.assertTrue(m_values.equals(expected))
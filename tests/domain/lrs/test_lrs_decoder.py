@@ -0,0 +1,66 @@
+from route_events.route.decoder import decode_features, decode_features_loop
+from route_events.route.lrs import LRSRoute
+import unittest
+import json
+import numpy as np
+
+
+def synthetic_route(n_vertex: int, n_parts: int = 4, routeid: str = '99999') -> dict:
+    """
+    Generate MultiLineString route feature with Z and M value.
+    """
+    rng = np.random.default_rng(0)
+    x = 104 + np.cumsum(rng.uniform(0, 1e-4, n_vertex))
+    y = -3 + np.cumsum(rng.uniform(-1e-4, 1e-4, n_vertex))
+    m = np.linspace(0, n_vertex/100, n_vertex)
+    coords = np.column_stack([x, y, np.zeros(n_vertex), m]).tolist()
+
+    return {
+        'type': 'Feature',
+        'geometry': {
+            'type': 'MultiLineString',
+            'coordinates': [part.tolist() for part in np.array_split(np.array(coords), n_parts)]
+        },
+        'properties': {'LINKID': routeid}
+    }
+
+
+class TestLRSDecoder(unittest.TestCase):
+    def test_decode_features(self):
+        """
+        Compare vectorized decoder with the vertex loop decoder.
+        """
+        with open('tests/domain/lrs/lrs_15010.json') as jf:
+            features = json.load(jf)['features']
+
+        self.assertTrue(decode_features(features).equals(decode_features_loop(features)))
+
+    def test_decode_multi_features(self):
+        """
+        Test decoder with multiple routes and multiple features of a single route.
+        """
+        features = [
+            synthetic_route(100, routeid='A'),
+            synthetic_route(50, routeid='B'),
+            synthetic_route(30, routeid='A')
+        ]
+        features[1]['geometry'] = {
+            'type': 'LineString',
+            'coordinates': features[1]['geometry']['coordinates'][0]
+        }
+
+        table = decode_features(features)
+
+        self.assertTrue(table.equals(decode_features_loop(features)))
+        self.assertEqual(table.num_rows, 100 + 13 + 30)
+        self.assertEqual(table['VERTEX_SEQ'].to_pylist()[-30:], list(range(100, 130)))
+        self.assertEqual(table['MVAL'].to_pylist()[:2], [0, 1/99])
+
+    def test_lrs_from_features(self):
+        """
+        Test LRSRoute from features using the vectorized decoder.
+        """
+        lrs = LRSRoute.from_features([synthetic_route(1000)])
+
+        self.assertEqual(lrs.vertex_count, 1000)
+        self.assertEqual(lrs.df['LONG'][0], lrs.df['LONG'].min())
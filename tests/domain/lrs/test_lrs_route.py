@@ -1,7 +1,12 @@
-from route_events.route.lrs import LRSRoute
+from route_events.route.lrs import LRSRoute, LRSRouteCollection
+from route_events.route.snap import snap_points
 import unittest
+import json
+import copy
+import grpc
 import pyarrow as pa
 import polars as pl
+import numpy as np
 from route_events.geometry.point import Points
 from route_events.geometry import LAMBERT_WKT
 
@@ -25,6 +30,83 @@ class TestLRSFactory(unittest.TestCase):
         self.assertTrue(lrs is None)
 
 
+    def test_lrs_from_feature_service_many(self):
+        """
+        Generate multiple LRSRoute object from a single GRPC request.
+        """
+        lrs = LRSRoute.from_feature_service_many('localhost:50052', ['01001', '15010', 'ABCD'])
+
+        self.assertTrue(type(lrs) == LRSRouteCollection)
+        self.assertTrue(type(lrs['15010']) == LRSRoute)
+        self.assertTrue(lrs.get('ABCD') is None)
+
+    def test_fetch_features_split_large_response(self):
+        """
+        Test request split when the response exceeds the message size limit.
+        """
+        class ResourceExhausted(grpc.RpcError):
+            def code(self):
+                return grpc.StatusCode.RESOURCE_EXHAUSTED
+            
+        class Stub(object):
+            def __init__(self):
+                self.requests = []
+
+            def GetByRouteId(self, request):
+                self.requests.append(list(request.routes))
+
+                if len(request.routes) > 1:
+                    raise ResourceExhausted()
+                
+                feature = {'properties': {'LINKID': request.routes[0]}}
+                return type('Routes', (), {'geojson': json.dumps({'features': [feature]})})
+            
+        stub = Stub()
+        features = LRSRoute._fetch_features(stub, ['01001', '01002', '01003'])
+
+        self.assertEqual([f['properties']['LINKID'] for f in features], ['01001', '01002', '01003'])
+        self.assertEqual(stub.requests[0], ['01001', '01002', '01003'])
+
+    def test_lrs_collection(self):
+        """
+        Test LRSRoute collection from multi route GeoJSON features.
+        """
+        with open('tests/domain/lrs/lrs_15010.json') as jf:
+            features = json.load(jf)['features']
+
+        other = copy.deepcopy(features[0])
+        other['properties']['LINKID'] = '15011'
+        other['properties']['ROAD_FUNCTION'] = 'K'
+
+        routes = LRSRouteCollection(features + [other])
+
+        self.assertEqual(list(routes), ['15010', '15011'])
+        self.assertEqual(len(routes._routes), 0)  # Not yet built
+        self.assertTrue(routes['15011'].function == 'K')
+        self.assertTrue(routes['15010'].function == 'A')
+        self.assertTrue(routes['15010'].max_m_value == 92.30999999999767)
+        self.assertTrue(routes['15010'] is routes['15010'])
+        self.assertTrue(routes.get('ABCD') is None)
+
+    def test_lrs_from_multi_feature_geojson(self):
+        """
+        Test LRSRoute from GeoJSON with multiple features of the same route.
+        """
+        with open('tests/domain/lrs/lrs_15010.json') as jf:
+            feature = json.load(jf)['features'][0]
+
+        first = copy.deepcopy(feature)
+        second = copy.deepcopy(feature)
+        coords = feature['geometry']['coordinates'][0]
+        first['geometry']['coordinates'] = [coords[:100]]
+        second['geometry']['coordinates'] = [coords[100:]]
+
+        lrs = LRSRoute.from_features([first, second])
+
+        self.assertEqual(lrs.vertex_count, len(coords))
+        self.assertEqual(lrs.df['VERTEX_SEQ'].to_list(), list(range(len(coords))))
+
+
 class TestLRSMethod(unittest.TestCase):
     def test_lrs_road_properties(self):
         """
@@ -90,6 +172,38 @@ class TestLRSMethod(unittest.TestCase):
 
         lrs.get_points_m_value(points=points)
 
+    def test_get_points_m_value_numpy_engine(self):
+        """
+        Test NumPy M-Value engine against DuckDB M-Value engine.
+        """
+        df = pl.read_parquet('tests/domain/lrs/lambert_15010.parquet')
+
+        # Inverted
+        points = Points(
+            df, 
+            'TO_STA_LAT', 
+            'TO_STA_LONG', 
+            wkt=LAMBERT_WKT
+            )
+        
+        lrs = LRSRoute.from_geojson_file('tests/domain/lrs/lrs_15010.json')
+
+        np_mv = lrs.get_points_m_value(points=points, engine='numpy')
+        ddb_mv = lrs.get_points_m_value(points=points, engine='duckdb')
+
+        self.assertEqual(np_mv.columns, ddb_mv.columns)
+        self.assertEqual(np_mv.shape, ddb_mv.shape)
+
+        diff = np_mv.join(
+            ddb_mv, on='point_id', suffix='_ddb'
+        ).select(
+            m_val=(pl.col('m_val')-pl.col('m_val_ddb')).abs().max(),
+            dist=(pl.col('dist')-pl.col('dist_ddb')).abs().max()
+        )
+
+        self.assertTrue(diff['m_val'][0] < 1e-6)
+        self.assertTrue(diff['dist'][0] < 1e-6)
+
     def test_max_m_value(self):
         """
         Test LRS max M-Value property.
@@ -98,3 +212,144 @@ class TestLRSMethod(unittest.TestCase):
 
         self.assertTrue(type(lrs.max_m_value) == float)
         self.assertTrue(lrs.max_m_value == 92.30999999999767)
+
+    def test_locate_m_values(self):
+        """
+        Locate M-Values along the LRS geometry and snap the located points back to the LRS geometry.
+        """
+        lrs = LRSRoute.from_geojson_file('tests/domain/lrs/lrs_15010.json')
+        m = np.linspace(0, lrs.max_m_value*1000, 500)
+
+        x, y = lrs.locate_m_values(m)
+        points = Points(
+            pl.DataFrame({'x': x, 'y': y}),
+            'y',
+            'x',
+            wkt=LAMBERT_WKT
+        )
+
+        mv = lrs.get_points_m_value(points)
+
+        self.assertTrue(np.abs(mv['m_val'].to_numpy() - m).max() < 1e-3)
+        self.assertTrue(mv['dist'].max() < 1e-6)
+
+        # Vertex M-Value is located on the vertex
+        lrs_df = lrs.df.unique(lrs.mval_col, keep='none')
+        long, lat = lrs.locate_m_values(lrs_df[lrs.mval_col].to_numpy(), unit='km', wkt='EPSG:4326')
+
+        self.assertTrue(np.abs(long - lrs_df[lrs.long_col].to_numpy()).max() < 1e-8)
+        self.assertTrue(np.abs(lat - lrs_df[lrs.lat_col].to_numpy()).max() < 1e-8)
+
+        # Outside of the route M-Value range
+        x, y = lrs.locate_m_values(np.array([-10, lrs.max_m_value*1000 + 10, np.nan]))
+
+        self.assertTrue(np.isnan(x).all() and np.isnan(y).all())
+
+    def test_get_points_sta_drift(self):
+        """
+        Test distance between points and the location of their STA.
+        """
+        lrs = LRSRoute.from_geojson_file('tests/domain/lrs/lrs_15010.json')
+        m = np.array([100, 2000, 50_000])
+
+        long, lat = lrs.locate_m_values(m, wkt='EPSG:4326')
+        points = Points(
+            pl.DataFrame({'long': long, 'lat': lat}),
+            'long',
+            'lat',
+            wkt='EPSG:4326'
+        )
+
+        drift = lrs.get_points_sta_drift(points, np.array([100, 2030, 200_000]))['drift']
+
+        self.assertTrue(drift[0] < 1e-3)
+        self.assertTrue(abs(drift[1] - 30) < 1)
+        self.assertIsNone(drift[2])
+
+    def test_measure(self):
+        """
+        Test single pass measure result and its cache.
+        """
+        df = pl.read_parquet('tests/domain/lrs/lambert_15010.parquet')
+
+        # Inverted
+        points = Points(
+            df, 
+            'TO_STA_LAT', 
+            'TO_STA_LONG', 
+            wkt=LAMBERT_WKT
+            )
+        
+        lrs = LRSRoute.from_geojson_file('tests/domain/lrs/lrs_15010.json')
+        measured = lrs.measure(points)
+
+        self.assertEqual(
+            measured.column_names,
+            ['point_id', 'dist', 'm_val', 'segment', 'side', 'snap_x', 'snap_y']
+        )
+        self.assertTrue(lrs.measure(points) is measured)  # Cached
+
+        ddb_mv = lrs.get_points_m_value(points, engine='duckdb').sort('point_id')
+
+        self.assertTrue(np.abs(measured['m_val'].to_numpy() - ddb_mv['m_val'].to_numpy()).max() < 1e-6)
+        self.assertTrue(np.abs(measured['dist'].to_numpy() - ddb_mv['dist'].to_numpy()).max() < 1e-6)
+
+        # Snapped point distance to the input point
+        snap_dist = np.hypot(
+            measured['snap_x'].to_numpy() - df['TO_STA_LONG'].to_numpy(),
+            measured['snap_y'].to_numpy() - df['TO_STA_LAT'].to_numpy()
+        )
+
+        self.assertTrue(np.abs(snap_dist - measured['dist'].to_numpy()).max() < 1e-6)
+
+    def test_measure_off_route(self):
+        """
+        Test measure of points far from the LRS (broken survey file) is equal to the brute force snapping.
+        """
+        df = pl.read_parquet('tests/domain/lrs/lambert_15010.parquet')
+        rng = np.random.default_rng(0)
+        angle = rng.uniform(0, 2*np.pi, len(df))
+        offset = rng.choice([0, 300, 2000], len(df))
+        df = df.with_columns(
+            pl.col('TO_STA_LONG') + offset*np.cos(angle),
+            pl.col('TO_STA_LAT') + offset*np.sin(angle)
+        )
+
+        points = Points(df, 'TO_STA_LAT', 'TO_STA_LONG', wkt=LAMBERT_WKT)
+        lrs = LRSRoute.from_geojson_file('tests/domain/lrs/lrs_15010.json')
+        measured = lrs.measure(points)
+
+        vx, vy, _, valid_segment = lrs._vertices
+        expected = snap_points(
+            df['TO_STA_LONG'].to_numpy(),
+            df['TO_STA_LAT'].to_numpy(),
+            vx,
+            vy,
+            valid_segment=valid_segment
+        )
+
+        np.testing.assert_allclose(measured['dist'].to_numpy(), expected.dist, rtol=0, atol=1e-6)
+        np.testing.assert_allclose(measured['snap_x'].to_numpy(), expected.x, rtol=0, atol=1e-6)
+        np.testing.assert_allclose(measured['snap_y'].to_numpy(), expected.y, rtol=0, atol=1e-6)
+
+    def test_measure_offset_side(self):
+        """
+        Test offset side of points on the left and right of the LRS direction.
+        """
+        feature = {
+            'type': 'Feature',
+            'geometry': {'type': 'LineString', 'coordinates': [[110.0, -7.0, 0, 0], [110.01, -7.0, 0, 1.1]]},
+            'properties': {'LINKID': 'A'}
+        }
+        lrs = LRSRoute.from_features([feature])
+
+        points = Points(
+            pl.DataFrame({'long': [110.005, 110.005, None], 'lat': [-6.999, -7.001, None]}),
+            'long',
+            'lat',
+            wkt='EPSG:4326'
+        )
+        measured = lrs.measure(points)
+
+        self.assertEqual(measured['side'].to_pylist(), [1, -1, None])
+        self.assertEqual(measured['m_val'].null_count, 1)
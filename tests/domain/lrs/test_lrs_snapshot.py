@@ -0,0 +1,74 @@
+from route_events.route import LRSRoute, LRSSnapshotStore
+import unittest
+import tempfile
+import json
+import pyarrow as pa
+from datetime import datetime, timedelta, timezone
+
+
+class TestLRSSnapshotStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = LRSSnapshotStore(self.tmp.name)
+
+        with open('tests/domain/lrs/lrs_15010.json') as jf:
+            self.features = json.load(jf)['features']
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_write_and_load(self):
+        """
+        Test loaded LRSRoute from snapshot is identical to LRSRoute from GeoJSON features.
+        """
+        entry = self.store.write('15010', self.features, geometry_version='2024')
+        self.store._update_manifest({'15010': entry})
+
+        lrs = self.store.load('15010')
+        expected = LRSRoute.from_features(self.features)
+
+        self.assertTrue(lrs.df.equals(expected.df))
+        self.assertEqual(lrs.status, expected.status)
+        self.assertEqual(lrs.max_m_value, expected.max_m_value)
+        self.assertEqual(self.store.manifest['15010']['vertex_count'], expected.vertex_count)
+        self.assertIn('15010', self.store)
+
+    def test_zero_copy_load(self):
+        """
+        Test the vertex table is memory mapped, not allocated.
+        """
+        self.store._update_manifest({'15010': self.store.write('15010', self.features)})
+
+        allocated = pa.total_allocated_bytes()
+        table = self.store.read_table('15010')
+
+        self.assertEqual(pa.total_allocated_bytes(), allocated)
+        self.assertEqual(table.num_rows, self.store.manifest['15010']['vertex_count'])
+
+        # LRSRoute uses the memory mapped table, not another Arrow copy of its DataFrame.
+        lrs = self.store.load('15010')
+
+        self.assertLess(pa.total_allocated_bytes() - allocated, table.nbytes // 10)
+        self.assertIn(self.store.properties_key, lrs.artable.schema.metadata)
+
+    def test_geometry_version(self):
+        """
+        Snapshot with different geometry version is not loaded.
+        """
+        self.store._update_manifest({'15010': self.store.write('15010', self.features, geometry_version='2024')})
+
+        self.assertIsNone(self.store.load('15010', geometry_version='2025'))
+        self.assertIsNotNone(self.store.load('15010', geometry_version='2024'))
+        self.assertIsNone(self.store.load('01001'))
+
+    def test_max_age(self):
+        """
+        Snapshot older than max_age is not loaded, without max_age any snapshot is loaded.
+        """
+        entry = self.store.write('15010', self.features)
+        entry['timestamp'] = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+        self.store._update_manifest({'15010': entry})
+
+        self.assertIsNotNone(self.store.load('15010'))
+        self.assertIsNotNone(LRSSnapshotStore(self.tmp.name, max_age=3*3600).load('15010'))
+        self.assertIsNone(LRSSnapshotStore(self.tmp.name, max_age=3600).load('15010'))
@@ -0,0 +1,115 @@
+from route_events.route.index import SegmentIndex
+from route_events.route.snap import snap_points
+import unittest
+import numpy as np
+
+
+def synthetic_polyline(n_vertex: int, seed: int = 0):
+    """
+    Generate meandering polyline in LAMBERT coordinates, with around 20m segment length.
+    """
+    rng = np.random.default_rng(seed)
+    heading = np.cumsum(rng.normal(0, 0.1, n_vertex))
+    vx = -1130000 + np.cumsum(20*np.cos(heading))
+    vy = -388000 + np.cumsum(20*np.sin(heading))
+
+    return vx, vy
+
+
+def segment_distance(x: float, y: float, vx: np.ndarray, vy: np.ndarray) -> np.ndarray:
+    """
+    Distance of a point to every polyline segment.
+    """
+    dx = np.diff(vx)
+    dy = np.diff(vy)
+    t = np.clip(((x - vx[:-1])*dx + (y - vy[:-1])*dy)/(dx*dx + dy*dy), 0, 1)
+
+    return np.hypot(x - vx[:-1] - t*dx, y - vy[:-1] - t*dy)
+
+
+class TestSegmentIndex(unittest.TestCase):
+    def test_nearest_segment(self):
+        """
+        Compare nearest segment with brute force snapping, including points far from the polyline.
+        """
+        vx, vy = synthetic_polyline(5000)
+        rng = np.random.default_rng(1)
+        idx = rng.integers(0, 5000, 2000)
+        px = vx[idx] + rng.normal(0, 30, 2000)
+        py = vy[idx] + rng.normal(0, 30, 2000)
+        px[:20] = px[:20] + 50_000  # Far from the polyline
+
+        index = SegmentIndex(vx, vy)
+        snapped = index.snap(px, py)
+        expected = snap_points(px, py, vx, vy)
+
+        np.testing.assert_allclose(snapped.dist, expected.dist, rtol=0, atol=1e-9)
+        np.testing.assert_allclose(snapped.x, expected.x, rtol=0, atol=1e-9)
+        np.testing.assert_allclose(snapped.y, expected.y, rtol=0, atol=1e-9)
+
+    def test_off_route_batch(self):
+        """
+        Large batch of points far from the polyline (broken survey file) is equal to brute force snapping.
+        """
+        vx, vy = synthetic_polyline(2000)
+        rng = np.random.default_rng(4)
+        idx = rng.integers(0, 2000, 20_000)
+        angle = rng.uniform(0, 2*np.pi, 20_000)
+        offset = rng.choice([500, 2000, 5000], 20_000)
+        px = vx[idx] + offset*np.cos(angle)
+        py = vy[idx] + offset*np.sin(angle)
+
+        expected = snap_points(px, py, vx, vy)
+        index = SegmentIndex(vx, vy)
+        snapped = index.snap(px, py)
+
+        np.testing.assert_allclose(snapped.dist, expected.dist, rtol=0, atol=1e-9)
+        np.testing.assert_allclose(snapped.x, expected.x, rtol=0, atol=1e-9)
+
+        # Window search chunked by the candidate pairs count
+        nx = vx[idx[:500]] + rng.normal(0, 30, 500)
+        ny = vy[idx[:500]] + rng.normal(0, 30, 500)
+        found, found_dist2 = index._search_window(nx, ny, 3, ring=4)
+        chunked, chunked_dist2 = index._search_window(nx, ny, 3, ring=4, max_pairs=50)
+
+        self.assertTrue(np.all(found >= 0))
+        np.testing.assert_array_equal(found, chunked)
+        np.testing.assert_array_equal(found_dist2, chunked_dist2)
+
+    def test_k_nearest_segments(self):
+        """
+        Compare k nearest segments with brute force distance sorting.
+        """
+        vx, vy = synthetic_polyline(500)
+        rng = np.random.default_rng(2)
+        xy = np.column_stack([
+            rng.uniform(vx.min(), vx.max(), 200),
+            rng.uniform(vy.min(), vy.max(), 200)
+        ])
+
+        index = SegmentIndex(vx, vy)
+        nearest, dist = index.nearest_segments(xy, k=5)
+
+        self.assertEqual(nearest.shape, (200, 5))
+        self.assertTrue(np.all(np.diff(dist, axis=1) >= 0))
+
+        for i in range(len(xy)):
+            np.testing.assert_allclose(
+                dist[i], np.sort(segment_distance(xy[i, 0], xy[i, 1], vx, vy))[:5], rtol=0, atol=1e-9
+            )
+
+    def test_invalid_segment_and_null(self):
+        """
+        Invalid segments are never returned, null coordinates have no nearest segment.
+        """
+        vx = np.array([0, 10, 20, 0, 10], dtype=np.float64)
+        vy = np.array([0, 0, 0, 5, 5], dtype=np.float64)
+        valid_segment = np.array([True, True, False, True])
+
+        index = SegmentIndex(vx, vy, valid_segment=valid_segment)
+        nearest, dist = index.nearest_segments([[15, 4], [np.nan, 1]], k=5)
+
+        self.assertEqual(len(index), 3)
+        self.assertEqual(nearest[0].tolist(), [1, 3, 0, -1, -1])
+        self.assertEqual(nearest[1].tolist(), [-1]*5)
+        self.assertTrue(np.isnan(index.snap(np.array([np.nan]), np.array([1.0])).dist[0]))
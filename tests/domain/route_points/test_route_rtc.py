@@ -96,6 +96,29 @@ class TestRouteRTC(unittest.TestCase):
         
         self.assertFalse(events.has_sta())
 
+    def test_memoized_timestamp(self):
+        """
+        Timestamp DataFrame is created once, and created again if the events data is replaced.
+        """
+        df = pl.DataFrame(
+            {
+                'LINKID': ['22040']*3,
+                'SURVEY_DATE': pl.Series(['2025-01-01', '2025-01-01', '2025-01-03']).str.to_date(),
+                'SURVEY_HOURS': [0, 0, 23],
+                'SURVEY_MINUTE': [0, 15, 45],
+                'SURVEY_DIREC': ['N', 'N', 'N']
+            }
+        )
+
+        events = RouteRTC(df.to_arrow())
+
+        self.assertIs(events.df_with_timestamp, events.df_with_timestamp)
+        self.assertEqual(events.survey_duration(), 3)
+
+        events.pl_df = df.head(2)
+        self.assertEqual(events.df_with_timestamp.height, 2)
+        self.assertEqual(events.survey_duration(), 0)
+
 from src.route_events.points.rtc.repo import RouteRTCRepo
 
 class TestRouteRTCRepo(unittest.TestCase):
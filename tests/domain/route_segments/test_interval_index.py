@@ -0,0 +1,142 @@
+from src.route_events.segments.base.model import RouteSegmentEvents
+from src.route_events.segments.base.index import SegmentIntervalIndex
+import unittest
+import numpy as np
+import polars as pl
+
+
+def synthetic_route(length_km: int = 200, lanes: int = 4, seed: int = 0) -> pl.DataFrame:
+    """
+    Synthetic route with 100m segments (STA in dm) with gaps, overlaps, duplicates and missing lanes.
+    """
+    rng = np.random.default_rng(seed)
+    from_sta = np.arange(0, length_km*10_000, 1000)
+    df = pl.DataFrame(
+        {
+            'LINKID': '01001',
+            'FROM_STA': np.repeat(from_sta, lanes),
+            'TO_STA': np.repeat(from_sta + 1000, lanes),
+            'LANE_CODE': np.tile([f"{'L' if _ % 2 == 0 else 'R'}{_ // 2 + 1}" for _ in range(lanes)], len(from_sta)),
+            'ATTR': rng.integers(0, 3, len(from_sta)*lanes)
+        }
+    )
+
+    # Gap, overlap and missing lanes
+    df = df.with_columns(
+        FROM_STA=pl.when(pl.int_range(pl.len()).mod(97) == 0).then(pl.col('FROM_STA') + 50).otherwise(pl.col('FROM_STA')),
+        TO_STA=pl.when(pl.int_range(pl.len()).mod(89) == 0).then(pl.col('TO_STA') + 70).otherwise(pl.col('TO_STA'))
+    ).filter(
+        pl.int_range(pl.len()).mod(113) != 0
+    )
+
+    # Duplicate rows
+    return pl.concat([df, df.gather_every(211)]).sample(fraction=1, shuffle=True, seed=seed)
+
+
+class PolarsReference(object):
+    """
+    Group by and list based implementation, used as the expected result.
+    """
+    @staticmethod
+    def sta_gap(df: pl.DataFrame) -> pl.DataFrame:
+        return df.group_by(['LINKID', 'LANE_CODE']).agg(
+            pl.col('FROM_STA'), pl.col('TO_STA')
+        ).with_columns(
+            pl.col('TO_STA').list.sort(),
+            shifted_from=pl.col('FROM_STA').list.sort().list.shift(-1)
+        ).explode(
+            'TO_STA', 'shifted_from'
+        ).filter(
+            pl.col('TO_STA') < pl.col('shifted_from')
+        ).select(
+            'LINKID', 'LANE_CODE', pl.col('TO_STA').alias('FROM_STA'), pl.col('shifted_from').alias('TO_STA')
+        )
+
+    @staticmethod
+    def overlapping_segments(df: pl.DataFrame) -> pl.DataFrame:
+        return df.sort(['LINKID', 'FROM_STA', 'TO_STA']).group_by(['LINKID', 'LANE_CODE']).agg(
+            pl.col('FROM_STA'), pl.col('TO_STA')
+        ).with_columns(
+            OVERLAPPED_FROM=pl.col('FROM_STA').list.shift(-1),
+            OVERLAPPED_TO=pl.col('TO_STA').list.shift(-1)
+        ).explode(
+            'FROM_STA', 'TO_STA', 'OVERLAPPED_FROM', 'OVERLAPPED_TO'
+        ).filter(
+            pl.col('TO_STA') > pl.col('OVERLAPPED_FROM')
+        )
+
+    @staticmethod
+    def is_duplicate_segment(df: pl.DataFrame) -> pl.DataFrame:
+        keys = ['LINKID', 'FROM_STA', 'TO_STA', 'LANE_CODE']
+        return df.filter(df.select(keys).is_duplicated()).unique(subset=keys).select(keys)
+
+    @staticmethod
+    def incorrect_lane_sequence(df: pl.DataFrame) -> pl.DataFrame:
+        return df.with_columns(
+            lane_seq=pl.col('LANE_CODE').str.tail(1).cast(pl.Int16)
+        ).group_by(['LINKID', 'FROM_STA', 'TO_STA']).agg(
+            pl.col('lane_seq').sort().diff().fill_null(1).gt(1).any()
+        ).filter(
+            pl.col('lane_seq')
+        ).select('LINKID', 'FROM_STA', 'TO_STA')
+
+    @staticmethod
+    def segment_attribute_n_unique(df: pl.DataFrame, columns: list) -> pl.DataFrame:
+        return df.group_by(['LINKID', 'FROM_STA', 'TO_STA']).agg(
+            *[pl.col(_col).drop_nulls().n_unique().cast(pl.Int64) for _col in columns]
+        )
+
+
+class TestSegmentIntervalIndex(unittest.TestCase):
+    def assertSameRows(self, result: pl.DataFrame, expected: pl.DataFrame):
+        columns = expected.columns
+        self.assertTrue(
+            result.select(columns).sort(columns).equals(expected.sort(columns)),
+            f"\n{result.select(columns).sort(columns)}\n{expected.sort(columns)}"
+        )
+
+    def test_same_result_as_group_by(self):
+        """
+        Gap, overlap, duplicate, lane sequence and unique value count are the same as the group by implementation.
+        """
+        df = synthetic_route(length_km=20).with_columns(
+            ATTR2=pl.when(pl.col('ATTR') == 0).then(None).otherwise(pl.col('ATTR').cast(pl.String))
+        )
+        index = SegmentIntervalIndex(df)
+
+        self.assertSameRows(index.gaps(), PolarsReference.sta_gap(df))
+        self.assertSameRows(index.overlaps(), PolarsReference.overlapping_segments(df))
+        self.assertSameRows(df[index.duplicates()], PolarsReference.is_duplicate_segment(df))
+
+        lane_seq = df['LANE_CODE'].str.tail(1).cast(pl.Int16)
+        self.assertSameRows(
+            index.segment_frame(np.flatnonzero(index.segment_sequence_gap(lane_seq))),
+            PolarsReference.incorrect_lane_sequence(df)
+        )
+
+        self.assertSameRows(
+            index.segment_frame(
+                ATTR=index.segment_n_unique(df['ATTR']),
+                ATTR2=index.segment_n_unique(df['ATTR2'])
+            ).with_columns(pl.col('ATTR', 'ATTR2').cast(pl.Int64)),
+            PolarsReference.segment_attribute_n_unique(df, ['ATTR', 'ATTR2'])
+        )
+
+    def test_coverage_and_locate(self):
+        """
+        Lane covered length and point in segment query.
+        """
+        df = pl.DataFrame(
+            {
+                'LINKID': ['a', 'a', 'a', 'a'],
+                'FROM_STA': [0, 5, 20, 0],
+                'TO_STA': [10, 12, 30, 10],
+                'LANE_CODE': ['L1', 'L1', 'L1', 'R1']
+            }
+        )
+        index = SegmentIntervalIndex(df)
+
+        coverage = index.coverage().sort('LANE_CODE')
+        self.assertEqual(coverage['length'].to_list(), [22, 10])
+        self.assertEqual(index.locate('a', 'L1', [3, 11, 15, 25]).tolist(), [0, 1, -1, 2])
+        self.assertEqual(index.locate('a', 'L2', [3]).tolist(), [-1])
@@ -309,4 +309,104 @@ class TestRouteSegments(unittest.TestCase):
         self.assertEqual(
             len(se.last_segment_to_sta),
             2
-        )
\ No newline at end of file
+        )
+    def test_lazy_geometry(self):
+        """
+        Points geometry is only created on first access, and is not created if geometry is skipped.
+        """
+        df = pl.DataFrame({
+            'LINKID': ['01001', '01001'],
+            'FROM_STA': [0, 1],
+            'TO_STA': [1, 2],
+            'LANE_CODE': ['L1', 'L1'],
+            'TO_STA_LAT': [-6.2, -6.201],
+            'TO_STA_LONG': [106.8, 106.801]
+        })
+
+        events = RouteSegmentEvents(df.to_arrow())
+        self.assertIsNone(events._points_4326)
+        self.assertTrue(events.has_geometry())
+        self.assertIs(events.points_4326, events.points_4326)
+
+        no_geom = RouteSegmentEvents(df.to_arrow(), geometry=False)
+        self.assertFalse(no_geom.has_geometry())
+        self.assertIsNone(no_geom.points_4326)
+        self.assertIsNone(no_geom.points_lambert)
+
+        no_coord = RouteSegmentEvents(df.drop('TO_STA_LAT').to_arrow())
+        self.assertIsNone(no_coord.points_lambert)
+
+    def test_check_as_df(self):
+        """
+        Check result as DataFrame has the same rows as the DTO.
+        """
+        df = pl.DataFrame(
+            {
+                "LINKID": ["a" for _ in range(7)],
+                "FROM_STA": [0, 0, 0, 9, 10, 15, 30],
+                "TO_STA": [10, 10, 10, 20, 20, 25, 35],
+                "LANE_CODE": ["L1", "L1", "L3", "L1", "L2", "L1", "L1"]
+            }
+        )
+
+        se = RouteSegmentEvents(
+            df.to_arrow(),
+            route = "a"
+        )
+
+        for check in ['is_duplicate_segment', 'sta_gap', 'incorrect_lane_sequence']:
+            dtos = getattr(se, check)()
+            errors = getattr(se, check)(as_df=True)
+
+            self.assertTrue(len(dtos) > 0, check)
+            self.assertTrue(
+                pl.DataFrame(dtos).sort('from_sta', 'to_sta').equals(
+                    errors.select(pl.DataFrame(dtos).columns).sort('from_sta', 'to_sta')
+                ),
+                check
+            )
+
+        overlap = se.overlapping_segments(as_df=True)
+        self.assertEqual(len(overlap), len(se.overlapping_segments()))
+        self.assertEqual(
+            overlap['overlapped'].struct.field('from_sta').to_list(),
+            [_.overlapped.from_sta for _ in se.overlapping_segments()]
+        )
+
+    def test_memoized_stats(self):
+        """
+        Statistics are computed once, and computed again if the events data is replaced.
+        """
+        df = pl.DataFrame(
+            {
+                "LINKID": ["a" for _ in range(5)],
+                "FROM_STA": [0, 0, 10, 20, 20],
+                "TO_STA": [10, 10, 20, 25, 24],
+                "LANE_CODE": ["L1", "L2", "L1", "L1", "L2"],
+            }
+        )
+
+        se = RouteSegmentEvents(
+            df.to_arrow(),
+            route = "a"
+        )
+
+        self.assertIs(se.stats, se.stats)
+        self.assertEqual(se.row_count, 5)
+        self.assertEqual(se.max_from_sta, 20)
+        self.assertEqual(se.max_to_sta, 25)
+        self.assertEqual(sorted(se.lanes), ['L1', 'L2'])
+        self.assertEqual(sorted(se.last_segment_to_sta), [24, 25])
+        self.assertEqual(se.last_segment.lane, 'L1')
+        self.assertEqual(
+            se.lane_extents.sort('LANE_CODE').rows(),
+            [('a', 'L1', 0, 25, 3), ('a', 'L2', 0, 24, 2)]
+        )
+
+        index = se.interval_index
+        se.pl_df = df.filter(pl.col('FROM_STA') < 20)
+
+        self.assertEqual(se.row_count, 3)
+        self.assertEqual(se.max_to_sta, 20)
+        self.assertEqual(se.last_segment.to_sta, 20)
+        self.assertIsNot(se.interval_index, index)
@@ -0,0 +1,57 @@
+import unittest
+from src.route_events import RouteRNI, SurveyWorkbook
+
+
+class TestSurveyWorkbook(unittest.TestCase):
+    excel_path = 'tests/domain/route_segments/input_excels/balai_5_15007_15008_15009_15010.xlsx'
+
+    def test_partition(self):
+        """
+        Route events from the workbook partition is the same as route events loaded with from_excel.
+        """
+        workbook = SurveyWorkbook(self.excel_path)
+        routes = workbook.routes(RouteRNI, collect_review=True)
+
+        self.assertEqual(routes, ['15007', '15008', '15009', '15010'])
+
+        whole = RouteRNI.from_excel(self.excel_path, linkid='ALL', collect_review=True)
+        review_count = 0
+
+        for route in routes:
+            events = workbook.events(RouteRNI, route, collect_review=True)
+            expected = RouteRNI.from_excel(self.excel_path, linkid=route, collect_review=True)
+
+            self.assertEqual(events.route_id, route)
+            self.assertTrue(events.pl_df.equals(expected.pl_df))
+            self.assertTrue(events.artable.equals(expected.artable))
+            self.assertEqual(events.max_to_sta, expected.max_to_sta)
+
+            # Only review errors of the route rows (workbook row number).
+            route_rows = whole.pl_df.with_row_index().filter(LINKID=route)['index'].to_list()
+            self.assertTrue(events.review_errors['row'].is_in(route_rows).all())
+            review_count += events.review_errors.height
+
+        self.assertEqual(review_count, whole.review_errors.height)
+
+        # Parsed once for the same events type and options.
+        self.assertEqual(len(workbook._parsed), 1)
+
+    def test_missing_route_and_file(self):
+        """
+        Route which does not exist has empty events, parsing error is raised for every route.
+        """
+        workbook = SurveyWorkbook(self.excel_path)
+        events = workbook.events(RouteRNI, '99999', ignore_review=True)
+
+        self.assertTrue(events.pl_df.is_empty())
+        self.assertTrue(events.review_errors.is_empty())
+        self.assertIsNone(workbook.parse_error)
+
+        workbook = SurveyWorkbook('tests/domain/route_segments/input_excels/not_exist.xlsx')
+
+        for route in ['15007', '15008']:
+            with self.assertRaises(FileNotFoundError):
+                workbook.events(RouteRNI, route, ignore_review=True)
+
+        self.assertEqual(len(workbook._parsed), 1)
+        self.assertIsInstance(workbook.parse_error, FileNotFoundError)
@@ -0,0 +1,174 @@
+from route_events.schema import RouteEventsSchema
+from pydantic import ValidationError
+import unittest
+import polars as pl
+
+
+RNI_CONFIG = 'src/route_events/segments/rni/schema.json'
+
+
+class TestPolarsSchemaValidator(unittest.TestCase):
+    def validate(self, schema: RouteEventsSchema, df: pl.DataFrame, backend: str):
+        try:
+            return schema.validate(df, backend=backend), None
+        except ValidationError as e:
+            return None, [(error['loc'], error['type'], error['msg']) for error in e.errors()]
+
+    def assertSameResult(self, schema: RouteEventsSchema, df: pl.DataFrame):
+        """
+        Polars engine should return the same typed DataFrame or the same errors as Pydantic model.
+        """
+        expected, expected_errors = self.validate(schema, df, 'pydantic')
+        result, errors = self.validate(schema, df, 'polars')
+
+        self.assertEqual(errors, expected_errors)
+
+        if expected is not None:
+            self.assertEqual(result.columns, expected.columns)
+
+            for col in expected.columns:
+                if expected[col].dtype != pl.Null:
+                    self.assertTrue(result[col].equals(expected[col]), col)
+
+        return errors
+
+    def test_excel_input(self):
+        """
+        Validate RNI Excel input.
+        """
+        df_str = pl.read_excel(
+            'tests/domain/route_segments/input_excels/balai_5_15010.xlsx',
+            engine='calamine',
+            infer_schema_length=None
+        ).rename(str.upper).cast(pl.String)
+
+        for ignore_review in [True, False]:
+            self.assertSameResult(RouteEventsSchema(RNI_CONFIG, ignore_review_err=ignore_review), df_str)
+
+    def test_invalid_values(self):
+        """
+        Parsing, range, domain, review and null errors.
+        """
+        schema = RouteEventsSchema(RNI_CONFIG)
+        df_str = pl.read_excel(
+            'tests/domain/route_segments/input_excels/balai_5_15010.xlsx',
+            engine='calamine',
+            infer_schema_length=None
+        ).rename(str.upper).cast(pl.String).head(6).with_columns(
+            FROM_STA=pl.Series(['0', '2.5', 'abc', ' 7 ', None, '1e3']),
+            LANE_CODE=pl.Series(['l1', 'L1 ', 'a b', None, 'R1', 'X'*300]),
+            SURF_TYPE=pl.Series(['30', '-0.5', 'nan', '1', None, '2']),
+            LANE_WIDTH=pl.Series(['5.55', '100', '-1', 'inf', '3', '.5']),
+            SURVEY_DATE=pl.Series(['01/02/2024', '31/02/2024', None, '1/2/2024', '01-02-2024', '01/02/2024'])
+        )
+
+        errors = self.assertSameResult(schema, df_str)
+        self.assertIn(
+            ((0, 'SURF_TYPE'), 'less_than_equal', 'Nilai SURF_TYPE=30 berada di luar rentang valid.'),
+            errors
+        )
+
+    def test_numeric_strings(self):
+        """
+        Numeric string forms are accepted or rejected the same as the Pydantic model.
+        """
+        schema = RouteEventsSchema(RNI_CONFIG)
+        values = [
+            '1_000', '1_000.5', '1.0_0', '1e1_0', '1__0', '_1', '1_', '1_.5', 'in_f', ' _1', '-_1', '1._5',
+            '1,5', '1 000', '0x10', '1d', '+-1', '1.2.3', ' 1 ', '\u00a02', '+.5', '5.', '\u0661'
+        ]
+        df_str = pl.read_excel(
+            'tests/domain/route_segments/input_excels/balai_5_15010.xlsx',
+            engine='calamine',
+            infer_schema_length=None
+        ).rename(str.upper).cast(pl.String).head(len(values)).with_columns(
+            L_DITCH_TYPE=pl.Series(values),
+            L_DITCH_DEPTH=pl.Series(values)
+        )
+
+        errors = self.assertSameResult(schema, df_str)
+        self.assertNotIn((0, 'L_DITCH_DEPTH'), [loc for loc, _, _ in errors])
+        self.assertIn(((4, 'L_DITCH_DEPTH'), 'float_parsing'), [(loc, _type) for loc, _type, _ in errors])
+
+    def test_missing_column(self):
+        """
+        Missing column error in every row.
+        """
+        schema = RouteEventsSchema(RNI_CONFIG)
+        df_str = pl.read_excel(
+            'tests/domain/route_segments/input_excels/balai_5_15010.xlsx',
+            engine='calamine',
+            infer_schema_length=None
+        ).rename(str.upper).cast(pl.String).head(3).drop('LANE_CODE')
+
+        errors = self.assertSameResult(schema, df_str)
+        self.assertIn(((2, 'LANE_CODE'), 'missing', 'Data input tidak memiliki LANE_CODE'), errors)
+
+    def test_parse_collect_review(self):
+        """
+        Review errors are returned with the typed DataFrame, identical to the DataFrame with ignored review.
+        """
+        df_str = pl.read_excel(
+            'tests/domain/route_segments/input_excels/balai_5_15010.xlsx',
+            engine='calamine',
+            infer_schema_length=None
+        ).rename(str.upper).cast(pl.String).head(4).with_columns(
+            LANE_WIDTH=pl.Series(['5.55', '100', '3', '3'])
+        )
+
+        schema = RouteEventsSchema(RNI_CONFIG)
+        df, review_errors = schema.parse(df_str, collect_review=True)
+        expected = RouteEventsSchema(RNI_CONFIG, ignore_review_err=True).validate(df_str)
+
+        self.assertTrue(df.equals(expected))
+        self.assertEqual(review_errors['column'].to_list(), ['LANE_WIDTH', 'LANE_WIDTH'])
+        self.assertTrue(review_errors['type'].str.ends_with('_review').all())
+
+        with self.assertRaises(ValidationError):
+            schema.parse(df_str)
+
+        # Rejected error raises all errors, including the review errors.
+        with self.assertRaises(ValidationError) as ctx:
+            schema.parse(df_str.with_columns(SURF_TYPE=pl.lit('abc')), collect_review=True)
+
+        self.assertTrue(any(['review' in error['type'] for error in ctx.exception.errors()]))
+
+    def test_typed_input(self):
+        """
+        Typed Excel input (numeric columns are not cast into String) has the same result as the string input.
+        """
+        excel_path = 'tests/domain/route_segments/input_excels/balai_5_15010.xlsx'
+        schema = RouteEventsSchema(RNI_CONFIG)
+        df_str = pl.read_excel(
+            excel_path,
+            engine='calamine',
+            infer_schema_length=None
+        ).rename(str.upper).cast(pl.String)
+        df_typed = schema.read_excel(excel_path)
+
+        self.assertTrue(df_typed['LANE_WIDTH'].dtype.is_numeric())
+        self.assertTrue(set(df_typed.columns).issubset(schema.pl_schema))
+
+        for ignore_review in [True, False]:
+            schema = RouteEventsSchema(RNI_CONFIG, ignore_review_err=ignore_review)
+            result, errors = self.validate(schema, df_typed, 'polars')
+            expected, expected_errors = self.validate(schema, df_str, 'polars')
+
+            self.assertEqual(errors, expected_errors)
+            self.assertTrue((result is None) or result.equals(expected))
+
+        # Column which can not be cast is validated as String for every cell.
+        df_typed = schema.cast_input(
+            df_typed.head(3).with_columns(
+                SURF_TYPE=pl.Series(['1', 'abc', '2']),
+                LANE_WIDTH=pl.Series([3.5, None, 100.0]),
+                UNKNOWN=pl.lit(1)
+            )
+        )
+
+        self.assertEqual(df_typed['SURF_TYPE'].dtype, pl.String)
+        self.assertEqual(df_typed['LANE_WIDTH'].dtype, pl.Float64)
+        self.assertNotIn('UNKNOWN', df_typed.columns)
+
+        errors = self.assertSameResult(schema, df_typed)
+        self.assertIn(((1, 'SURF_TYPE'), 'int_parsing', "Nilai SURF_TYPE='abc' bukan merupakan nilai numerik."), errors)
@@ -0,0 +1,85 @@
+from route_events.schema import RouteEventsSchema, SchemaRegistry, schema_registry
+from route_events.bridge.inventory import SuperstructureOnlySchema
+from route_events.bridge.inventory.structure.models import structure_model, parent_context
+from pydantic import ValidationError
+import unittest
+import tempfile
+import shutil
+import os
+
+
+RNI_CONFIG = 'src/route_events/segments/rni/schema.json'
+
+
+class TestSchemaRegistry(unittest.TestCase):
+    def test_compiled_once(self):
+        """
+        Schema created from the same config file shares the compiled model.
+        """
+        schema_registry().clear()
+
+        first = RouteEventsSchema(RNI_CONFIG)
+        second = RouteEventsSchema(RNI_CONFIG)
+
+        self.assertIs(first.model, second.model)
+        self.assertIs(first.engine, second.engine)
+        self.assertIsNot(first.model, RouteEventsSchema(RNI_CONFIG, ignore_review_err=True).model)
+        self.assertEqual(schema_registry().stats(), {'compiled': 2, 'hits': 1, 'misses': 2})
+
+    def test_shared_schema_mutation(self):
+        """
+        Mutating a schema object containers does not change the other schema objects.
+        """
+        first = RouteEventsSchema(RNI_CONFIG)
+        first.pl_schema.clear()
+        first.translate_mapping['LANE_CODE'] = 'MODIFIED'
+        first.date_cols.append('MODIFIED')
+        first.review_fields.clear()
+        first.schema_dict['LANE_CODE']['dtype'] = 'MODIFIED'
+
+        second = RouteEventsSchema(RNI_CONFIG)
+
+        self.assertIs(first.model, second.model)
+        self.assertNotEqual(second.pl_schema, {})
+        self.assertNotEqual(second.translate_mapping['LANE_CODE'], 'MODIFIED')
+        self.assertNotIn('MODIFIED', second.date_cols)
+        self.assertNotEqual(second.review_fields, [])
+        self.assertNotEqual(second.schema_dict['LANE_CODE']['dtype'], 'MODIFIED')
+
+    def test_modified_config(self):
+        """
+        Modified config file is compiled again, replacing the previous version.
+        """
+        registry = SchemaRegistry()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            config = shutil.copy(RNI_CONFIG, os.path.join(tmp, 'schema.json'))
+            first = registry.get(config, False, lambda: {'version': 1})
+
+            os.utime(config, ns=(0, os.stat(config).st_mtime_ns + 1))
+            second = registry.get(config, False, lambda: {'version': 2})
+
+        self.assertEqual(first, {'version': 1})
+        self.assertEqual(second, {'version': 2})
+        self.assertEqual(len(registry), 1)
+
+    def test_structure_model(self):
+        """
+        Structure model is created once, parent keys are filled from the validation context.
+        """
+        model = SuperstructureOnlySchema().model
+        span = {"no_btg": 1, "tipe_btg": "UTAMA", "seq_btg": 1, "struktur_ba": "GTP", "pjg_btg": 15.5}
+
+        self.assertIs(structure_model(model), structure_model(model))
+
+        result = structure_model(model).model_validate(
+            span, context=parent_context('abc', 2025)
+        ).model_dump(by_alias=True)
+
+        self.assertEqual(result['BRIDGE_ID'], 'ABC')
+        self.assertEqual(result['INV_YEAR'], 2025)
+        self.assertEqual(result['SPAN_LENGTH'], 15.5)
+
+        # Parent keys are required without the validation context.
+        with self.assertRaises(ValidationError):
+            structure_model(model).model_validate(span)
@@ -0,0 +1,51 @@
+from route_events.utils.ddb import DuckDBSession
+import unittest
+import duckdb
+
+
+class TestDuckDBSession(unittest.TestCase):
+    def test_extension_loaded_once(self):
+        """
+        Test extension is loaded once and shared by all cursors.
+        """
+        session = DuckDBSession()
+        first = session.cursor(('spatial',))
+        second = session.cursor(('spatial',))
+
+        self.assertEqual(
+            second.sql("select ST_AsText(ST_Point(1, 2))").fetchone()[0],
+            'POINT (1 2)'
+        )
+
+        stats = session.stats()
+        self.assertEqual(stats['cursors'], 2)
+        self.assertEqual(list(stats['extension_load_time']), ['spatial'])
+        self.assertEqual(stats['saved_load_time'], stats['extension_load_time']['spatial'])
+
+    def test_temp_table_namespace(self):
+        """
+        Test every cursor has its own temporary table namespace.
+        """
+        session = DuckDBSession()
+        first = session.cursor(())
+        second = session.cursor(())
+
+        first.sql("create temp table points_table as select 1 as id")
+        second.sql("create temp table points_table as select 2 as id")
+
+        self.assertEqual(first.sql("select id from points_table").fetchone()[0], 1)
+        self.assertEqual(second.sql("select id from points_table").fetchone()[0], 2)
+
+        third = session.cursor(())
+
+        with self.assertRaises(duckdb.CatalogException):
+            third.sql("select id from points_table")
+
+    def test_warm_up(self):
+        """
+        Test extension loaded before the first cursor.
+        """
+        session = DuckDBSession().warm_up(('spatial',))
+        session.cursor(('spatial',))
+
+        self.assertTrue(session.stats()['saved_load_time'] > 0)
@@ -0,0 +1,143 @@
+from route_events.utils import ParseCache, set_parse_cache
+from route_events.schema import RouteEventsSchema
+from route_events import RouteRNI
+import unittest
+import tempfile
+import shutil
+import os
+import polars as pl
+from concurrent.futures import ThreadPoolExecutor
+from pydantic import ValidationError
+
+
+RNI_CONFIG = 'src/route_events/segments/rni/schema.json'
+RNI_EXCEL = 'tests/domain/route_segments/input_excels/balai_5_15010.xlsx'
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ParseCache(self.tmp.name)
+        self.reads = 0
+        set_parse_cache(self.cache)
+
+    def tearDown(self):
+        set_parse_cache(None)
+        self.tmp.cleanup()
+
+    def read(self, excel_path: str) -> pl.DataFrame:
+        self.reads += 1
+
+        return pl.read_excel(
+            excel_path,
+            engine='calamine',
+            infer_schema_length=None
+        ).rename(str.upper).cast(pl.String)
+
+    def test_resubmission(self):
+        """
+        Resubmitted file is loaded from the cache, identical to the parsed file.
+        """
+        schema = RouteEventsSchema(RNI_CONFIG)
+        df, review_errors = schema.parse_excel(RNI_EXCEL, self.read, collect_review=True)
+        cached_df, cached_review_errors = schema.parse_excel(RNI_EXCEL, self.read, collect_review=True)
+
+        self.assertEqual(self.reads, 1)
+        self.assertEqual(self.cache.stats(), {'hits': 1, 'misses': 1})
+        self.assertTrue(cached_df.equals(df))
+        self.assertEqual(cached_df.schema, df.schema)
+        self.assertTrue(cached_review_errors.equals(review_errors))
+        self.assertFalse(review_errors.is_empty())
+
+    def test_cache_key(self):
+        """
+        Ignore review flag and file content are part of the key.
+        """
+        copied = os.path.join(self.tmp.name, 'copied.xlsx')
+        shutil.copy(RNI_EXCEL, copied)
+
+        RouteEventsSchema(RNI_CONFIG).parse_excel(RNI_EXCEL, self.read, collect_review=True)
+        RouteEventsSchema(RNI_CONFIG, ignore_review_err=True).parse_excel(RNI_EXCEL, self.read)
+        RouteEventsSchema(RNI_CONFIG).parse_excel(copied, self.read, collect_review=True)
+
+        # Same content with different path is a cache hit.
+        self.assertEqual(self.reads, 2)
+
+        # Review errors is still raised from cached input.
+        with self.assertRaises(ValidationError):
+            RouteEventsSchema(RNI_CONFIG).parse_excel(RNI_EXCEL, self.read)
+
+    def test_eviction(self):
+        """
+        Least recently used entry is evicted when the cache size exceeds the maximum.
+        """
+        schema = RouteEventsSchema(RNI_CONFIG, ignore_review_err=True)
+        schema.parse_excel(RNI_EXCEL, self.read, cache_options=('first',))
+        size = sum([entry.stat().st_size for entry in os.scandir(self.tmp.name)])
+
+        self.cache.max_bytes = size*2
+        schema.parse_excel(RNI_EXCEL, self.read, cache_options=('second',))
+        os.utime(os.path.join(self.tmp.name, f"{self.cache.key(RNI_EXCEL, schema.schema_hash, True, 'second')}.parquet"), (0, 0))
+        schema.parse_excel(RNI_EXCEL, self.read, cache_options=('third',))
+
+        self.assertEqual(len(os.listdir(self.tmp.name)), 4)
+
+        # Second entry is the least recently used.
+        schema.parse_excel(RNI_EXCEL, self.read, cache_options=('first',))
+        schema.parse_excel(RNI_EXCEL, self.read, cache_options=('second',))
+        self.assertEqual(self.reads, 4)
+
+    def test_orphan_review_file(self):
+        """
+        Review errors file without data file is counted in the cache size and removed by eviction.
+        """
+        schema = RouteEventsSchema(RNI_CONFIG, ignore_review_err=True)
+        schema.parse_excel(RNI_EXCEL, self.read, cache_options=('orphan',))
+        schema.parse_excel(RNI_EXCEL, self.read, cache_options=('young',))
+        schema.parse_excel(RNI_EXCEL, self.read, cache_options=('entry',))
+
+        orphan, orphan_review = self.cache._files(self.cache.key(RNI_EXCEL, schema.schema_hash, True, 'orphan'))
+        young, young_review = self.cache._files(self.cache.key(RNI_EXCEL, schema.schema_hash, True, 'young'))
+        os.remove(orphan)
+        os.remove(young)
+        os.utime(orphan_review, (0, 0))
+
+        # Orphan is removed even if the cache size is below the maximum, young orphan could be a running put.
+        self.cache.evict()
+        self.assertFalse(os.path.exists(orphan_review))
+        self.assertTrue(os.path.exists(young_review))
+        self.assertEqual(len(os.listdir(self.tmp.name)), 3)
+
+        # Young orphan is counted in the cache size, the entry is evicted.
+        self.cache.max_bytes = os.path.getsize(young_review)
+        self.cache.evict()
+        self.assertEqual(os.listdir(self.tmp.name), [os.path.basename(young_review)])
+
+    def test_concurrent_put(self):
+        """
+        Same key written by multiple threads at once, the entry is complete and no temporary file is left.
+        """
+        schema = RouteEventsSchema(RNI_CONFIG)
+        df, review_errors = schema.parse_excel(RNI_EXCEL, self.read, collect_review=True)
+        key = self.cache.key(RNI_EXCEL, schema.schema_hash, False)
+        parsed = self.cache.get(key)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: self.cache.put(key, parsed), range(32)))
+
+        cached = self.cache.get(key)
+        self.assertTrue(cached.data.equals(df))
+        self.assertTrue(cached.review_errors.equals(review_errors))
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), sorted([os.path.basename(_) for _ in self.cache._files(key)]))
+
+    def test_from_excel(self):
+        """
+        Segment events loaded from the cache.
+        """
+        events = RouteRNI.from_excel(RNI_EXCEL, '15010', collect_review=True)
+        cached = RouteRNI.from_excel(RNI_EXCEL, '15010', collect_review=True)
+
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertTrue(cached.pl_df.equals(events.pl_df))
+        self.assertTrue(cached.review_errors.equals(events.review_errors))
+        self.assertEqual(cached.is_partial, events.is_partial)
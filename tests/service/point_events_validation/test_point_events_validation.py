@@ -1,6 +1,7 @@
 import unittest
 from dotenv import load_dotenv
 import os
+import polars as pl
 from sqlalchemy import create_engine
 from route_events import RouteDefects, LRSRoute, RouteFWD, RouteFWDRepo
 from src.service.points.validation.defects import RouteDefectsValidation
@@ -29,6 +30,26 @@ def make_photo_storage(route_id, survey_year):
     )
 
 
+CHECK_WORKERS = 4
+
+
+def check_workers_messages(validate) -> dict:
+    """
+    Run base validation with sequential checks and with a thread pool of CHECK_WORKERS.
+    Return the messages of every run.
+    """
+    messages = dict()
+
+    for workers in [1, CHECK_WORKERS]:
+        check = validate()
+        check.check_workers = workers
+        check.base_validation()
+
+        messages[workers] = check.get_all_messages().sort(pl.all())
+
+    return messages
+
+
 class TestRouteRTCValidation(unittest.TestCase):
     def test_init(self):
         excel_path = "~/Downloads/rtc_6_16-10-2025_091412_6344.xlsx"
@@ -144,6 +165,28 @@ class TestRouteDefectsValidation(unittest.TestCase):
 
         self.assertTrue(check.get_status() == "error")
 
+    def test_check_workers(self):
+        """
+        Sequential and concurrent checks have the same messages.
+        """
+        excel_path = "tests/domain/route_points/defect_010362.xlsx"
+        lrs = LRSRoute.from_feature_service("localhost:50052", "010362")
+        sp = make_photo_storage("010362", 2024)
+
+        messages = check_workers_messages(
+            lambda: RouteDefectsValidation(
+                route="010362",
+                events=RouteDefects.from_excel(excel_path, "010362", data_year=2024),
+                lrs=lrs,
+                sql_engine=engine,
+                results=ValidationResult("010362"),
+                survey_year=2024,
+                photo_storage=sp,
+            )
+        )
+
+        self.assertTrue(messages[1].equals(messages[CHECK_WORKERS]))
+
     def test_survey_photos(self):
         """
         Test survey photo object conversion.
@@ -243,6 +286,29 @@ class TestRouteFWDValidation(unittest.TestCase):
 
         self.assertTrue(True)
 
+    def test_check_workers(self):
+        """
+        Sequential and concurrent checks have the same messages.
+        """
+        route_id = "28134"
+        survey_year = 2025
+
+        repo = RouteFWDRepo(engine)
+        lrs = LRSRoute.from_feature_service("localhost:50052", route_id)
+
+        messages = check_workers_messages(
+            lambda: RouteFWDValidation(
+                route=route_id,
+                events=repo.get_by_linkid(route_id, year=survey_year),
+                lrs=lrs,
+                sql_engine=engine,
+                results=ValidationResult(route_id),
+                survey_year=survey_year,
+            )
+        )
+
+        self.assertTrue(messages[1].equals(messages[CHECK_WORKERS]))
+
     def test_surface_thickness_check(self):
         route_id = "28134"
         survey_year = 2025
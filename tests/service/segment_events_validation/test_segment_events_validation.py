@@ -5,6 +5,7 @@ from src.route_events import LRSRoute
 from src.service.validation_result.result import ValidationResult
 from sqlalchemy import create_engine
 import json
+import polars as pl
 import cProfile
 import pstats
 from dotenv import load_dotenv
@@ -19,6 +20,42 @@ PWD = os.getenv('SMD_PWD')
 
 engine = create_engine(f"oracle+oracledb://{USER}:{PWD}@{HOST}:1521/geodbbm")
 
+CHECK_WORKERS = 4
+
+
+def check_workers_messages(validate) -> dict:
+    """
+    Run base validation with sequential checks and with a thread pool of CHECK_WORKERS.
+    Return the messages of every run.
+    """
+    messages = dict()
+
+    for workers in [1, CHECK_WORKERS]:
+        check = validate()
+        check.check_workers = workers
+        check.base_validation()
+
+        messages[workers] = check.get_all_messages().sort(pl.all())
+
+    return messages
+
+
+def fused_checks_messages(validate) -> dict:
+    """
+    Run base validation with every lazy check collected separately and with a single collect_all.
+    Return the messages of every run.
+    """
+    messages = dict()
+
+    for fused in [False, True]:
+        check = validate()
+        check.fuse_lazy_checks = fused
+        check.base_validation()
+
+        messages[fused] = check.get_all_messages().sort(pl.all())
+
+    return messages
+
 
 class TestRouteSegmentEventsValidation(unittest.TestCase):
     def test_init(self):
@@ -187,6 +224,88 @@ class TestRouteRNIEventsValidation(unittest.TestCase):
 
         self.assertTrue(True)
 
+    def test_lrs_sta_location_check(self):
+        """
+        Test survey coordinates which drift from its STA location on LRS geometry.
+        """
+        routeid = '15010'
+        lrs = LRSRoute.from_geojson_file('tests/domain/lrs/lrs_15010.json')
+
+        check = RouteRNIValidation.validate_excel(
+            excel_path='tests/domain/route_segments/input_excels/balai_5_15010.xlsx',
+            route=routeid,
+            survey_year=2025,
+            sql_engine=engine,
+            lrs=lrs,
+            ignore_review=True
+        )
+
+        self.assertNotIn('lrs_sta_location_check', [_.name for _ in check.check_registry()])
+        check.sta_location_check = True
+        self.assertIn('lrs_sta_location_check', [_.name for _ in check.check_registry()])
+
+        check.lrs_sta_location_check(tolerance=30)
+        drift_count = check.get_all_messages().filter(pl.col('msg').str.contains('lokasi STA')).height
+
+        # Every segment with STA location on the LRS drifts more than the tolerance
+        check = RouteRNIValidation.validate_excel(
+            excel_path='tests/domain/route_segments/input_excels/balai_5_15010.xlsx',
+            route=routeid,
+            survey_year=2025,
+            sql_engine=engine,
+            lrs=lrs,
+            ignore_review=True
+        )
+        check.lrs_sta_location_check(tolerance=-1)
+        messages = check.get_all_messages().filter(pl.col('msg').str.contains('lokasi STA'))
+
+        points = check._events.points_lambert
+        drift = lrs.get_points_sta_drift(
+            points,
+            points._rows[check._events._to_sta_col].cast(pl.Float64).to_numpy()*check._events.sta_conversion
+        )
+
+        self.assertEqual(messages.height, drift['drift'].drop_nulls().len())
+        self.assertLessEqual(drift_count, messages.height)
+
+    def test_check_workers(self):
+        """
+        Sequential and concurrent checks have the same messages.
+        """
+        routeid = '15010'
+        lrs = LRSRoute.from_geojson_file('tests/domain/lrs/lrs_15010.json')
+
+        messages = check_workers_messages(
+            lambda: RouteRNIValidation.validate_excel(
+                excel_path='tests/domain/route_segments/input_excels/balai_5_15010.xlsx',
+                route=routeid,
+                survey_year=2025,
+                sql_engine=engine,
+                lrs=lrs
+            )
+        )
+
+        self.assertTrue(messages[1].equals(messages[CHECK_WORKERS]))
+
+    def test_fused_checks(self):
+        """
+        Eager and fused lazy checks have the same messages.
+        """
+        routeid = '15010'
+        lrs = LRSRoute.from_geojson_file('tests/domain/lrs/lrs_15010.json')
+
+        messages = fused_checks_messages(
+            lambda: RouteRNIValidation.validate_excel(
+                excel_path='tests/domain/route_segments/input_excels/balai_5_15010.xlsx',
+                route=routeid,
+                survey_year=2025,
+                sql_engine=engine,
+                lrs=lrs
+            )
+        )
+
+        self.assertTrue(messages[False].equals(messages[True]))
+
 
 from src.route_events import RouteRoughness, RouteRoughnessRepo
 from src.service import RouteRoughnessValidation
@@ -378,6 +497,26 @@ class TestRouteRoughnessEventsValidation(unittest.TestCase):
 
         self.assertTrue(True)
 
+    def test_check_workers(self):
+        """
+        Sequential and concurrent checks have the same messages.
+        """
+        routeid = '44039'
+        lrs = LRSRoute.from_feature_service('localhost:50052', routeid)
+
+        messages = check_workers_messages(
+            lambda: RouteRoughnessValidation.validate_excel(
+                "tests/domain/route_segments/input_excels/iri_10_21-08-2025_034607_1157 44039.xlsx",
+                route=routeid,
+                survey_year=2025,
+                survey_semester=1,
+                sql_engine=engine,
+                lrs=lrs
+            )
+        )
+
+        self.assertTrue(messages[1].equals(messages[CHECK_WORKERS]))
+
 
 from src.route_events import RoutePCI, RoutePCIRepo
 from src.service import RoutePCIValidation
@@ -467,4 +606,42 @@ class TestRoutePCIEventsValidation(unittest.TestCase):
 
         check.defects_point_check()
 
-        self.assertTrue(check.get_status() == 'error')
\ No newline at end of file
+        self.assertTrue(check.get_status() == 'error')
+
+    def test_check_workers(self):
+        """
+        Sequential and concurrent checks have the same messages.
+        """
+        routeid = '24038'
+        lrs = LRSRoute.from_feature_service("localhost:50052", routeid)
+
+        messages = check_workers_messages(
+            lambda: RoutePCIValidation.validate_excel(
+                "tests/domain/route_segments/input_excels/pci_new_format_24038_2404611_converted.xlsx",
+                route=routeid,
+                survey_year=2025,
+                sql_engine=engine,
+                lrs=lrs
+            )
+        )
+
+        self.assertTrue(messages[1].equals(messages[CHECK_WORKERS]))
+
+    def test_fused_checks(self):
+        """
+        Eager and fused lazy checks have the same messages.
+        """
+        routeid = '24038'
+        lrs = LRSRoute.from_feature_service("localhost:50052", routeid)
+
+        messages = fused_checks_messages(
+            lambda: RoutePCIValidation.validate_excel(
+                "tests/domain/route_segments/input_excels/pci_new_format_24038_2404611_converted.xlsx",
+                route=routeid,
+                survey_year=2025,
+                sql_engine=engine,
+                lrs=lrs
+            )
+        )
+
+        self.assertTrue(messages[False].equals(messages[True]))
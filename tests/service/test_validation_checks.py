@@ -0,0 +1,231 @@
+from src.service.validation_result.result import ValidationResult
+from src.service.validation_result.checks import ScheduledValidation, Check, GEOMETRY, lazy_check
+import polars as pl
+import unittest
+import threading
+import time
+
+
+class SlowValidation(ScheduledValidation):
+    """
+    Validator with slow inputs (e.g. database query) and checks.
+    """
+    check_input_requires = {'photos': ('lrs',)}
+
+    def __init__(self, results: ValidationResult, delay: float = 0.1):
+        self._result = results
+        self._delay = delay
+        self.loaded = []
+        self.geometry_users = 0
+        self.max_geometry_users = 0
+        self._lock = threading.Lock()
+
+    def _load(self, name: str):
+        if not hasattr(self, f"_{name}"):
+            time.sleep(self._delay)
+
+            with self._lock:
+                self.loaded.append(name)
+
+            setattr(self, f"_{name}", name)
+
+        return getattr(self, f"_{name}")
+
+    @property
+    def lrs(self):
+        return self._load('lrs')
+
+    @property
+    def prev_data(self):
+        return self._load('prev_data')
+
+    @property
+    def photos(self):
+        # Photos are created from the LRS M-Value.
+        if 'lrs' not in self.loaded:
+            raise AssertionError("lrs is not loaded")
+
+        return self._load('photos')
+
+    def slow_check(self, msg: str, status: str = 'error'):
+        time.sleep(self._delay)
+        self._result.add_message(msg, status)
+
+    def geometry_check(self, msg: str):
+        with self._lock:
+            self.geometry_users += 1
+            self.max_geometry_users = max(self.geometry_users, self.max_geometry_users)
+
+        time.sleep(self._delay)
+        self._result.add_message(msg, 'review')
+
+        with self._lock:
+            self.geometry_users -= 1
+
+    def get_all_messages(self):
+        return self._result.get_all_messages(drop_duplicate=False)
+
+    def failed_check(self):
+        raise ValueError("Failed check")
+
+    def check_registry(self):
+        return [
+            Check('slow_check', kwargs={'msg': 'first'}),
+            Check('slow_check', inputs=('lrs',), kwargs={'msg': 'lrs'}, name='lrs_check'),
+            Check('slow_check', inputs=('prev_data',), kwargs={'msg': 'prev_data'}, name='prev_data_check'),
+            Check('slow_check', inputs=('lrs', 'photos'), kwargs={'msg': 'photos'}, name='photos_check'),
+            Check('geometry_check', inputs=('prev_data', GEOMETRY), kwargs={'msg': 'geometry 1'}, name='geometry_1'),
+            Check('geometry_check', inputs=(GEOMETRY,), kwargs={'msg': 'geometry 2'}, name='geometry_2'),
+            Check('slow_check', kwargs={'msg': 'last', 'status': 'review'}, name='last_check')
+        ]
+
+
+class LazyValidation(SlowValidation):
+    """
+    Validator with lazy checks between the eager checks.
+    """
+    @lazy_check('error', 'force')
+    def lazy_msg_check(self, msg: str, count: int = 1) -> pl.LazyFrame:
+        return pl.LazyFrame({'msg': [msg]*count})
+
+    @lazy_check('review')
+    def lazy_prev_data_check(self) -> pl.LazyFrame:
+        return pl.LazyFrame({'msg': [self.prev_data]})
+
+    def check_registry(self):
+        return [
+            Check('slow_check', kwargs={'msg': 'first'}),
+            Check('lazy_msg_check', kwargs={'msg': 'lazy', 'count': 2}),
+            Check('geometry_check', inputs=(GEOMETRY,), kwargs={'msg': 'geometry'}),
+            Check('lazy_prev_data_check', inputs=('prev_data',)),
+            Check('lazy_msg_check', kwargs={'msg': 'empty', 'count': 0}, name='empty_check'),
+            Check('slow_check', kwargs={'msg': 'last', 'status': 'review'}, name='last_check')
+        ]
+
+
+class FailFastValidation(LazyValidation):
+    """
+    Validator with cheap review checks and a blocking error from a check with input.
+    """
+    def many_check(self, count: int):
+        for i in range(count):
+            self._result.add_message(f'many {i}', 'review')
+
+    def check_registry(self):
+        return [
+            Check('slow_check', inputs=('prev_data',), kwargs={'msg': 'blocking'}, name='blocking_check'),
+            Check('slow_check', kwargs={'msg': 'ignorable', 'status': 'review'}, name='review_check'),
+            Check('lazy_msg_check', kwargs={'msg': 'lazy', 'count': 5}),
+            Check('many_check', kwargs={'count': 5}),
+            Check('slow_check', inputs=('lrs', 'photos'), kwargs={'msg': 'photos'}, name='photos_check'),
+            Check('geometry_check', inputs=(GEOMETRY,), kwargs={'msg': 'geometry'}, cost=3)
+        ]
+
+
+class TestScheduledValidation(unittest.TestCase):
+    def test_deterministic_merge(self):
+        """
+        Messages are merged in the registry order, for sequential and concurrent run.
+        """
+        expected = ['first', 'lrs', 'prev_data', 'photos', 'geometry 1', 'geometry 2', 'last']
+
+        for workers in [1, 2, 4, 8]:
+            check = SlowValidation(ValidationResult('01001'), delay=0.01)
+            times = check.run_checks(check.check_registry(), max_workers=workers)
+
+            self.assertEqual(check.get_all_messages()['msg'].to_list(), expected)
+            self.assertEqual(check._result.status, 'error')
+            self.assertEqual(sorted(check.loaded), ['lrs', 'photos', 'prev_data'])  # Loaded once
+            self.assertEqual(check.max_geometry_users, 1)
+
+            self.assertEqual(
+                times.filter(kind='check')['name'].to_list(),
+                [_.name for _ in check.check_registry()]
+            )
+            self.assertEqual(times.filter(kind='check')['msg_count'].sum(), len(expected))
+            self.assertTrue(times.equals(check.check_times))
+
+    def test_check_error(self):
+        """
+        Error is raised, messages of the previous checks are merged.
+        """
+        for workers in [1, 4]:
+            check = SlowValidation(ValidationResult('01001'), delay=0.01)
+            checks = check.check_registry()
+            checks.insert(2, Check('failed_check'))
+
+            with self.assertRaises(ValueError):
+                check.run_checks(checks, max_workers=workers)
+
+            self.assertEqual(check.get_all_messages()['msg'].to_list(), ['first', 'lrs'])
+            self.assertEqual(check.check_times.filter(kind='run').height, 1)
+
+    def test_fused_lazy_checks(self):
+        """
+        Fused and eager lazy checks have the same messages, in the registry order.
+        """
+        expected = ['first', 'lazy', 'lazy', 'geometry', 'prev_data', 'last']
+
+        for fused in [False, True]:
+            for workers in [1, 4]:
+                check = LazyValidation(ValidationResult('01001'), delay=0.01)
+                times = check.run_checks(check.check_registry(), max_workers=workers, fused=fused)
+                messages = check.get_all_messages()
+
+                self.assertEqual(messages['msg'].to_list(), expected)
+                self.assertEqual(messages['status'].to_list(), ['error', 'error', 'error', 'review', 'review', 'review'])
+                self.assertEqual(messages['ignore_in'].to_list(), [None, 'force', 'force', None, None, None])
+                self.assertEqual(times.filter(kind='fused').height, int(fused))
+                self.assertEqual(
+                    times.filter(kind='check')['name'].to_list(),
+                    [_.name for _ in check.check_registry()]
+                )
+
+    def test_fail_fast(self):
+        """
+        Cheap checks are run first, the rest of the checks after the blocking error are skipped.
+        """
+        check = FailFastValidation(ValidationResult('01001'), delay=0.01)
+        check.fail_fast = True
+        times = check.run_checks(check.check_registry())
+
+        # Messages are merged in the registry order
+        self.assertEqual(
+            check.get_all_messages()['msg'].to_list(),
+            ['blocking', 'ignorable'] + ['lazy']*5 + [f'many {i}' for i in range(5)]
+        )
+        self.assertEqual(check.skipped_checks, ['photos_check', 'geometry_check'])
+        self.assertEqual(check.loaded, ['prev_data'])  # lrs and photos are not loaded
+        self.assertEqual(times.filter(kind='check').height, 4)
+
+        # Ignorable error does not stop the run, photos_check is the blocking check
+        check = FailFastValidation(ValidationResult('01001'), delay=0.01)
+        checks = check.check_registry()
+        checks[0] = Check('lazy_msg_check', inputs=('prev_data',), kwargs={'msg': 'force'}, name='force_check')
+        check.run_checks(checks, fail_fast=True)
+
+        self.assertEqual(check.skipped_checks, ['geometry_check'])
+        self.assertEqual(sorted(check.loaded), ['lrs', 'photos', 'prev_data'])
+        self.assertEqual(check._result.all_ignorables, [])
+
+        # The mode of the last run is recorded, regardless of fail_fast attribute
+        self.assertFalse(check.fail_fast)
+        self.assertTrue(check.fail_fast_run)
+
+        check.run_checks(checks[:1])
+        self.assertFalse(check.fail_fast_run)
+
+    def test_message_cap(self):
+        """
+        Messages of every check are capped, for eager, lazy and fused lazy checks.
+        """
+        for fused in [False, True]:
+            check = FailFastValidation(ValidationResult('01001'), delay=0.01)
+            check.check_message_cap = 2
+            times = check.run_checks(check.check_registry()[1:4], fused=fused)
+
+            self.assertEqual(
+                check.get_all_messages()['msg'].to_list(),
+                ['ignorable', 'lazy', 'lazy', 'many 0', 'many 1']
+            )
+            self.assertEqual(times.filter(kind='capped')['name'].to_list(), ['lazy_msg_check', 'many_check'])
@@ -3,6 +3,54 @@ import unittest
 import polars as pl
 import cProfile
 import pstats
+import random
+
+
+def reference_status(result: ValidationResult) -> str:
+    """
+    Validation status computed from the message DataFrame.
+    """
+    filtered = result.get_filtered_msg()
+
+    if filtered.is_empty():
+        return 'verified'
+    else:
+        return result._state[filtered['status_idx'].min()]
+
+
+def reference_ignorables(result: ValidationResult) -> list:
+    """
+    All ignorables tag computed from the message DataFrame.
+    """
+    df = result.get_all_messages(drop_duplicate=False)
+
+    if reference_status(result) == 'rejected':
+        return []
+    elif df['ignore_in'].is_null().any():
+        return []
+    else:
+        return sorted(df['ignore_in'].drop_nulls().unique().to_list())
+
+
+def random_result(rng: random.Random, id: str, depth: int = 0) -> ValidationResult:
+    """
+    ValidationResult with random messages, added one at a time, as DataFrame and from other result.
+    """
+    result = ValidationResult(id, ignore_in=rng.choice([None, [], ['force'], ['review'], ['force', 'review']]))
+
+    for _ in range(rng.randint(0, 8)):
+        status = rng.choice(['rejected', 'error', 'review'])
+        ignore_in = rng.choice([None, 'force', 'review'])
+        action = rng.random()
+
+        if action < 0.6:
+            result.add_message(f'msg {rng.randint(0, 3)}', status, ignore_in)
+        elif (action < 0.85) or depth > 1:
+            result.add_messages(pl.DataFrame({'msg': [f'df msg {i}' for i in range(rng.randint(0, 3))]}, schema={'msg': pl.String}), status, ignore_in)
+        else:
+            result.extend(random_result(rng, f'{id}_{depth}', depth + 1))
+
+    return result
 
 
 class TestValidationResult(unittest.TestCase):
@@ -74,6 +122,53 @@ class TestValidationResult(unittest.TestCase):
 
         self.assertTrue(result.message_count == 5)
 
+    def test_message_order(self):
+        """
+        Test messages added one at a time, as DataFrame and from other result are kept in order.
+        """
+        result = ValidationResult('1234')
+        other = ValidationResult('5678')
+        other.add_message('other msg', 'review', 'review')
+
+        result.add_message('msg 1', 'error', 'force')
+        result.add_messages(pl.DataFrame({'error': ['df msg 1', 'df msg 2']}), 'review')
+        result.add_message('msg 2', 'rejected')
+        result.get_all_messages()
+        result.extend(other)
+        result.add_message('msg 3', 'review', 'review')
+
+        df = result.get_all_messages(drop_duplicate=False)
+
+        self.assertListEqual(
+            df.rows(),
+            [
+                ('msg 1', 'error', 1, 'force', '1234'),
+                ('df msg 1', 'review', 2, None, '1234'),
+                ('df msg 2', 'review', 2, None, '1234'),
+                ('msg 2', 'rejected', 0, None, '1234'),
+                ('other msg', 'review', 2, 'review', '5678'),
+                ('msg 3', 'review', 2, 'review', '1234')
+            ]
+        )
+        self.assertEqual(result.message_count, 6)
+        self.assertListEqual(result.all_message_status, ['rejected', 'error', 'review'])
+        self.assertEqual(result.status, 'rejected')
+
+    def test_running_aggregates(self):
+        """
+        Status, ignorables and counts are equal to the result computed from the message DataFrame.
+        """
+        rng = random.Random(0)
+
+        for _ in range(500):
+            result = random_result(rng, '1234')
+            df = result.get_all_messages(drop_duplicate=False)
+
+            self.assertEqual(result.status, reference_status(result))
+            self.assertListEqual(sorted(result.all_ignorables), reference_ignorables(result))
+            self.assertEqual(result.message_count, df.height)
+            self.assertListEqual(sorted(result.all_message_status), sorted(df['status'].unique().to_list()))
+
     def test_all_ignorables(self):
         """
         Test get all ignorables tag.
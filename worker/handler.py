@@ -1,6 +1,11 @@
 from pydantic import BaseModel, Field, ConfigDict
-from route_events import LRSRoute
+from route_events import LRSRoute, LRSRouteCache, LRSSnapshotStore, SurveyWorkbook
+from route_events.bridge.inventory import BridgeInventory
+import route_events
+from route_events.schema import RouteEventsSchema, schema_registry
+from route_events.utils import ddb_session, ParseCache, set_parse_cache
 from route_events_service import (
+    RouteSegmentEventsValidation,
     RouteRNIValidation,
     RouteRoughnessValidation,
     RoutePCIValidation,
@@ -11,10 +16,13 @@ from route_events_service import (
     RouteFWDValidation,
 )
 from route_events_service.photo.client import SurveyPhotoStorage
+from route_events_service.validation_result.result import ValidationResult
+from route_events_service.validation_result.checks import ScheduledValidation
 from bm_photo_client import BMPhotoClient
 from typing import List, Optional, Literal
 from dotenv import load_dotenv
 import os
+from functools import partial
 from sqlalchemy import create_engine
 from abc import ABC, abstractmethod
 
@@ -58,6 +66,23 @@ MISC_USER = os.getenv("MISC_USER")
 MISC_PWD = os.getenv("MISC_PWD")
 
 LRS_HOST = os.getenv("LRS_HOST")
+LRS_CACHE_TTL = int(os.getenv("LRS_CACHE_TTL", 600))  # In seconds
+LRS_CACHE_MAX_VERTICES = int(os.getenv("LRS_CACHE_MAX_VERTICES", 2_000_000))
+LRS_GEOMETRY_VERSION = os.getenv("LRS_GEOMETRY_VERSION")
+LRS_SNAPSHOT_DIR = os.getenv("LRS_SNAPSHOT_DIR")  # Optional, LRS snapshot store directory shared by workers
+LRS_SNAPSHOT_MAX_AGE = int(os.getenv("LRS_SNAPSHOT_MAX_AGE", 86400))  # In seconds
+
+# Optional, compare segment survey coordinates with its STA location on LRS geometry.
+STA_LOCATION_CHECK = int(os.getenv("STA_LOCATION_CHECK", 0))
+
+# Validation check thread pool size, 1 runs all checks sequentially.
+CHECK_WORKERS = int(os.getenv("CHECK_WORKERS", 1))
+# Stop the validation checks after the first blocking error.
+CHECK_FAIL_FAST = int(os.getenv("CHECK_FAIL_FAST", 0))
+CHECK_MESSAGE_CAP = os.getenv("CHECK_MESSAGE_CAP")  # Optional, maximum messages of a single check
+
+PARSE_CACHE_DIR = os.getenv("PARSE_CACHE_DIR")  # Optional, parsed Excel file cache directory
+PARSE_CACHE_MAX_BYTES = int(os.getenv("PARSE_CACHE_MAX_BYTES", 2_000_000_000))
 
 BM_PHOTO_BASE_URL = os.getenv("BM_PHOTO_BASE_URL")
 BM_PHOTO_API_KEY = os.getenv("BM_PHOTO_API_KEY")
@@ -71,6 +96,43 @@ MISC_ENGINE = create_engine(
 
 WRITE_VERIFIED_DATA = int(os.getenv("WRITE_VERIFIED_DATA"))
 
+# Process-wide LRS cache, shared by all handlers.
+# Cache miss is loaded from the LRS snapshot store if configured, otherwise from the GRPC service.
+if LRS_SNAPSHOT_DIR:
+    LRS_CACHE = LRSRouteCache(
+        max_vertices=LRS_CACHE_MAX_VERTICES,
+        ttl=LRS_CACHE_TTL,
+        loader=partial(
+            LRSSnapshotStore(LRS_SNAPSHOT_DIR, max_age=LRS_SNAPSHOT_MAX_AGE).get,
+            geometry_version=LRS_GEOMETRY_VERSION
+        ),
+    )
+else:
+    LRS_CACHE = LRSRouteCache(max_vertices=LRS_CACHE_MAX_VERTICES, ttl=LRS_CACHE_TTL)
+
+# Load DuckDB extensions once, before the first job.
+DDB_SESSION = ddb_session().warm_up()
+
+# Compile the validation schema once, before the first job.
+SCHEMA_REGISTRY = schema_registry().warm_up(
+    [
+        partial(RouteEventsSchema, os.path.join(os.path.dirname(route_events.__file__), events, "schema.json"))
+        for events in ["segments/rni", "segments/roughness", "segments/pci", "points/rtc", "points/defect", "points/fwd"]
+    ]
+)
+BridgeInventory.warm_up()
+
+# Resubmitted Excel file is loaded from the parse cache instead of parsed again.
+if PARSE_CACHE_DIR:
+    set_parse_cache(ParseCache(PARSE_CACHE_DIR, max_bytes=PARSE_CACHE_MAX_BYTES))
+
+RouteSegmentEventsValidation.sta_location_check = bool(STA_LOCATION_CHECK)
+ScheduledValidation.check_workers = CHECK_WORKERS
+ScheduledValidation.fail_fast = bool(CHECK_FAIL_FAST)
+
+if CHECK_MESSAGE_CAP:
+    ScheduledValidation.check_message_cap = int(CHECK_MESSAGE_CAP)
+
 tracer = trace.get_tracer(__name__)
 
 
@@ -92,186 +154,270 @@ class ValidationHandler(ABC):
         self.job_id = job_id
         self._validate = validate
 
-    def get_lrs(self) -> LRSRoute | None:
+    def get_lrs(self, route: str = None) -> LRSRoute | None:
+        """
+        Get LRSRoute object from the LRS cache or GRPC service. Default to the first payload route.
+        """
+        with tracer.start_as_current_span("get-lrs") as span:
+            lrs = LRS_CACHE.get(
+                LRS_HOST,
+                route or self.payload.routes[0],
+                geometry_version=LRS_GEOMETRY_VERSION,
+            )
+
+            for key, value in LRS_CACHE.stats().items():
+                span.set_attribute(f"lrs_cache.{key}", value)
+
+            span.set_attribute(
+                "ddb_session.saved_load_time", DDB_SESSION.stats()["saved_load_time"]
+            )
+
+            return lrs
+
+    def set_check_times(self, span, check):
         """
-        Get LRSRoute object from GRPC service.
+        Set the validation inputs and checks wall time (in seconds) as span attributes, and the skipped checks
+        of the fail-fast run.
         """
-        return LRSRoute.from_feature_service(LRS_HOST, self.payload.routes[0])
+        for name, kind, wall_time, _ in check.check_times.iter_rows():
+            if wall_time is not None:
+                span.set_attribute(f"validation.{kind}.{name}.wall_time", wall_time)
+
+        if check.skipped_checks:
+            span.set_attribute("validation.skipped_checks", check.skipped_checks)
 
     @abstractmethod
     def validate(self) -> str:
         pass
 
 
-class RNIValidation(ValidationHandler):
+class SMDValidationHandler(ValidationHandler):
+    """
+    SMD survey data validation handler. The payload workbook is read and validated once, and every route in
+    the payload is validated from its own partition of the workbook. All route results are returned in a
+    single job event. Data is written only after all routes are validated and the job status is verified.
+    """
+
+    def validate(self) -> str:
+        """
+        Start validation of all routes in the payload.
+        """
+        if not self.payload.routes:
+            result = ValidationResult("")
+            result.add_message("Payload tidak memiliki ruas (routes) yang akan divalidasi.", "rejected")
+
+            return result.to_job_event(self.job_id)
+
+        workbook = SurveyWorkbook(self.payload.file_name)
+        checks = []
+
+        for route in self.payload.routes:
+            checks.append(self.validate_route(route, workbook))
+
+            # Workbook parsing error is the same for every route, it is only reported once.
+            if workbook.parse_error is not None:
+                break
+
+        result = checks[0]._result
+
+        for check in checks[1:]:
+            result.extend(check._result)
+
+        if (result.status == "verified") and (WRITE_VERIFIED_DATA):
+            for check in checks:
+                with tracer.start_as_current_span("write-data") as span:
+                    span.set_attribute("route", check._route)
+                    self.write_route(check)
+
+        return result.to_job_event(self.job_id)
+
+    @abstractmethod
+    def validate_route(self, route: str, workbook: SurveyWorkbook):
+        pass
+
+    @abstractmethod
+    def write_route(self, check):
+        """
+        Write the verified route data, called after all routes in the payload are verified.
+        """
+        pass
+
+
+class RNIValidation(SMDValidationHandler):
     def __init__(self, payload: PayloadSMD, job_id: str, validate: bool = True):
         ValidationHandler.__init__(self, payload, job_id, validate)
 
-    def validate(self) -> str:
+    def validate_route(self, route: str, workbook: SurveyWorkbook):
         """
-        Start validation
+        Start validation of a single route.
         """
         with tracer.start_as_current_span("rni-validation-process") as span:
             check = RouteRNIValidation.validate_excel(
                 excel_path=self.payload.file_name,
-                route=self.payload.routes[0],
+                route=route,
                 survey_year=self.payload.year,
                 sql_engine=SMD_ENGINE,
-                lrs=self.get_lrs(),
+                lrs=self.get_lrs(route),
                 ignore_review=self.ignore_review,
                 force_write=self.force_write,
+                workbook=workbook,
             )
 
             if check.get_status() == "rejected":
                 span.set_attribute("partial_update", False)
                 span.set_attribute("file_name", self.payload.file_name)
-                span.set_attribute("route", self.payload.routes[0])
+                span.set_attribute("route", route)
                 span.set_attribute("validation.result.status", check.get_status())
-                return check._result.to_job_event(self.job_id)
+                return check
 
             span.set_attribute("partial_update", check._events.is_partial)
 
             if self._validate:
                 check.base_validation()
-
-            if (check.get_status() == "verified") and (WRITE_VERIFIED_DATA):
-                if (
-                    check._events.is_partial
-                ):
-                    check.merge_previous_data()
-
-                check.put_data(semester=self.payload.semester)
+                self.set_check_times(span, check)
 
             # Set span attribute and status
             span.set_attribute("file_name", self.payload.file_name)
-            span.set_attribute("route", self.payload.routes[0])
+            span.set_attribute("route", route)
             span.set_attribute("validation.result.status", check.get_status())
 
             span.set_status(StatusCode.OK)
 
-            return check._result.to_job_event(self.job_id)
+            return check
+
+    def write_route(self, check: RouteRNIValidation):
+        if check._events.is_partial:
+            check.merge_previous_data()
 
+        check.put_data(semester=self.payload.semester)
 
-class IRIValidation(ValidationHandler):
+
+class IRIValidation(SMDValidationHandler):
     def __init__(self, payload: PayloadSMD, job_id: str, validate: bool = True):
         ValidationHandler.__init__(self, payload, job_id, validate)
 
-    def validate(self) -> str:
+    def validate_route(self, route: str, workbook: SurveyWorkbook):
         """
-        Start validation
+        Start validation of a single route.
         """
         with tracer.start_as_current_span("iri-validation-process") as span:
             check = RouteRoughnessValidation.validate_excel(
                 excel_path=self.payload.file_name,
-                route=self.payload.routes[0],
+                route=route,
                 survey_year=self.payload.year,
                 survey_semester=self.payload.semester,
                 sql_engine=SMD_ENGINE,
-                lrs=self.get_lrs(),
+                lrs=self.get_lrs(route),
                 ignore_review=self.ignore_review,
                 force_write=self.force_write,
+                workbook=workbook,
             )
 
             if check.get_status() == "rejected":
-                return check._result.to_job_event(self.job_id)
+                return check
 
             if self._validate:
                 check.base_validation()
-
-            if (check.get_status() == "verified") and (WRITE_VERIFIED_DATA):
-                check.put_data()
+                self.set_check_times(span, check)
 
             # Set span attribute and status
             span.set_attribute("file_name", self.payload.file_name)
-            span.set_attribute("route", self.payload.routes[0])
+            span.set_attribute("route", route)
             span.set_attribute("validation.result.status", check.get_status())
 
             span.set_status(StatusCode.OK)
 
-            return check._result.to_job_event(self.job_id)
+            return check
+
+    def write_route(self, check: RouteRoughnessValidation):
+        check.put_data()
 
 
-class PCIValidation(ValidationHandler):
+class PCIValidation(SMDValidationHandler):
     def __init__(self, payload: PayloadSMD, job_id: str, validate: bool = True):
         ValidationHandler.__init__(self, payload, job_id, validate)
 
-    def validate(self) -> str:
+    def validate_route(self, route: str, workbook: SurveyWorkbook):
         """
-        Start validation
+        Start validation of a single route.
         """
         with tracer.start_as_current_span("pci-validation-process") as span:
             check = RoutePCIValidation.validate_excel(
                 excel_path=self.payload.file_name,
-                route=self.payload.routes[0],
+                route=route,
                 survey_year=self.payload.year,
                 sql_engine=SMD_ENGINE,
-                lrs=self.get_lrs(),
+                lrs=self.get_lrs(route),
                 ignore_review=self.ignore_review,
                 force_write=self.force_write,
+                workbook=workbook,
             )
 
             if check.get_status() == "rejected":
-                return check._result.to_job_event(self.job_id)
+                return check
 
             if self._validate:
                 check.base_validation()
-
-            if (check.get_status() == "verified") and (WRITE_VERIFIED_DATA):
-                check.put_data(semester=self.payload.semester)
+                self.set_check_times(span, check)
 
             # Set span attribute and status
             span.set_attribute("file_name", self.payload.file_name)
-            span.set_attribute("route", self.payload.routes[0])
+            span.set_attribute("route", route)
             span.set_attribute("validation.result.status", check.get_status())
 
             span.set_status(StatusCode.OK)
 
-            return check._result.to_job_event(self.job_id)
+            return check
+
+    def write_route(self, check: RoutePCIValidation):
+        check.put_data(semester=self.payload.semester)
 
 
-class RTCValidation(ValidationHandler):
+class RTCValidation(SMDValidationHandler):
     def __init__(self, payload: PayloadSMD, job_id: str, validate: bool = True):
         ValidationHandler.__init__(self, payload, job_id, validate)
 
-    def validate(self) -> str:
+    def validate_route(self, route: str, workbook: SurveyWorkbook):
         """
-        Start validation.
+        Start validation of a single route.
         """
         with tracer.start_as_current_span("rtc-validation-process") as span:
             check = RouteRTCValidation.validate_excel(
                 excel_path=self.payload.file_name,
-                route=self.payload.routes[0],
+                route=route,
                 survey_year=self.payload.year,
                 sql_engine=SMD_ENGINE,
-                lrs=self.get_lrs(),
+                lrs=self.get_lrs(route),
                 ignore_review=self.ignore_review,
                 force_write=self.force_write,
+                workbook=workbook,
             )
 
             if check.get_status() == "rejected":
-                return check._result.to_job_event(self.job_id)
+                return check
 
             if self._validate:
                 check.base_validation()
-
-            if (check.get_status() == "verified") and (WRITE_VERIFIED_DATA):
-                check.put_data()
+                self.set_check_times(span, check)
 
             ## Set span attributes and status
             span.set_attribute("file_name", self.payload.file_name)
-            span.set_attribute("route", self.payload.routes[0])
+            span.set_attribute("route", route)
             span.set_attribute("validation.result.status", check.get_status())
 
-            return check._result.to_job_event(self.job_id)
+            return check
+
+    def write_route(self, check: RouteRTCValidation):
+        check.put_data()
 
 
-class DefectValidation(ValidationHandler):
+class DefectValidation(SMDValidationHandler):
     def __init__(self, payload: PayloadSMD, job_id: str, validate: bool = True):
         ValidationHandler.__init__(self, payload, job_id, validate)
 
-    def validate(self) -> str:
+    def validate_route(self, route: str, workbook: SurveyWorkbook):
         """
-        Start validation
+        Start validation of a single route.
         """
         with tracer.start_as_current_span("defect-validation-process") as span:
             photo_client = BMPhotoClient(
@@ -280,77 +426,81 @@ class DefectValidation(ValidationHandler):
 
             sp = SurveyPhotoStorage(
                 photo_client=photo_client,
-                route_id=self.payload.routes[0],
+                route_id=route,
                 survey_year=self.payload.year,
             )
             check = RouteDefectsValidation.validate_excel(
                 excel_path=self.payload.file_name,
-                route=self.payload.routes[0],
+                route=route,
                 survey_year=self.payload.year,
                 sql_engine=SMD_ENGINE,
-                lrs=self.get_lrs(),
+                lrs=self.get_lrs(route),
                 ignore_review=self.ignore_review,
                 force_write=self.force_write,
+                workbook=workbook,
                 photo_storage=sp,
             )
 
             if check.get_status() == "rejected":
-                return check._result.to_job_event(self.job_id)
+                return check
 
             if self._validate:
                 check.base_validation()
-
-            if (check.get_status() == "verified") and (WRITE_VERIFIED_DATA):
-                check.put_data()
-                check.update_photos()
+                self.set_check_times(span, check)
 
             # Set span attribute and status
             span.set_attribute("file_name", self.payload.file_name)
-            span.set_attribute("route", self.payload.routes[0])
+            span.set_attribute("route", route)
             span.set_attribute("validation.result.status", check.get_status())
 
             span.set_status(StatusCode.OK)
 
-            return check._result.to_job_event(self.job_id)
+            return check
+
+    def write_route(self, check: RouteDefectsValidation):
+        check.put_data()
+        check.update_photos()
 
 
-class FWDValidation(ValidationHandler):
+class FWDValidation(SMDValidationHandler):
     def __init__(self, payload: PayloadSMD, job_id: str, validate: bool = True):
         ValidationHandler.__init__(self, payload, job_id, validate)
 
-    def validate(self) -> str:
+    def validate_route(self, route: str, workbook: SurveyWorkbook):
         """
-        Start validation
+        Start validation of a single route.
         """
         with tracer.start_as_current_span("fwd-validation-process") as span:
             check = RouteFWDValidation.validate_excel(
                 excel_path=self.payload.file_name,
-                route=self.payload.routes[0],
+                route=route,
                 survey_year=self.payload.year,
                 survey_semester=self.payload.semester,
                 sql_engine=SMD_ENGINE,
-                lrs=self.get_lrs(),
+                lrs=self.get_lrs(route),
                 ignore_review=self.ignore_review,
                 force_write=self.force_write,
+                workbook=workbook,
             )
 
             if check.get_status() == "rejected":
-                return check._result.to_job_event(self.job_id)
+                return check
 
             if self._validate:
                 check.base_validation()
-
-            if (check.get_status() == "verified") and (WRITE_VERIFIED_DATA):
-                check.put_data()
+                self.set_check_times(span, check)
 
             # Set span attribute and status
             span.set_attribute("file_name", self.payload.file_name)
-            span.set_attribute("route", self.payload.routes[0])
+            span.set_attribute("route", route)
             span.set_attribute("validation.result.status", check.get_status())
 
             span.set_status(StatusCode.OK)
 
-            return check._result.to_job_event(self.job_id)
+            return check
+
+    def write_route(self, check: RouteFWDValidation):
+        check.put_data()
 
 
 class BridgeMasterValidation_(ValidationHandler):